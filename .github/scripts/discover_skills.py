@@ -1,116 +1,537 @@
 #!/usr/bin/env python3
 """
 Discover new Claude skills from GitHub using public API.
+
+The search queries are crawled concurrently with asyncio over a small pool of
+keep-alive connections, following each query's result pages (Link headers)
+up to a page limit. Requests are scheduled from GitHub's X-RateLimit-*
+headers: the remaining budget is spread evenly until the reset time, and when
+it is spent (or GitHub sends Retry-After) requests wait for the reset instead
+of failing. Pages are fetched conditionally (ETag / If-None-Match), and a 304
+reuses the page cached from an earlier run without counting against the
+rate limit.
+
+Progress is checkpointed to .github/skill-discovery/crawl-state.json after
+every page, so an interrupted or rate-limited run resumes where it stopped.
+The same file keeps the ETag cache between runs.
+
+Configuration comes from the environment (GITHUB_TOKEN, DISCOVERY_LIMIT,
+DISCOVERY_MAX_PAGES, DISCOVERY_CONCURRENCY, GITHUB_API_URL) or the
+command-line options. ``--record FILE`` saves the responses in the format
+github_stub_server.py replays, for offline tests.
 """
-import os
+import argparse
+import asyncio
+import http.client
 import json
-import requests
+import os
+import random
+import re
+import sys
 import time
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+from urllib.parse import urlencode, urlsplit
+
+DISCOVERY_FILE = Path('.github/skill-discovery/discovered-skills.json')
+STATE_FILE = Path('.github/skill-discovery/crawl-state.json')
+DEFAULT_API_URL = 'https://api.github.com'
+USER_AGENT = 'awesome-claude-skills-discovery'
+
+SEARCH_QUERIES = [
+    'claude skill markdown in:readme',
+    'claude prompt template in:file extension:md',
+    'claude instructions SKILL.md in:path',
+    'AI agent skill claude in:readme',
+    'LLM workflow template in:readme language:markdown'
+]
+
+# Our own repo, and upstream (already synced separately)
+EXCLUDED_REPOS = (
+    'Grumpified-OGGVCT/awesome-claude-skills',
+    'ComposioHQ/awesome-claude-skills',
+)
+
+# Bump when the checkpoint layout changes; older checkpoints are discarded
+STATE_VERSION = 1
+
+MAX_RETRIES = 4
+# Seconds added to X-RateLimit-Reset, since GitHub's clock and ours differ slightly
+RESET_SLACK = 1.0
+
+LINK_PATTERN = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+
+class CrawlError(Exception):
+    pass
+
+
+class Response(NamedTuple):
+    status: int
+    headers: Dict[str, str]    # lower-case names
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body.decode('utf-8')) if self.body else {}
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one API host, shared by all crawl tasks
+
+    http.client is blocking, so each request runs in a worker thread while
+    the event loop schedules the others; at most ``size`` are in flight.
+    """
+
+    def __init__(self, base_url: str, size: int = 4, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Invalid API URL: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.idle: List[http.client.HTTPConnection] = []
+        self.slots = asyncio.Semaphore(max(1, size))
+
+    def target(self, url: str) -> str:
+        """Request target for an API path or an absolute URL on this host"""
+        if url.startswith('/'):
+            return self.prefix + url
+        parts = urlsplit(url)
+        if parts.hostname != self.host or parts.port != self.port:
+            raise CrawlError(f"Refusing to follow a link to another host: {url}")
+        return parts.path + (f"?{parts.query}" if parts.query else '')
+
+    def connect(self) -> http.client.HTTPConnection:
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def send(self, connection, method: str, target: str, headers: Dict[str, str]):
+        connection.request(method, target, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        return (Response(response.status, {k.lower(): v for k, v in response.getheaders()}, body),
+                response.will_close)
+
+    async def request(self, method: str, url: str, headers: Dict[str, str]) -> Response:
+        target = self.target(url)
+        async with self.slots:
+            connection = self.idle.pop() if self.idle else self.connect()
+            try:
+                response, will_close = await asyncio.to_thread(self.send, connection, method, target, headers)
+            except (http.client.HTTPException, OSError):
+                # An idle keep-alive connection may have been dropped; retry once on a new one
+                connection.close()
+                connection = self.connect()
+                try:
+                    response, will_close = await asyncio.to_thread(self.send, connection, method, target, headers)
+                except (http.client.HTTPException, OSError):
+                    connection.close()
+                    raise
+            if will_close:
+                connection.close()
+            else:
+                self.idle.append(connection)
+            return response
+
+    def close(self):
+        while self.idle:
+            self.idle.pop().close()
+
+
+def resource_for(url: str) -> str:
+    """GitHub rate-limit resource an API URL is counted against"""
+    path = urlsplit(url).path
+    if '/search/code' in path:
+        return 'code_search'
+    if '/search/' in path:
+        return 'search'
+    return 'core'
+
+
+class RateLimitScheduler:
+    """Spaces requests per rate-limit resource from GitHub's X-RateLimit-* headers
+
+    Until GitHub reports a budget, requests go out as fast as the pool
+    allows. After that, the remaining requests are spread evenly until the
+    reset time, and a spent budget or a Retry-After holds every request for
+    that resource until it has passed.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.budgets: Dict[str, Dict[str, float]] = {}    # resource -> remaining, reset
+        self.next_slot: Dict[str, float] = {}             # resource -> earliest next request
+
+    def reserve(self, resource: str) -> float:
+        """Claim the next request slot; returns the seconds to wait for it"""
+        now = self.clock()
+        start = max(now, self.next_slot.get(resource, 0.0))
+        interval = 0.0
+        budget = self.budgets.get(resource)
+        if budget and budget['reset'] + RESET_SLACK <= start:
+            del self.budgets[resource]    # the window has reset; wait for new headers
+        elif budget and budget['remaining'] <= 0:
+            start = budget['reset'] + RESET_SLACK
+            del self.budgets[resource]
+        elif budget:
+            interval = max(0.0, budget['reset'] - start) / budget['remaining']
+            budget['remaining'] -= 1
+        self.next_slot[resource] = start + interval
+        return start - now
+
+    async def wait(self, resource: str):
+        delay = self.reserve(resource)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, resource: str, headers: Dict[str, str]):
+        """Record the budget a response reported"""
+        resource = headers.get('x-ratelimit-resource', resource)
+        try:
+            remaining = int(headers['x-ratelimit-remaining'])
+            reset = float(headers['x-ratelimit-reset'])
+        except (KeyError, ValueError):
+            return
+        self.budgets[resource] = {'remaining': remaining, 'reset': reset}
+
+    def block(self, resource: str, until: float):
+        """Hold requests for ``resource`` until ``until`` (epoch seconds)"""
+        self.next_slot[resource] = max(self.next_slot.get(resource, 0.0), until)
+        self.budgets.pop(resource, None)
+
+
+class CrawlState:
+    """Checkpoint of an unfinished crawl plus the ETag cache, in one JSON file
+
+    ``run`` holds each query's next page URL and the skills found so far;
+    ``etags`` maps a page URL to its ETag, the skills it listed and its next
+    page link.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self.run: Optional[Dict] = None
+        self.etags: Dict[str, Dict] = {}
+        if path and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                print(f"⚠️  Ignoring unreadable crawl state: {path}")
+                return
+            if data.get('version') == STATE_VERSION:
+                self.run = data.get('run')
+                self.etags = data.get('etags', {})
+
+    def start(self, queries: List[str], first_pages: Dict[str, str]):
+        self.run = {
+            'started': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
+            'queries': {query: {'next': first_pages[query], 'pages': 0, 'done': False} for query in queries},
+            'found': [],
+            'fetched': [],
+        }
+
+    def save(self):
+        """Atomically write the checkpoint"""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp.write_text(json.dumps({'version': STATE_VERSION, 'run': self.run, 'etags': self.etags},
+                                  indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        os.replace(tmp, self.path)
+
 
-def main():
-    # Configuration
+def next_link(headers: Dict[str, str]) -> Optional[str]:
+    """rel="next" URL from a Link header"""
+    for url, rel in LINK_PATTERN.findall(headers.get('link', '')):
+        if rel == 'next':
+            return url
+    return None
+
+
+def retry_until(retry_after: str, now: float) -> Optional[float]:
+    """Epoch seconds a Retry-After header (delay or HTTP-date) holds requests until; None if unparseable"""
+    try:
+        return now + float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(retry_after).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def search_url(query: str, per_page: int) -> str:
+    return '/search/code?' + urlencode({'q': query, 'per_page': per_page, 'page': 1})
+
+
+def compact_item(item: Dict) -> Dict:
+    """The parts of a code-search result a discovered skill records"""
+    repository = item.get('repository') or {}
+    return {
+        'repo_url': repository.get('html_url'),
+        'repo_name': repository.get('full_name'),
+        'file_path': item.get('path'),
+        'file_url': item.get('html_url'),
+        'stars': repository.get('stargazers_count', 0),
+        'description': repository.get('description', ''),
+    }
+
+
+class Crawler:
+    """Runs the search queries concurrently and collects new skills into ``state.run``"""
+
+    def __init__(self, pool: ConnectionPool, scheduler: RateLimitScheduler, state: CrawlState,
+                 headers: Dict[str, str], previous_urls: Set[str], limit: int, max_pages: int,
+                 recording: Optional[List[Dict]] = None):
+        self.pool = pool
+        self.scheduler = scheduler
+        self.state = state
+        self.headers = headers
+        self.previous_urls = previous_urls
+        self.limit = limit
+        self.max_pages = max_pages
+        self.recording = recording
+        self.seen = previous_urls | {skill['repo_url'] for skill in state.run['found']}
+
+    def limit_reached(self) -> bool:
+        return len(self.state.run['found']) >= self.limit
+
+    async def prime(self):
+        """Load the current budgets from /rate_limit (which is itself free)"""
+        try:
+            response = await self.pool.request('GET', '/rate_limit', self.headers)
+            resources = response.json().get('resources', {}) if response.status == 200 else {}
+        except (OSError, http.client.HTTPException, ValueError):
+            return
+        for resource, budget in resources.items():
+            self.scheduler.update(resource, {'x-ratelimit-remaining': str(budget.get('remaining', '')),
+                                             'x-ratelimit-reset': str(budget.get('reset', ''))})
+
+    async def fetch(self, url: str) -> Response:
+        """GET with rate-limit scheduling and retries; 200 and 304 are returned"""
+        resource = resource_for(url)
+        cached = self.state.etags.get(url)
+        headers = dict(self.headers)
+        if cached:
+            headers['If-None-Match'] = cached['etag']
+        for attempt in range(MAX_RETRIES + 1):
+            await self.scheduler.wait(resource)
+            response = await self.pool.request('GET', url, headers)
+            self.scheduler.update(resource, response.headers)
+            if self.recording is not None:
+                self.recording.append({'request': self.pool.target(url), 'status': response.status,
+                                       'headers': {k: v for k, v in response.headers.items()
+                                                   if k in ('link', 'etag')},
+                                       'body': response.json() if response.status == 200 else None})
+            if response.status in (200, 304):
+                return response
+            retry_after = response.headers.get('retry-after')
+            until = retry_until(retry_after, self.scheduler.clock()) if retry_after else None
+            if response.status in (403, 429) and until is not None:
+                self.scheduler.block(resource, until)
+            elif response.status in (403, 429) and response.headers.get('x-ratelimit-remaining') == '0':
+                self.scheduler.block(resource, float(response.headers.get('x-ratelimit-reset', 0)) + RESET_SLACK)
+            elif response.status >= 500 or (response.status in (403, 429) and retry_after):
+                # Unparseable Retry-After: back off as for a server error
+                self.scheduler.block(resource, self.scheduler.clock() + min(30, 2 ** attempt) + random.random())
+            else:
+                message = response.json().get('message') if response.body else None
+                raise CrawlError(f"HTTP {response.status}" + (f": {message}" if message else ''))
+            if attempt < MAX_RETRIES:
+                print(f"  ⏳ HTTP {response.status}, retrying ({attempt + 1}/{MAX_RETRIES})")
+        raise CrawlError(f"Gave up after {MAX_RETRIES} retries (HTTP {response.status})")
+
+    async def fetch_page(self, url: str):
+        """(compact items, next page URL) of one result page"""
+        response = await self.fetch(url)
+        self.state.run['fetched'].append(url)
+        if response.status == 304:
+            cached = self.state.etags[url]
+            return cached['items'], cached['next']
+        items = [compact_item(item) for item in response.json().get('items', [])]
+        next_url = next_link(response.headers)
+        if response.headers.get('etag'):
+            self.state.etags[url] = {'etag': response.headers['etag'], 'items': items, 'next': next_url}
+        return items, next_url
+
+    def add(self, query: str, items: List[Dict]) -> int:
+        added = 0
+        for item in items:
+            if self.limit_reached():
+                break
+            repo_url = item['repo_url']
+            if not repo_url or repo_url in self.seen:
+                continue
+            if any(repo in repo_url for repo in EXCLUDED_REPOS):
+                continue
+            self.seen.add(repo_url)
+            self.state.run['found'].append({
+                **item,
+                'discovered_at': time.strftime('%Y-%m-%d %H:%M:%S UTC'),
+                'query': query,
+            })
+            print(f"  ✅ {item['repo_name']} ({item['stars']} ⭐)")
+            added += 1
+        return added
+
+    async def crawl_query(self, query: str):
+        progress = self.state.run['queries'][query]
+        while progress['next'] and progress['pages'] < self.max_pages and not self.limit_reached():
+            items, next_url = await self.fetch_page(progress['next'])
+            added = self.add(query, items)
+            progress['pages'] += 1
+            progress['next'] = next_url
+            print(f"🔍 {query} (page {progress['pages']}): {len(items)} results, {added} new")
+            self.state.save()
+        progress['done'] = True
+        self.state.save()
+
+    async def crawl(self) -> List[str]:
+        """Crawl every unfinished query; returns the errors of queries that failed"""
+        await self.prime()
+        pending = [query for query, progress in self.state.run['queries'].items() if not progress['done']]
+        outcomes = await asyncio.gather(*(self.crawl_query(query) for query in pending),
+                                        return_exceptions=True)
+        errors = []
+        for query, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                if not isinstance(outcome, (CrawlError, OSError, http.client.HTTPException, ValueError)):
+                    raise outcome
+                print(f"  ⚠️ Search failed for '{query}': {outcome}")
+                errors.append(f"{query}: {outcome}")
+        return errors
+
+
+def load_discovery(path: Path) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Discover new Claude skills on GitHub")
+    parser.add_argument('--limit', type=int, default=int(os.environ.get('DISCOVERY_LIMIT', 10)),
+                        help="Maximum new skills to discover (default: $DISCOVERY_LIMIT or 10)")
+    parser.add_argument('--max-pages', type=int, default=int(os.environ.get('DISCOVERY_MAX_PAGES', 3)),
+                        help="Result pages to follow per query (default: $DISCOVERY_MAX_PAGES or 3)")
+    parser.add_argument('--per-page', type=int, default=100, help="Results per page, up to 100 (default: 100)")
+    parser.add_argument('--concurrency', type=int, default=int(os.environ.get('DISCOVERY_CONCURRENCY', 4)),
+                        help="Connections to the API (default: $DISCOVERY_CONCURRENCY or 4)")
+    parser.add_argument('--api-url', default=os.environ.get('GITHUB_API_URL', DEFAULT_API_URL),
+                        help=f"GitHub API URL (default: $GITHUB_API_URL or {DEFAULT_API_URL})")
+    parser.add_argument('--discovery-file', type=Path, default=DISCOVERY_FILE,
+                        help=f"Discovery tracking file (default: {DISCOVERY_FILE})")
+    parser.add_argument('--state', type=Path, default=STATE_FILE,
+                        help=f"Checkpoint and ETag cache (default: {STATE_FILE})")
+    parser.add_argument('--fresh', action='store_true', help="Start over instead of resuming a checkpoint")
+    parser.add_argument('--record', type=Path, help="Save the responses for github_stub_server.py")
+    parser.add_argument('--query', action='append', dest='queries',
+                        help="Search query to run instead of the built-in ones (repeatable)")
+    return parser.parse_args(argv)
+
+
+async def discover(args) -> Dict:
+    """Run (or resume) a crawl; returns a summary and merges finds into the discovery file"""
     GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
-    DISCOVERY_LIMIT = int(os.environ.get('DISCOVERY_LIMIT', 10))
-    
+
     # Build headers - only include Authorization if token is available
     headers = {
-        'Accept': 'application/vnd.github.v3+json'
+        'Accept': 'application/vnd.github.v3+json',
+        'User-Agent': USER_AGENT,
     }
     if GITHUB_TOKEN:
         headers['Authorization'] = f'token {GITHUB_TOKEN}'
     else:
         print("⚠️  No GITHUB_TOKEN set - using unauthenticated requests (rate limits apply)")
-    
+
     # Load previously discovered skills
-    discovery_file = Path('.github/skill-discovery/discovered-skills.json')
-    with open(discovery_file) as f:
-        discovery_data = json.load(f)
-    
+    discovery_data = load_discovery(args.discovery_file)
     previous_urls = set(
-        item['repo_url'] for item in discovery_data['discovered'] + 
+        item['repo_url'] for item in discovery_data['discovered'] +
         discovery_data['integrated'] + discovery_data['rejected']
     )
-    
+
     print(f"📊 Previously tracked: {len(previous_urls)} skills")
-    print(f"🎯 Discovery limit: {DISCOVERY_LIMIT} new skills")
-    
-    # Search for Claude skills on GitHub
-    search_queries = [
-        'claude skill markdown in:readme',
-        'claude prompt template in:file extension:md',
-        'claude instructions SKILL.md in:path',
-        'AI agent skill claude in:readme',
-        'LLM workflow template in:readme language:markdown'
-    ]
-    
-    discovered_skills = []
-    
-    for query in search_queries:
-        if len(discovered_skills) >= DISCOVERY_LIMIT:
-            break
-        
-        print(f"\n🔍 Searching: {query}")
-        
-        # GitHub Code Search API (free, public)
-        url = f'https://api.github.com/search/code?q={query}&per_page=10'
-        
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            results = response.json()
-            
-            for item in results.get('items', []):
-                if len(discovered_skills) >= DISCOVERY_LIMIT:
-                    break
-                
-                repo_url = item['repository']['html_url']
-                
-                # Skip if already tracked
-                if repo_url in previous_urls:
-                    continue
-                
-                # Skip our own repo
-                if 'Grumpified-OGGVCT/awesome-claude-skills' in repo_url:
-                    continue
-                
-                # Skip upstream repo (already synced separately)
-                if 'ComposioHQ/awesome-claude-skills' in repo_url:
-                    continue
-                
-                skill_info = {
-                    'repo_url': repo_url,
-                    'repo_name': item['repository']['full_name'],
-                    'file_path': item['path'],
-                    'file_url': item['html_url'],
-                    'discovered_at': time.strftime('%Y-%m-%d %H:%M:%S UTC'),
-                    'query': query,
-                    'stars': item['repository'].get('stargazers_count', 0),
-                    'description': item['repository'].get('description', '')
-                }
-                
-                discovered_skills.append(skill_info)
-                print(f"  ✅ {skill_info['repo_name']} ({skill_info['stars']} ⭐)")
-            
-            # Rate limiting - be nice to GitHub API
-            time.sleep(2)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  ⚠️ Search failed: {e}")
-            continue
-    
-    # Save discovered skills
-    discovery_data['discovered'].extend(discovered_skills)
-    
-    with open(discovery_file, 'w') as f:
+    print(f"🎯 Discovery limit: {args.limit} new skills")
+
+    queries = args.queries or SEARCH_QUERIES
+    state = CrawlState(args.state)
+    if state.run and not args.fresh and set(state.run['queries']) == set(queries):
+        pending = sum(1 for progress in state.run['queries'].values() if not progress['done'])
+        print(f"♻️  Resuming crawl from {state.run['started']}: {pending} queries left, "
+              f"{len(state.run['found'])} skills found so far")
+    else:
+        state.start(queries, {query: search_url(query, args.per_page) for query in queries})
+    state.save()
+
+    recording = [] if args.record else None
+    pool = ConnectionPool(args.api_url, size=args.concurrency)
+    crawler = Crawler(pool, RateLimitScheduler(), state, headers, previous_urls,
+                      limit=args.limit, max_pages=args.max_pages, recording=recording)
+    try:
+        errors = await crawler.crawl()
+    finally:
+        pool.close()
+        if recording is not None:
+            base = pool.target('/')[:-1]
+            write_recording(args.record, recording, args.api_url, base)
+
+    # Save discovered skills, in query order
+    order = {query: i for i, query in enumerate(queries)}
+    found = sorted(state.run['found'], key=lambda skill: order.get(skill['query'], len(order)))
+    new_skills = [skill for skill in found if skill['repo_url'] not in previous_urls][:args.limit]
+    discovery_data['discovered'].extend(new_skills)
+    with open(args.discovery_file, 'w') as f:
         json.dump(discovery_data, f, indent=2)
-    
+
+    if errors and not crawler.limit_reached():
+        # Keep the failed queries for the next run; their finds are saved already
+        state.run['found'] = []
+    else:
+        # Finished: drop the checkpoint and ETags of pages no longer requested
+        fetched = set(state.run['fetched'])
+        state.etags = {url: entry for url, entry in state.etags.items() if url in fetched}
+        state.run = None
+    state.save()
+
+    return {'found': new_skills, 'errors': errors, 'resumable': state.run is not None}
+
+
+def write_recording(path: Path, recording: List[Dict], api_url: str, prefix: str):
+    """Save responses with the API URL replaced by {base_url}, for github_stub_server.py"""
+    for exchange in recording:
+        if exchange['request'].startswith(prefix):
+            exchange['request'] = exchange['request'][len(prefix):]
+        link = exchange['headers'].get('link')
+        if link:
+            exchange['headers']['link'] = link.replace(api_url.rstrip('/'), '{base_url}')
+    path.write_text(json.dumps({'exchanges': recording}, indent=2) + '\n', encoding='utf-8')
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        summary = asyncio.run(discover(args))
+    except KeyboardInterrupt:
+        print("\n⏸️  Interrupted - progress is checkpointed, rerun to resume")
+        return 1
+
+    discovered_skills = summary['found']
     # Output for GitHub Actions
-    with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
-        f.write(f"skills_found={len(discovered_skills)}\n")
-        f.write(f"has_discoveries={'true' if discovered_skills else 'false'}\n")
-    
+    if os.environ.get('GITHUB_OUTPUT'):
+        with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+            f.write(f"skills_found={len(discovered_skills)}\n")
+            f.write(f"has_discoveries={'true' if discovered_skills else 'false'}\n")
+
     print(f"\n📊 Summary: Discovered {len(discovered_skills)} new skills")
+    if summary['resumable']:
+        print(f"⏸️  {len(summary['errors'])} queries unfinished - rerun to resume from the checkpoint")
+    return 0
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
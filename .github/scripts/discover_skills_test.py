@@ -0,0 +1,184 @@
+import asyncio
+import io
+import json
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from discover_skills import (CrawlError, CrawlState, Crawler, RateLimitScheduler, Response, discover,
+                             parse_args, retry_until)
+from github_stub_server import request_key, start_replay_server
+
+RECORDING = Path(__file__).parent / 'fixtures' / 'code-search-recording.json'
+QUERIES = ['claude skill markdown in:readme', 'claude instructions SKILL.md in:path']
+
+
+class ScriptedPool:
+    """Answers every request with the next of ``responses``"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    async def request(self, method, url, headers):
+        return self.responses.pop(0)
+
+
+class RecordingScheduler(RateLimitScheduler):
+    """Never sleeps; records what the crawler blocked until"""
+
+    def __init__(self):
+        super().__init__(clock=lambda: 1000.0)
+        self.blocked = []
+
+    async def wait(self, resource):
+        pass
+
+    def block(self, resource, until):
+        self.blocked.append(until)
+
+
+class TestDiscoverSkills(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.discovery_file = self.dir / 'discovered-skills.json'
+        self.discovery_file.write_text(json.dumps({
+            'discovered': [], 'integrated': [{'repo_url': 'https://github.com/bob/already-tracked'}],
+            'rejected': []}))
+        self.recording = json.loads(RECORDING.read_text())
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.tmp.cleanup()
+
+    def start(self, recording=None, **options):
+        # A generous budget, so pacing stays in the milliseconds
+        options.setdefault('rate_limit', 1000)
+        server = start_replay_server(recording or self.recording, **options)
+        self.servers.append(server)
+        return server
+
+    def run_discovery(self, server, *extra):
+        argv = ['--api-url', server.base_url, '--discovery-file', str(self.discovery_file),
+                '--state', str(self.dir / 'crawl-state.json'), '--per-page', '2', '--concurrency', '2']
+        for query in QUERIES:
+            argv += ['--query', query]
+        with redirect_stdout(io.StringIO()):
+            return asyncio.run(discover(parse_args(argv + list(extra))))
+
+    def discovered(self):
+        return [skill['repo_name'] for skill in json.loads(self.discovery_file.read_text())['discovered']]
+
+    def state(self):
+        return json.loads((self.dir / 'crawl-state.json').read_text())
+
+    def test_paginates_and_skips_tracked_excluded_and_duplicate_repos(self):
+        server = self.start()
+        summary = self.run_discovery(server)
+        self.assertEqual(summary['errors'], [])
+        self.assertEqual(self.discovered(), ['alice/meeting-notes-skill', 'carol/sql-review-skill',
+                                             'dave/release-notes-skill', 'erin/api-docs-skill'])
+        self.assertEqual(sorted(status for _, status in server.requests), [200] * 4)
+        state = self.state()
+        self.assertIsNone(state['run'])
+        self.assertEqual(len(state['etags']), 4)
+
+    def test_unchanged_pages_are_revalidated_with_etags(self):
+        server = self.start()
+        self.run_discovery(server)
+        server.requests.clear()
+        summary = self.run_discovery(server)
+        self.assertEqual(summary['found'], [])
+        self.assertEqual([status for _, status in server.requests], [304] * 4)
+        # 304s don't count against the budget
+        self.assertEqual(server.budget()[0], server.rate_limit - 4)
+
+    def test_waits_for_rate_limit_reset(self):
+        server = self.start(rate_limit=2, window=1.0)
+        start = time.monotonic()
+        summary = self.run_discovery(server)
+        self.assertEqual(summary['errors'], [])
+        self.assertEqual(len(self.discovered()), 4)
+        self.assertGreater(time.monotonic() - start, 0.9)
+
+    def test_resumes_from_checkpoint(self):
+        recording = json.loads(RECORDING.read_text())
+        page_2 = recording['exchanges'].pop(1)
+        server = self.start(recording)
+        summary = self.run_discovery(server)
+        self.assertTrue(summary['resumable'])
+        self.assertEqual(len(summary['errors']), 1)
+        self.assertEqual(self.discovered(), ['alice/meeting-notes-skill', 'erin/api-docs-skill'])
+        progress = self.state()['run']['queries'][QUERIES[0]]
+        self.assertFalse(progress['done'])
+        self.assertEqual(progress['pages'], 1)
+
+        # The missing page is back: only the unfinished query continues
+        server.exchanges[request_key(page_2['request'])] = page_2
+        server.requests.clear()
+        summary = self.run_discovery(server)
+        self.assertFalse(summary['resumable'])
+        self.assertEqual([dict(request_key(target)[1])['page'] for target, _ in server.requests], ['2', '3'])
+        self.assertEqual(self.discovered(), ['alice/meeting-notes-skill', 'erin/api-docs-skill',
+                                             'carol/sql-review-skill', 'dave/release-notes-skill'])
+        self.assertIsNone(self.state()['run'])
+
+    def test_limit(self):
+        server = self.start()
+        summary = self.run_discovery(server, '--limit', '2')
+        self.assertEqual(len(summary['found']), 2)
+        self.assertEqual(len(self.discovered()), 2)
+
+    def test_scheduler_spreads_remaining_budget(self):
+        now = [1000.0]
+        scheduler = RateLimitScheduler(clock=lambda: now[0])
+        self.assertEqual(scheduler.reserve('code_search'), 0)
+        scheduler.update('code_search', {'x-ratelimit-remaining': '4', 'x-ratelimit-reset': '1008'})
+        delays = [scheduler.reserve('code_search') for _ in range(4)]
+        self.assertEqual(delays[0], 0)
+        self.assertTrue(all(later > earlier for earlier, later in zip(delays, delays[1:])))
+        # Budget spent: the next request waits for the reset
+        self.assertGreaterEqual(scheduler.reserve('code_search'), 8)
+
+    def fetch(self, *responses):
+        state = CrawlState(None)
+        state.start([], {})
+        crawler = Crawler(ScriptedPool(responses), RecordingScheduler(), state, {}, set(),
+                          limit=10, max_pages=1)
+        with redirect_stdout(io.StringIO()) as output:
+            try:
+                result = asyncio.run(crawler.fetch('/search/code?q=skill'))
+            except CrawlError as e:
+                result = e
+        return result, crawler.scheduler.blocked, output.getvalue()
+
+    def test_retry_after_may_be_an_http_date(self):
+        self.assertEqual(retry_until('30', 1000.0), 1030.0)
+        self.assertEqual(retry_until('Wed, 21 Oct 2026 07:28:00 GMT', 1000.0), 1792567680.0)
+        self.assertIsNone(retry_until('soon', 1000.0))
+
+        limited = Response(429, {'retry-after': 'Wed, 21 Oct 2026 07:28:00 GMT'}, b'')
+        result, blocked, _ = self.fetch(limited, Response(200, {}, b''))
+        self.assertEqual(result.status, 200)
+        self.assertEqual(blocked, [1792567680.0])
+
+        # An unparseable Retry-After falls back to backoff instead of failing the query
+        result, blocked, _ = self.fetch(Response(429, {'retry-after': 'soon'}, b''), Response(200, {}, b''))
+        self.assertEqual(result.status, 200)
+        self.assertEqual(len(blocked), 1)
+
+    def test_retry_message_only_when_retrying(self):
+        result, _, output = self.fetch(*[Response(503, {}, b'')] * 5)
+        self.assertIsInstance(result, CrawlError)
+        self.assertEqual(output.count('retrying'), 4)
+        self.assertIn('retrying (4/4)', output)
+        self.assertNotIn('(5/4)', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
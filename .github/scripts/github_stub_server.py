@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Replay recorded GitHub API responses for offline discovery tests.
+
+Serves the exchanges of a recording (see discover_skills.py --record):
+
+    {"exchanges": [{"request": "/search/code?q=...&page=1", "status": 200,
+                    "headers": {"link": "<{base_url}/search/code?...&page=2>; rel=\\"next\\""},
+                    "body": {...}}]}
+
+Requests are matched on path and query parameters in any order.
+``{base_url}`` in headers is replaced with the server's own URL, so
+pagination links point back at it. Like GitHub, it:
+
+- sends an ETag for every body and answers a matching If-None-Match with
+  304, which doesn't count against the rate limit;
+- reports X-RateLimit-Limit/-Remaining/-Reset/-Resource for a fixed-size
+  window and answers 403 once the window's budget is spent;
+- serves the current budgets at /rate_limit.
+
+    python .github/scripts/github_stub_server.py recording.json --port 8089 --rate-limit 10 --window 60
+    GITHUB_API_URL=http://127.0.0.1:8089 python .github/scripts/discover_skills.py
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8089
+
+
+def request_key(target: str) -> Tuple[str, Tuple]:
+    """(path, sorted query parameters) of a request target"""
+    parts = urlsplit(target)
+    return parts.path, tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server_version = 'GitHubStub/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        path, _ = request_key(self.path)
+        if path == '/rate_limit':
+            remaining, reset = server.budget()
+            budget = {'limit': server.rate_limit, 'remaining': remaining, 'reset': reset, 'used': 0}
+            self.send_json(HTTPStatus.OK, {'resources': {server.resource: budget}, 'rate': budget})
+            return
+
+        exchange = server.exchanges.get(request_key(self.path))
+        body = json.dumps(exchange['body']).encode('utf-8') if exchange and exchange.get('body') is not None else b''
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if exchange and exchange['status'] == 200 and self.headers.get('If-None-Match') == etag:
+            server.log_request_result(self.path, 304)
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_rate_headers(*server.budget())
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        remaining, reset = server.spend()
+        if remaining < 0:
+            server.log_request_result(self.path, 403)
+            self.send_json(HTTPStatus.FORBIDDEN, {'message': 'API rate limit exceeded'}, rate=(0, reset))
+            return
+        if exchange is None:
+            server.log_request_result(self.path, 404)
+            self.send_json(HTTPStatus.NOT_FOUND, {'message': 'Not Found (no recorded response)'},
+                           rate=(remaining, reset))
+            return
+
+        server.log_request_result(self.path, exchange['status'])
+        headers = {name: value.replace('{base_url}', server.base_url)
+                   for name, value in (exchange.get('headers') or {}).items() if name.lower() != 'etag'}
+        if exchange['status'] == 200:
+            headers['ETag'] = etag
+        self.send_json(exchange['status'], exchange.get('body'), rate=(remaining, reset), headers=headers)
+
+    def send_rate_headers(self, remaining: int, reset: int):
+        self.send_header('X-RateLimit-Limit', str(self.server.rate_limit))
+        self.send_header('X-RateLimit-Remaining', str(max(0, remaining)))
+        self.send_header('X-RateLimit-Reset', str(reset))
+        self.send_header('X-RateLimit-Resource', self.server.resource)
+
+    def send_json(self, status: int, payload, rate: Optional[Tuple[int, int]] = None,
+                  headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if rate:
+            self.send_rate_headers(*rate)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], recording: Dict, rate_limit: int = 30,
+                 window: float = 60.0, resource: str = 'code_search', verbose: bool = False):
+        self.exchanges = {request_key(e['request']): e for e in recording.get('exchanges', [])}
+        self.rate_limit = rate_limit
+        self.window = window
+        self.resource = resource
+        self.verbose = verbose
+        self.requests: List[Tuple[str, int]] = []    # (target, status) of every request
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+        super().__init__(address, ReplayHandler)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def _roll_window(self, now: float):
+        if now >= self._window_start + self.window:
+            self._window_start = now
+            self._used = 0
+
+    def budget(self) -> Tuple[int, int]:
+        """(remaining, reset epoch) of the current window"""
+        with self._lock:
+            self._roll_window(time.time())
+            return self.rate_limit - self._used, int(self._window_start + self.window + 0.999)
+
+    def spend(self) -> Tuple[int, int]:
+        """Count a request; remaining is negative when it is over the limit"""
+        with self._lock:
+            self._roll_window(time.time())
+            self._used += 1
+            return self.rate_limit - self._used, int(self._window_start + self.window + 0.999)
+
+    def log_request_result(self, target: str, status: int):
+        with self._lock:
+            self.requests.append((target, status))
+
+
+def start_replay_server(recording: Dict, **options) -> ReplayServer:
+    """Start a ReplayServer on a free local port in a daemon thread (for tests)."""
+    server = ReplayServer((DEFAULT_HOST, 0), recording, **options)
+    threading.Thread(target=server.serve_forever, name='github-stub', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded GitHub API responses")
+    parser.add_argument("recording", type=Path, help="Recording JSON (discover_skills.py --record)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--rate-limit", type=int, default=30, help="Requests per window (default: 30)")
+    parser.add_argument("--window", type=float, default=60.0, help="Rate-limit window in seconds (default: 60)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    recording = json.loads(args.recording.read_text(encoding='utf-8'))
+    server = ReplayServer((args.host, args.port), recording, rate_limit=args.rate_limit,
+                          window=args.window, verbose=args.verbose)
+    print(f"🚀 Replaying {len(server.exchanges)} GitHub responses on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
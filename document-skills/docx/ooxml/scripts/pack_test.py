@@ -0,0 +1,160 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import defusedxml.minidom
+from defusedxml import EntitiesForbidden
+
+from pack import condense_xml, pack_document, pretty_print_xml
+from unpack import unpack_document
+
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:body><w:p><w:r><w:t xml:space="preserve"> Café &amp; &lt;tea&gt; </w:t></w:r>'
+    '<!-- note --><w:r><w:t/></w:r></w:p><w:p w:rsidR="00AB&quot;12"/></w:body></w:document>'
+).encode("utf-8")
+
+CONTENT_TYPES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="png" ContentType="image/png"/></Types>'
+)
+
+
+def rewrite(function, data):
+    output = io.BytesIO()
+    function(io.BytesIO(data), output)
+    return output.getvalue()
+
+
+def without_declaration(xml):
+    return xml.split(b"?>", 1)[1]
+
+
+class TestStreamingXML(unittest.TestCase):
+    def test_pretty_print_matches_minidom(self):
+        expected = defusedxml.minidom.parseString(DOCUMENT).toprettyxml(indent="  ", encoding="ascii")
+        pretty = rewrite(pretty_print_xml, DOCUMENT)
+        self.assertEqual(without_declaration(pretty), without_declaration(expected))
+        self.assertTrue(pretty.startswith(b'<?xml version="1.0" encoding="ascii" standalone="yes"?>\n'))
+        self.assertIn(b"Caf&#233;", pretty)
+
+    def test_condense_undoes_pretty_printing(self):
+        condensed = rewrite(condense_xml, rewrite(pretty_print_xml, DOCUMENT))
+        self.assertEqual(
+            condensed,
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            b'<w:body><w:p><w:r><w:t xml:space="preserve"> Caf\xc3\xa9 &amp; &lt;tea&gt; </w:t></w:r>'
+            b'<w:r><w:t/></w:r></w:p><w:p w:rsidR="00AB&quot;12"/></w:body></w:document>',
+        )
+
+    def test_escaping_differs_from_minidom(self):
+        document = (
+            b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            b'<w:t w:val="line&#10;next&#9;tab &quot;q&quot;">say "hi" &amp; &#13;</w:t></w:document>'
+        )
+        condensed = rewrite(condense_xml, document)
+        self.assertIn(b'w:val="line&#10;next&#9;tab &quot;q&quot;"', condensed)
+        self.assertIn(b'>say "hi" &amp; &#13;</w:t>', condensed)
+
+        # minidom writes the attribute whitespace raw and escapes '"' in text
+        minidom = defusedxml.minidom.parseString(document).toxml(encoding="UTF-8")
+        self.assertIn(b'w:val="line\nnext\ttab &quot;q&quot;"', minidom)
+        self.assertIn(b">say &quot;hi&quot; &amp; \r</w:t>", minidom)
+
+        # Ours parses back to the original values; minidom's loses the whitespace
+        [original, ours, theirs] = [
+            defusedxml.minidom.parseString(xml).documentElement.firstChild
+            for xml in (document, condensed, minidom)
+        ]
+        self.assertEqual(ours.getAttribute("w:val"), original.getAttribute("w:val"))
+        self.assertEqual(ours.firstChild.data, original.firstChild.data)
+        self.assertEqual(theirs.getAttribute("w:val"), 'line next tab "q"')
+
+    def test_reads_in_chunks(self):
+        class Source(io.BytesIO):
+            largest = 0
+
+            def read(self, size=-1):
+                Source.largest = max(Source.largest, size)
+                return super().read(size)
+
+        paragraph = b"<w:p><w:r><w:t>" + b"x" * 1000 + b"</w:t></w:r></w:p>"
+        data = DOCUMENT.replace(b"<w:body>", b"<w:body>" + paragraph * 2000)
+        output = io.BytesIO()
+        condense_xml(Source(data), output)
+        self.assertGreater(len(data), 10 * Source.largest)
+        self.assertEqual(output.getvalue().count(b"<w:p>"), 2001)
+
+    def test_entities_are_forbidden(self):
+        bomb = b'<!DOCTYPE x [<!ENTITY a "aaaa">]><x>&a;</x>'
+        with self.assertRaises(EntitiesForbidden):
+            rewrite(condense_xml, bomb)
+
+
+class TestPackUnpack(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.original = self.dir / "original.docx"
+        with zipfile.ZipFile(self.original, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("[Content_Types].xml", CONTENT_TYPES)
+            zf.writestr("word/document.xml", DOCUMENT)
+            # Stored rather than deflated, so a copy is easy to tell from a recompressed file
+            zf.writestr("word/media/image1.png", os.urandom(50_000) + b"\0" * 50_000, zipfile.ZIP_STORED)
+            zf.writestr("word/media/image2.png", b"\x89PNG" * 10_000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        unpacked = self.dir / "unpacked"
+        unpack_document(self.original, unpacked)
+        self.assertIn(b"\n  <w:body>\n", (unpacked / "word" / "document.xml").read_bytes())
+
+        output = self.dir / "output.docx"
+        self.assertTrue(pack_document(unpacked, output))
+        with zipfile.ZipFile(output) as packed, zipfile.ZipFile(self.original) as original:
+            self.assertIsNone(packed.testzip())
+            self.assertEqual(packed.namelist()[0], "[Content_Types].xml")
+            self.assertEqual(sorted(packed.namelist()), sorted(original.namelist()))
+            for name in original.namelist():
+                expected = original.read(name)
+                if name.endswith(".xml"):
+                    expected = expected.replace(b"\n", b"").replace(b"<!-- note -->", b"")
+                self.assertEqual(packed.read(name), expected, name)
+
+    def test_unchanged_media_keeps_its_compression(self):
+        unpacked = self.dir / "unpacked"
+        unpack_document(self.original, unpacked)
+        (unpacked / "word" / "media" / "image2.png").write_bytes(b"\x89PNG changed")
+        with zipfile.ZipFile(self.original) as original:
+            image1 = original.getinfo("word/media/image1.png")
+
+        # Repack over the original itself
+        self.assertTrue(pack_document(unpacked, self.original, original=self.original))
+        with zipfile.ZipFile(self.original) as packed:
+            self.assertIsNone(packed.testzip())
+            self.assertEqual(packed.read("word/media/image2.png"), b"\x89PNG changed")
+            self.assertEqual(len(packed.read("word/media/image1.png")), 100_000)
+            self.assertEqual(packed.getinfo("word/media/image1.png").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(packed.getinfo("word/media/image1.png").date_time, image1.date_time)
+            self.assertEqual(packed.getinfo("word/media/image2.png").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(self.dir)))
+
+    def test_unpack_stays_inside_the_output_directory(self):
+        evil = self.dir / "evil.docx"
+        with zipfile.ZipFile(evil, "w") as zf:
+            zf.writestr("../../escape.xml", b"<x/>")
+        unpack_document(evil, self.dir / "unpacked")
+        self.assertTrue((self.dir / "unpacked" / "escape.xml").exists())
+        self.assertFalse((self.dir.parent / "escape.xml").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,29 +1,60 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
+
+Each part is streamed out of the zip on its own: XML parts are pretty-printed
+as they are parsed, and binary media is copied through without being parsed.
+"""
 
 import random
+import shutil
 import sys
-import defusedxml.minidom
 import zipfile
-from pathlib import Path
-
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+from pathlib import Path, PurePosixPath
+
+from pack import CHUNK_SIZE, is_xml_part, pretty_print_xml
+
+
+def unpack_document(input_file, output_dir):
+    """Extract an Office file into output_dir, pretty-printing its XML parts."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(input_file) as zf:
+        for info in zf.infolist():
+            # Like ZipFile.extract, never write outside output_dir
+            parts = [
+                part
+                for part in PurePosixPath(info.filename.replace("\\", "/")).parts
+                if part not in ("/", ".", "..")
+            ]
+            if not parts:
+                continue
+            target = output_path.joinpath(*parts)
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, open(target, "wb") as dst:
+                if is_xml_part(info.filename):
+                    pretty_print_xml(src, dst)
+                else:
+                    shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+
+def main():
+    # Get command line arguments
+    assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
+    input_file, output_dir = sys.argv[1], sys.argv[2]
+
+    # Extract and format
+    unpack_document(input_file, output_dir)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+if __name__ == "__main__":
+    main()
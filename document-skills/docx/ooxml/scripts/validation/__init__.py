@@ -3,13 +3,21 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .baseline import Baseline
 from .docx import DOCXSchemaValidator
+from .parts import PARTS, PartCache
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .schemas import SCHEMAS, SchemaCache
 
 __all__ = [
     "BaseSchemaValidator",
+    "Baseline",
     "DOCXSchemaValidator",
+    "PARTS",
+    "PartCache",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "SCHEMAS",
+    "SchemaCache",
 ]
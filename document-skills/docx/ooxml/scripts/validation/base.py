@@ -2,11 +2,18 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
 import re
+import zipfile
 from pathlib import Path
 
 import lxml.etree
 
+from .baseline import Baseline
+from .parallel import validate_in_processes, worker_count
+from .parts import PARTS
+from .schemas import SCHEMAS
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,11 +110,23 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, baseline_dir=None, jobs=None
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Parts of previously validated documents are no longer needed
+        PARTS.retain(self.unpacked_dir)
+
+        # Worker processes for XSD validation (None: all cores, 1: in-process)
+        self.jobs = jobs
+
+        # Where the original's XSD errors are persisted (None: memoized in-process only)
+        self.baseline_dir = baseline_dir
+        self._baseline = None
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -124,6 +143,24 @@ class BaseSchemaValidator:
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def parse(self, xml_file):
+        """Return the shared parse of an XML file. Treat it as read-only."""
+        return PARTS.parse(xml_file)
+
+    def parse_copy(self, xml_file):
+        """Return a private copy of an XML file's tree, for checks that modify it."""
+        return PARTS.copy(xml_file)
+
+    def warm_schemas(self):
+        """Compile every schema in SCHEMA_MAPPINGS ahead of the first validation.
+
+        Compiled schemas are kept for the life of the process, so long-running
+        workers pay for compilation once. Returns the number that compiled.
+        """
+        return SCHEMAS.warm(
+            self.schemas_dir / path for path in sorted(set(self.SCHEMA_MAPPINGS.values()))
+        )
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -131,7 +168,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.parse(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -159,7 +196,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,10 +227,10 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_copy(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
+                # Remove all mc:AlternateContent elements from the (copied) tree
                 mc_elements = root.xpath(
                     ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
                 )
@@ -310,7 +347,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.parse(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -390,8 +427,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -411,7 +446,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.parse(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +469,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self.parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,7 +566,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +628,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.parse(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -673,7 +708,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +727,13 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        results = self._validate_files_against_xsd()
+        if self._baseline is not None:
+            # Persist the original's error sets once, not after every part
+            self._baseline.save()
+
+        for xml_file, (is_valid, new_file_errors) in zip(self.xml_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,7 +749,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -738,6 +775,19 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self):
+        """Return (is_valid, new_errors_set) for every XML file, in order.
+
+        Large packages are spread across worker processes (see parallel.py).
+        """
+        jobs = worker_count(self.jobs, len(self.xml_files))
+        if jobs == 1:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in self.xml_files
+            ]
+        return validate_in_processes(self, self.xml_files, jobs)
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -765,8 +815,7 @@ class BaseSchemaValidator:
     def _clean_ignorable_namespaces(self, xml_doc):
         """Remove attributes and elements not in allowed namespaces."""
         # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -823,24 +872,22 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, xml_doc=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        xml_doc is the already parsed file; by default it comes from the part cache.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process)
+            schema = SCHEMAS.get(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML (on a copy, the cached tree stays untouched)
+            if xml_doc is None:
+                xml_doc = self.parse(xml_file)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -866,6 +913,13 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    @property
+    def baseline(self):
+        """XSD errors of the original document's parts, computed once per original."""
+        if self._baseline is None:
+            self._baseline = Baseline(self.original_file, self.baseline_dir)
+        return self._baseline
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
@@ -875,33 +929,33 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        part_name = xml_file.relative_to(unpacked_dir).as_posix()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        return self.baseline.get(
+            part_name, lambda: self._validate_original_part(part_name)
+        )
 
-            if not original_xml_file.exists():
+    def _validate_original_part(self, part_name):
+        """XSD-validate one part read straight from the original zip."""
+        with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+            try:
+                content = zip_ref.read(part_name)
+            except KeyError:
                 # File didn't exist in original, so no original errors
                 return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        try:
+            original_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
+        except Exception as e:
+            return {str(e)}
+
+        is_valid, errors = self._validate_single_file_xsd(
+            self.original_file / part_name, self.original_file, original_doc
+        )
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -917,8 +971,7 @@ class BaseSchemaValidator:
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
         # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        xml_copy = copy.deepcopy(xml_doc.getroot())
 
         def process_text_content(text, content_type):
             if not text:
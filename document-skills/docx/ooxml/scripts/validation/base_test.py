@@ -0,0 +1,336 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import lxml.etree
+
+from validation import (
+    PARTS, SCHEMAS, DOCXSchemaValidator, PartCache, PPTXSchemaValidator, SchemaCache, baseline,
+    parallel,
+)
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W}" xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+        "<w:body>"
+        '<w:p><w:bookmarkStart w:id="0" w:name="start"/><w:r><w:t>Hello</w:t></w:r><w:bookmarkEnd w:id="0"/></w:p>'
+        '<mc:AlternateContent><mc:Choice Requires="w"><w:bookmarkStart w:id="0" w:name="choice"/></mc:Choice></mc:AlternateContent>'
+        "<w:p><w:r><w:t>World</w:t></w:r></w:p>"
+        "</w:body>"
+        "</w:document>"
+    ),
+}
+
+
+def pptx_parts(slides, broken=()):
+    """Parts of a synthetic deck; the .rels of slides in broken have an XSD error."""
+    parts = {}
+    for number in range(1, slides + 1):
+        parts[f"ppt/slides/slide{number}.xml"] = (
+            '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+            'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">'
+            '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+            "</p:nvGrpSpPr><p:grpSpPr/></p:spTree></p:cSld></p:sld>"
+        )
+        extra = ' Bogus="1"' if number in broken else ""
+        parts[f"ppt/slides/_rels/slide{number}.xml.rels"] = (
+            f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"{extra}>'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout" '
+            'Target="../slideLayouts/slideLayout1.xml"/>'
+            "</Relationships>"
+        )
+    return parts
+
+
+def write_package(directory, parts):
+    """Write parts to an unpacked directory and return the path of a matching .docx."""
+    directory = Path(directory)
+    unpacked = directory / "unpacked"
+    original = directory / "original.docx"
+    with zipfile.ZipFile(original, "w") as zf:
+        for name, content in parts.items():
+            path = unpacked / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            zf.writestr(name, content)
+    return unpacked, original
+
+
+class TestPartCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.unpacked, self.original = write_package(self.tmp.name, DOCX_PARTS)
+        PARTS.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def validate(self):
+        validator = DOCXSchemaValidator(self.unpacked, self.original)
+        with redirect_stdout(io.StringIO()):
+            return validator.validate()
+
+    def test_each_part_is_parsed_once(self):
+        parses = PARTS.parses
+        self.assertTrue(self.validate())
+        self.assertEqual(PARTS.parses - parses, len(DOCX_PARTS))
+
+        # A second run over the unchanged package reuses every parse
+        self.assertTrue(self.validate())
+        self.assertEqual(PARTS.parses - parses, len(DOCX_PARTS))
+
+    def test_only_the_current_document_is_kept(self):
+        self.assertTrue(self.validate())
+        self.assertEqual(len(PARTS), len(DOCX_PARTS))
+
+        other = Path(self.tmp.name) / "other"
+        other.mkdir()
+        unpacked, original = write_package(other, DOCX_PARTS)
+        validator = DOCXSchemaValidator(unpacked, original)
+        self.assertEqual(len(PARTS), 0)
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(validator.validate())
+        self.assertEqual(len(PARTS), len(DOCX_PARTS))
+
+    def test_changed_parts_are_reparsed(self):
+        cache = PartCache()
+        document = self.unpacked / "word" / "document.xml"
+        self.assertEqual(len(cache.parse(document).getroot().findall(f".//{{{W}}}p")), 2)
+
+        document.write_text(DOCX_PARTS["word/document.xml"].replace("World", "Everyone"))
+        stat = document.stat()
+        os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertIn(b"Everyone", lxml.etree.tostring(cache.parse(document)))
+        self.assertEqual(cache.parses, 2)
+
+    def test_copies_leave_the_shared_tree_alone(self):
+        document = self.unpacked / "word" / "document.xml"
+        copy = PARTS.copy(document)
+        body = copy.getroot()[0]
+        body.remove(body[0])
+        self.assertEqual(len(PARTS.parse(document).getroot()[0]), 3)
+
+    def test_syntax_errors_are_cached(self):
+        broken = self.unpacked / "word" / "broken.xml"
+        broken.write_text("<w:document><unclosed></w:document>")
+        cache = PartCache()
+        for _ in range(2):
+            with self.assertRaises(lxml.etree.XMLSyntaxError):
+                cache.parse(broken)
+        self.assertEqual(cache.parses, 1)
+
+    def test_cache_is_capped_by_file_size(self):
+        parts = []
+        for name in ("a", "b", "c"):
+            part = self.unpacked / f"{name}.xml"
+            part.write_text(f"<{name}>{' ' * 93}</{name}>")  # 100 bytes
+            parts.append(part)
+        a, b, c = parts
+        cache = PartCache(max_bytes=200)
+        for part in (a, b, a, c):  # b is the least recently used when c arrives
+            cache.parse(part)
+        self.assertEqual((len(cache), cache.bytes), (2, 200))
+        parses = cache.parses
+        cache.parse(a)
+        cache.parse(c)
+        self.assertEqual(cache.parses, parses)
+        cache.parse(b)
+        self.assertEqual(cache.parses, parses + 1)
+        self.assertLessEqual(cache.bytes, cache.max_bytes)
+
+        # A part larger than the cap is parsed on every read and never kept
+        cache = PartCache(max_bytes=99)
+        for _ in range(2):
+            cache.parse(a)
+        self.assertEqual((len(cache), cache.bytes, cache.parses), (0, 0, 2))
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.unpacked, self.original = write_package(self.tmp.name, DOCX_PARTS)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_schemas_compile_once_per_process(self):
+        validator = DOCXSchemaValidator(self.unpacked, self.original)
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(validator.validate_against_xsd())
+        compiles = SCHEMAS.compiles
+
+        # New errors send the part (and the original's copy) through XSD validation again
+        document = self.unpacked / "word" / "document.xml"
+        document.write_text(DOCX_PARTS["word/document.xml"].replace("</w:t>", "</w:t><w:bogus/>"))
+        validator = DOCXSchemaValidator(self.unpacked, self.original)
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(validator.validate_against_xsd())
+        self.assertEqual(SCHEMAS.compiles, compiles)
+
+    def test_warm_skips_schemas_that_do_not_compile(self):
+        cache = SchemaCache()
+        validator = DOCXSchemaValidator(self.unpacked, self.original)
+        broken = Path(self.tmp.name) / "broken.xsd"
+        broken.write_text('<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"><xs:element ref="missing"/></xs:schema>')
+        wml = validator.schemas_dir / validator.SCHEMA_MAPPINGS["word"]
+        self.assertEqual(cache.warm([wml, broken]), 1)
+        self.assertEqual(cache.warm([wml, broken]), 1)
+        self.assertEqual(cache.compiles, 2)
+        with self.assertRaises(lxml.etree.XMLSchemaParseError):
+            cache.get(broken)
+        self.assertEqual(cache.compiles, 2)
+
+
+class TestBaseline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # The original already has an XSD error, which edits may keep
+        parts = dict(DOCX_PARTS)
+        parts["word/document.xml"] = parts["word/document.xml"].replace("</w:t>", "</w:t><w:bogus/>")
+        self.unpacked, self.original = write_package(self.tmp.name, parts)
+        self.session = Path(self.tmp.name) / "session"
+        baseline._BASELINES.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def validator(self):
+        return DOCXSchemaValidator(self.unpacked, self.original, baseline_dir=self.session)
+
+    def test_original_errors_are_persisted_and_reused(self):
+        self.assertTrue(self.validator().validate_against_xsd())
+        [baseline_file] = self.session.glob("xsd-baseline-*.json")
+        data = json.loads(baseline_file.read_text())
+        self.assertEqual(data["original"], baseline.file_digest(self.original))
+        self.assertEqual(len(data["parts"]["word/document.xml"]), 1)
+
+        # A fresh process loads the persisted set instead of revalidating the original
+        baseline._BASELINES.clear()
+        validator = self.validator()
+        validator._validate_original_part = lambda part_name: self.fail(f"revalidated {part_name}")
+        self.assertTrue(validator.validate_against_xsd())
+
+    def test_saved_once_per_validation(self):
+        # Two parts that were already broken: two baseline misses, one write
+        directory = Path(self.tmp.name) / "two"
+        directory.mkdir()
+        parts = dict(DOCX_PARTS)
+        parts["word/document.xml"] = parts["word/other.xml"] = (
+            DOCX_PARTS["word/document.xml"].replace("</w:t>", "</w:t><w:bogus/>")
+        )
+        unpacked, original = write_package(directory, parts)
+        validator = DOCXSchemaValidator(unpacked, original, baseline_dir=self.session)
+        writes = []
+        save = validator.baseline.save
+        validator.baseline.save = lambda: writes.append(len(validator.baseline.errors)) or save()
+        self.assertTrue(validator.validate_against_xsd())
+        self.assertEqual(writes, [2])
+        self.assertFalse(validator.baseline.dirty)
+
+        # Nothing new to persist: the file is left alone
+        [baseline_file] = self.session.glob("xsd-baseline-*.json")
+        baseline_file.unlink()
+        validator.baseline.save()
+        self.assertFalse(baseline_file.exists())
+
+    def test_new_errors_are_still_reported(self):
+        self.assertTrue(self.validator().validate_against_xsd())
+        document = self.unpacked / "word" / "document.xml"
+        document.write_text(document.read_text().replace("</w:t>", "</w:t><w:bogus2/>"))
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertFalse(self.validator().validate_against_xsd())
+        self.assertIn("bogus2", output.getvalue())
+
+    def test_other_originals_are_not_mixed_up(self):
+        self.assertTrue(self.validator().validate_against_xsd())
+        with zipfile.ZipFile(self.original, "w") as zf:
+            for name, content in DOCX_PARTS.items():
+                zf.writestr(name, content)
+        # Same edited part, but this original had no errors
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(self.validator().validate_against_xsd())
+        self.assertEqual(len(list(self.session.glob("xsd-baseline-*.json"))), 2)
+
+
+class TestParallelValidation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        directory = Path(self.tmp.name)
+        self.unpacked, self.original = write_package(directory, pptx_parts(300, broken={7, 50, 250}))
+        # Slide 7 was already broken in the original
+        with zipfile.ZipFile(self.original, "w") as zf:
+            for name, content in pptx_parts(300, broken={7}).items():
+                zf.writestr(name, content)
+        self.session = directory / "session"
+        baseline._BASELINES.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def validate(self, jobs):
+        validator = PPTXSchemaValidator(
+            self.unpacked, self.original, verbose=True, baseline_dir=self.session, jobs=jobs
+        )
+        with redirect_stdout(io.StringIO()) as output:
+            valid = validator.validate_against_xsd()
+        return valid, output.getvalue()
+
+    def test_parallel_matches_sequential(self):
+        sequential = self.validate(jobs=1)
+        baseline._BASELINES.clear()
+        for baseline_file in self.session.glob("*.json"):
+            baseline_file.unlink()
+        parallel = self.validate(jobs=3)
+        self.assertEqual(parallel, sequential)
+
+        valid, output = parallel
+        self.assertFalse(valid)
+        self.assertIn("ppt/slides/_rels/slide50.xml.rels: 1 new error(s)", output)
+        self.assertIn("ppt/slides/_rels/slide250.xml.rels: 1 new error(s)", output)
+        self.assertNotIn("slide7.xml.rels", output)
+
+    def test_workers_original_errors_are_persisted(self):
+        self.validate(jobs=2)
+        [baseline_file] = self.session.glob("xsd-baseline-*.json")
+        parts = json.loads(baseline_file.read_text())["parts"]
+        self.assertEqual(
+            sorted(parts),
+            [f"ppt/slides/_rels/slide{n}.xml.rels" for n in (250, 50, 7)],
+        )
+        self.assertEqual(len(parts["ppt/slides/_rels/slide7.xml.rels"]), 1)
+        self.assertEqual(parts["ppt/slides/_rels/slide50.xml.rels"], [])
+
+    def test_workers_keep_no_parsed_parts(self):
+        validator = PPTXSchemaValidator(self.unpacked, self.original, baseline_dir=self.session)
+        PARTS.parse(self.unpacked / "ppt" / "slides" / "slide1.xml")
+        parallel._init_worker(validator)
+        self.assertEqual(len(PARTS), 0)
+        for number in (1, 50):
+            parallel._validate_part(self.unpacked / "ppt" / "slides" / "_rels" / f"slide{number}.xml.rels")
+            self.assertEqual(len(PARTS), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
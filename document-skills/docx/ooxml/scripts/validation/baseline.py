@@ -0,0 +1,97 @@
+"""
+Cache of the XSD errors already present in an original document.
+
+XSD validation only reports errors a part didn't have in the original
+document, so every part with errors needs the original part's error set. The
+original doesn't change during an edit session, so each part's set is
+computed once per original: memoized in the process by the original's SHA-256
+and, given a cache directory, persisted next to the session as JSON so later
+validations (and later processes) skip it entirely. New sets only mark the
+baseline dirty; the validator saves it once, after every part is validated.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+BASELINE_VERSION = 1
+
+# Original SHA-256 -> {part name: set of error messages}, shared by all validators
+_BASELINES = {}
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Baseline:
+    """Per-part XSD error sets of one original document."""
+
+    def __init__(self, original_file, cache_dir=None):
+        self.original_file = Path(original_file)
+        self.digest = file_digest(self.original_file)
+        self.path = (
+            Path(cache_dir) / f"xsd-baseline-{self.digest[:16]}.json"
+            if cache_dir
+            else None
+        )
+        self.errors = _BASELINES.setdefault(self.digest, {})
+        self.dirty = False  # Sets computed since the last save()
+        if self.path:
+            self._load()
+
+    def get(self, part_name, compute):
+        """Return the original errors of part_name, calling compute() on a miss."""
+        if part_name not in self.errors:
+            self.errors[part_name] = set(compute())
+            self.dirty = True
+        return self.errors[part_name]
+
+    def update(self, errors):
+        """Merge {part name: errors} computed elsewhere (e.g. in worker processes)."""
+        new = {part: set(e) for part, e in errors.items() if part not in self.errors}
+        if new:
+            self.errors.update(new)
+            self.dirty = True
+
+    def _load(self):
+        """Merge the persisted error sets for this original, if any."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # Missing or unreadable: recompute as needed
+        if data.get("version") != BASELINE_VERSION or data.get("original") != self.digest:
+            return
+        for part_name, errors in data.get("parts", {}).items():
+            self.errors.setdefault(part_name, set(errors))
+
+    def save(self):
+        """Persist the error sets (atomically) if any were added since the last save.
+
+        Does nothing without a cache directory.
+        """
+        if not self.path or not self.dirty:
+            return
+        data = {
+            "version": BASELINE_VERSION,
+            "original": self.digest,
+            "parts": {
+                part_name: sorted(errors)
+                for part_name, errors in sorted(self.errors.items())
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,93 @@
+"""
+Process pool for per-part XSD validation.
+
+Schema validation is CPU-bound, and a big presentation has hundreds of
+parts, so validate_against_xsd spreads them across worker processes. Each
+worker holds its own copy of the validator and its own compiled-schema cache
+(inherited warm when processes are forked). A worker reads each part once, so
+it starts with an empty part cache and empties it after every part: -j N
+holds N parts' trees, not N copies of the package. Results come back in part
+order, so the report is identical to a sequential run, and the original
+document's error sets the workers computed are merged into the parent's
+baseline, which is the only one that persists them.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .parts import PARTS
+
+# Small packages are validated in-process: process start-up, pickling the
+# validator and (for spawned workers) compiling each schema again, about
+# 0.1 s for wml.xsd, cost more than a few dozen parts take to validate
+MIN_PARALLEL_PARTS = 32
+
+# A .rels part validates in well under a millisecond but a large document.xml
+# can take seconds, so parts go out in small chunks that keep the other
+# workers busy while one is stuck on a big part
+CHUNKS_PER_WORKER = 4
+
+# The validator of the current worker process
+_validator = None
+
+
+def worker_count(jobs, part_count):
+    """Processes to validate part_count parts with (1 means in-process).
+
+    jobs is the validator's setting: None for one per core.
+    """
+    if part_count < MIN_PARALLEL_PARTS:
+        return 1
+    jobs = (os.cpu_count() or 1) if jobs is None else max(1, jobs)
+    return min(jobs, part_count)
+
+
+def _init_worker(validator):
+    global _validator
+    _validator = validator
+    _validator.baseline.path = None  # Only the parent writes the baseline file
+    _validator.warm_schemas()
+    PARTS.clear()  # Trees inherited from a forked parent
+
+
+def _validate_part(xml_file):
+    try:
+        is_valid, new_errors = _validator.validate_file_against_xsd(xml_file)
+    finally:
+        PARTS.clear()
+    part_name = xml_file.relative_to(_validator.unpacked_dir).as_posix()
+    original_errors = _validator.baseline.errors.get(part_name)
+    return (
+        is_valid,
+        sorted(new_errors),
+        sorted(original_errors) if original_errors is not None else None,
+    )
+
+
+def validate_in_processes(validator, xml_files, jobs):
+    """Return [(is_valid, new_errors_set)] for xml_files, computed across jobs processes."""
+    xml_files = list(xml_files)
+    if multiprocessing.get_start_method() == "fork":
+        # Compile once here; forked workers inherit the compiled schemas
+        validator.warm_schemas()
+    baseline = validator.baseline
+
+    chunksize = max(1, len(xml_files) // (jobs * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(validator,)
+    ) as pool:
+        results = list(pool.map(_validate_part, xml_files, chunksize=chunksize))
+
+    baseline.update(
+        {
+            xml_file.relative_to(validator.unpacked_dir).as_posix(): original_errors
+            for xml_file, (_, _, original_errors) in zip(xml_files, results)
+            if original_errors is not None
+        }
+    )
+    return [(is_valid, set(new_errors)) for is_valid, new_errors, _ in results]
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -843,8 +843,12 @@ class Document:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        # The original never changes, so its XSD errors are persisted in the session dir
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_docx,
+            verbose=False,
+            baseline_dir=self.temp_dir,
         )
         redlining_validator = RedliningValidator(
             self.unpacked_path, self.original_docx, verbose=False
@@ -2,30 +2,58 @@
 """
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
+Parts are streamed straight from the directory into the zip: XML parts are
+condensed event by event as they are parsed (see XMLRewriter), binary media is
+never parsed, and with --original, media that is unchanged from the original
+file is copied from it with its original compression, so stored images are
+not deflated again. Memory use doesn't grow with the size of the parts.
+
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--original <office_file>]
 """
 
 import argparse
+import io
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import xml.parsers.expat
 import zipfile
+import zlib
 from pathlib import Path
 
+from defusedxml import EntitiesForbidden, ExternalReferenceForbidden
+
+# Bytes read from a part (or written to one) at a time
+CHUNK_SIZE = 1 << 16
+
+# Parts with these suffixes are XML; everything else is copied as-is
+XML_SUFFIXES = (".xml", ".rels")
+
+# The part listing every content type goes first, where readers expect it
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--original",
+        help="Office file the directory was unpacked from; media files that are "
+        "unchanged are copied from it with their original compression",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            original=args.original,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +70,15 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, original=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        original: Optional Office file the directory was unpacked from; its
+            compressed media is reused for files that haven't changed
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,28 +91,43 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    files = sorted(
+        (f for f in input_dir.rglob("*") if f.is_file()),
+        key=lambda f: (f.relative_to(input_dir).as_posix() != CONTENT_TYPES_PART, f),
+    )
+
+    # Write next to the output and swap it in, so output_file may be the original
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = output_file.with_name(f".{output_file.name}.tmp")
+    source = zipfile.ZipFile(original, "r") if original else None
+    try:
+        with zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                if is_xml_part(arcname):
+                    # Remove pretty-printing whitespace while streaming into the zip
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    with open(f, "rb") as src, zf.open(
+                        zinfo, "w", force_zip64=zinfo.file_size > zipfile.ZIP64_LIMIT
+                    ) as dst:
+                        condense_xml(src, dst)
+                elif source and is_unchanged_member(f, source, arcname):
+                    copy_member(source, source.getinfo(arcname), zf)
+                else:
+                    zf.write(f, arcname)
+        os.replace(temp_file, output_file)
+    finally:
+        if source:
+            source.close()
+        if temp_file.exists():
+            temp_file.unlink()
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -130,29 +175,222 @@ def validate_document(doc_path):
             return False
 
 
-def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+def is_xml_part(name):
+    """Whether a part is XML (by name), as opposed to binary media."""
+    return name.lower().endswith(XML_SUFFIXES)
+
+
+def condense_xml(source, destination):
+    """Strip unnecessary whitespace and remove comments.
+
+    Streams XML from the binary file object source to destination as UTF-8.
+    """
+    XMLRewriter(destination, pretty=False).rewrite(source)
+
+
+def pretty_print_xml(source, destination):
+    """Indent XML, one node per line, streaming source to destination as ASCII."""
+    XMLRewriter(destination, pretty=True).rewrite(source)
+
+
+class XMLRewriter:
+    """Rewrite an XML document as expat parses it, condensed or pretty-printed.
+
+    Output follows the layout of minidom's toxml() and toprettyxml(indent="  "),
+    but nothing is held beyond the names of the open elements and the text
+    since the last tag. It differs from minidom's only where minidom loses
+    information or escapes more than needed, and parses to the same document:
+
+    - standalone is kept in the XML declaration
+    - newlines and tabs in attribute values are written as &#10; and &#9;
+      (minidom writes them raw, and they come back as spaces when parsed)
+    - carriage returns are written as &#13;
+    - '"' in text is written as is, not as &quot;
+
+    The two forms:
+
+    - condensed: whitespace-only text and comments are dropped, except within
+      ":t" (text run) elements; written as UTF-8
+    - pretty: every node on its own line, indented two spaces per level, with
+      elements holding only text kept on one line; written as ASCII with
+      character references
+    """
+
+    def __init__(self, destination, pretty=False):
+        self.pretty = pretty
+        self.newline = "\n" if pretty else ""
+        self.encoding = "ascii" if pretty else "UTF-8"
+        self.out = io.TextIOWrapper(
+            destination,
+            encoding=self.encoding,
+            errors="xmlcharrefreplace",
+            newline="",
+            write_through=False,
+        )
+        self.standalone = -1  # From the XML declaration (-1: not given)
+        self.declared = False
+        self.stack = []  # Names of the open elements
+        self.text = []  # Character data since the last markup
+        self.start_open = False  # The last start tag still lacks its ">"
+
+    def rewrite(self, source):
+        """Parse source (a binary file object) in chunks, writing as it goes."""
+        parser = xml.parsers.expat.ParserCreate()
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        parser.XmlDeclHandler = self.xml_decl
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.text.append
+        parser.CommentHandler = self.comment
+        parser.ProcessingInstructionHandler = self.processing_instruction
+        # Same protections as defusedxml
+        parser.EntityDeclHandler = _forbid_entity_decl
+        parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_decl
+        parser.ExternalEntityRefHandler = _forbid_external_entity_ref
+
+        while chunk := source.read(CHUNK_SIZE):
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+
+        self.out.flush()
+        self.out.detach()
+
+    def xml_decl(self, version, encoding, standalone):
+        self.standalone = standalone
+
+    def start_element(self, name, attributes):
+        self._begin_node()
+        attrs = "".join(
+            f' {attributes[i]}="{_escape_attribute(attributes[i + 1])}"'
+            for i in range(0, len(attributes), 2)
+        )
+        self.out.write(f"{self._indent()}<{name}{attrs}")
+        self.stack.append(name)
+        self.start_open = True
+
+    def end_element(self, name):
+        text = self._take_text()
+        if self.start_open:
+            # No child nodes, or just this text: keep it on one line
+            self.start_open = False
+            self.stack.pop()
+            if text:
+                self.out.write(f">{_escape_text(text)}</{name}>{self.newline}")
+            else:
+                self.out.write(f"/>{self.newline}")
+        else:
+            self._write_text(text)
+            self.stack.pop()
+            self.out.write(f"{self._indent()}</{name}>{self.newline}")
+
+    def comment(self, data):
+        if self.pretty or not self.stack or self.stack[-1].endswith(":t"):
+            self._begin_node()
+            self.out.write(f"{self._indent()}<!--{data}-->{self.newline}")
+        else:
+            # Dropped, but the text before it is a node of its own
+            self._write_text(self._take_text())
+
+    def processing_instruction(self, target, data):
+        self._begin_node()
+        self.out.write(f"{self._indent()}<?{target} {data}?>{self.newline}")
+
+    def _begin_node(self):
+        """Write everything pending before a new child node."""
+        if not self.declared:
+            standalone = {1: ' standalone="yes"', 0: ' standalone="no"'}.get(
+                self.standalone, ""
+            )
+            self.out.write(
+                f'<?xml version="1.0" encoding="{self.encoding}"{standalone}?>{self.newline}'
+            )
+            self.declared = True
+        self._write_text(self._take_text())
+        self._close_start_tag()
+
+    def _take_text(self):
+        """Return (and forget) the pending text, or "" if it is to be dropped."""
+        text = "".join(self.text)
+        self.text.clear()
+        if text and not self.pretty and not text.strip():
+            if not (self.stack and self.stack[-1].endswith(":t")):
+                return ""
+        return text
+
+    def _write_text(self, text):
+        if text:
+            self._close_start_tag()
+            self.out.write(f"{self._indent()}{_escape_text(text)}{self.newline}")
+
+    def _close_start_tag(self):
+        if self.start_open:
+            self.out.write(f">{self.newline}")
+            self.start_open = False
+
+    def _indent(self):
+        return "  " * len(self.stack) if self.pretty else ""
+
+
+def _escape_text(text):
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\r", "&#13;")
+    )
+
+
+def _escape_attribute(value):
+    # Escape whitespace that parsing would otherwise normalize to spaces
+    return (
+        _escape_text(value)
+        .replace('"', "&quot;")
+        .replace("\n", "&#10;")
+        .replace("\t", "&#9;")
+    )
+
+
+def _forbid_entity_decl(name, is_parameter_entity, value, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_decl(name, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_entity_ref(context, base, sysid, pubid):
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+
+def is_unchanged_member(path, source, arcname):
+    """Whether file path has the same size and CRC-32 as member arcname of source."""
+    try:
+        info = source.getinfo(arcname)
+    except KeyError:
+        return False
+    if info.file_size != path.stat().st_size:
+        return False
+
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc == info.CRC
+
+
+def copy_member(source, info, target):
+    """Copy a member from zip source into zip target, keeping its compression and timestamp.
+
+    Streams through the public zipfile API, so a stored member (most images)
+    is copied without compressing it, and nothing is held in memory.
+    """
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.file_size = info.file_size  # Lets target.open() pick ZIP64 up front
+    with source.open(info) as src, target.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, CHUNK_SIZE)
 
 
 if __name__ == "__main__":
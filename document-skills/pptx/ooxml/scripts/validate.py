@@ -24,6 +24,19 @@ def main():
         required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "--baseline-dir",
+        help="Directory to persist the original file's XSD errors in, so repeat "
+        "validations against the same original skip recomputing them",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for XSD validation of large packages "
+        "(default: all cores, 1 = sequential)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -55,7 +68,16 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if V is RedliningValidator:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        else:
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                baseline_dir=args.baseline_dir,
+                jobs=args.jobs,
+            )
         if not validator.validate():
             success = False
 
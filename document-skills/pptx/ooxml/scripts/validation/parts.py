@@ -0,0 +1,102 @@
+"""
+Process-wide cache of parsed package parts.
+
+Every validator and every check reads XML parts through PARTS, so each part is
+parsed once per process no matter how many rules look at it. Entries are keyed
+by path and invalidated when the file's mtime or size changes, so a document
+that is edited and validated again only reparses the parts that changed.
+Validators retain() only the document they check, so a long-lived process
+holds the trees of one document rather than of every document it has seen.
+
+A parsed tree takes 10-20 times the size of its file, so the cache is also
+capped by the total size of the files it holds: the least recently used parts
+are dropped past max_bytes, and a part larger than max_bytes is never kept.
+Documents within the cap are parsed once; larger ones reparse what was dropped.
+"""
+
+import copy
+import os
+from collections import OrderedDict
+
+import lxml.etree
+
+# Total file size of the cached parts (a few hundred MB of trees)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class PartCache:
+    """Parsed XML parts keyed by path, invalidated when the file changes.
+
+    Trees handed out by parse() are shared by every check that reads the part:
+    treat them as read-only, and use copy() for checks that modify the tree.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        # path -> ((mtime_ns, size), ElementTree or XMLSyntaxError), least recently used first
+        self._parts = OrderedDict()
+        self.max_bytes = max_bytes
+        self.bytes = 0  # Total file size of the cached parts
+        self.parses = 0  # Number of files actually parsed
+
+    def parse(self, xml_file):
+        """Return the parsed ElementTree of a part.
+
+        Raises lxml.etree.XMLSyntaxError (the same one every time) for
+        malformed files, and OSError for missing ones, like lxml.etree.parse.
+        """
+        key = os.fspath(xml_file)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._parts.get(key)
+        if entry is not None and entry[0] == stamp:
+            self._parts.move_to_end(key)
+        else:
+            try:
+                result = lxml.etree.parse(key)
+            except lxml.etree.XMLSyntaxError as e:
+                result = e
+            self.parses += 1
+            entry = (stamp, result)
+            self._discard(key)
+            if stat.st_size <= self.max_bytes:
+                self._parts[key] = entry
+                self.bytes += stat.st_size
+                while self.bytes > self.max_bytes:
+                    self._discard(next(iter(self._parts)))
+
+        result = entry[1]
+        if isinstance(result, lxml.etree.XMLSyntaxError):
+            raise result.with_traceback(None)
+        return result
+
+    def copy(self, xml_file):
+        """Return a private copy of a part's tree that the caller may modify."""
+        return copy.deepcopy(self.parse(xml_file))
+
+    def retain(self, document_dir):
+        """Drop every cached part that isn't under document_dir."""
+        prefix = os.path.join(os.fspath(document_dir), "")
+        for key in [key for key in self._parts if not key.startswith(prefix)]:
+            self._discard(key)
+
+    def clear(self):
+        """Drop every cached part."""
+        self._parts.clear()
+        self.bytes = 0
+
+    def _discard(self, key):
+        entry = self._parts.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[0][1]
+
+    def __len__(self):
+        return len(self._parts)
+
+
+# Shared by all validators in the process
+PARTS = PartCache()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,69 @@
+"""
+Process-wide cache of compiled XSD schemas.
+
+The main OOXML schemas (wml.xsd, pml.xsd, ...) import dozens of other schemas,
+so compiling one costs far more than validating a part against it. SCHEMAS
+compiles each schema the first time it is needed and keeps it for the life of
+the process, across parts, documents and validator instances. Long-running
+workers (edit sessions, validation pools) can call warm() up front so the
+first validation doesn't pay for compilation.
+"""
+
+import os
+
+import lxml.etree
+
+
+class SchemaCache:
+    """Compiled lxml XMLSchema objects keyed by schema path."""
+
+    def __init__(self):
+        self._schemas = {}
+        self.compiles = 0  # Number of schemas actually compiled
+
+    def get(self, schema_path):
+        """Return the compiled schema at schema_path, compiling it on first use.
+
+        Raises lxml.etree.XMLSchemaParseError if the schema doesn't compile
+        (some shipped schemas don't resolve every import); the failure is
+        cached too, so it is only attempted once.
+        """
+        key = os.fspath(schema_path)
+        schema = self._schemas.get(key)
+        if schema is None:
+            try:
+                with open(key, "rb") as xsd_file:
+                    parser = lxml.etree.XMLParser()
+                    xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            except lxml.etree.XMLSchemaParseError as e:
+                schema = e
+            self._schemas[key] = schema
+            self.compiles += 1
+
+        if isinstance(schema, lxml.etree.XMLSchemaParseError):
+            raise schema.with_traceback(None)
+        return schema
+
+    def warm(self, schema_paths):
+        """Compile every schema in schema_paths now. Returns the number that compiled."""
+        compiled = 0
+        for schema_path in schema_paths:
+            try:
+                self.get(schema_path)
+                compiled += 1
+            except lxml.etree.XMLSchemaParseError:
+                continue  # Reported when a part is validated against it
+        return compiled
+
+    def clear(self):
+        """Drop every compiled schema."""
+        self._schemas.clear()
+
+
+# Shared by all validators in the process
+SCHEMAS = SchemaCache()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Inside this repository the checks come from tools/skill_lint.py (the
+"skill-creator" profile), which parses the frontmatter as YAML. When the
+skill is used on its own, the built-in checks below are used instead.
 """
 
 import sys
@@ -8,6 +12,15 @@ import os
 import re
 from pathlib import Path
 
+# tools/ of the repository this skill lives in (absent when installed on its own)
+_TOOLS_DIR = Path(__file__).resolve().parent.parent.parent / 'tools'
+if (_TOOLS_DIR / 'skill_lint.py').exists():
+    sys.path.insert(0, str(_TOOLS_DIR))
+    from skill_lint import SkillLinter, load_document
+else:
+    SkillLinter = None
+
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -17,6 +30,17 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
     
+    if SkillLinter is not None:
+        errors = SkillLinter('skill-creator').lint(load_document(skill_md))
+        if errors:
+            return False, errors[0].message
+        return True, "Skill is valid!"
+
+    return _validate_standalone(skill_md)
+
+
+def _validate_standalone(skill_md):
+    """Checks used when the skill is installed without the repository tools"""
     # Read and validate frontmatter
     content = skill_md.read_text()
     if not content.startswith('---'):
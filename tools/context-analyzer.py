@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Context Analyzer - Prompt sizes and context-window fit across the universal tree.
+
+Tokenizes every universal skill's system-prompt.md (plus tools-schema.json
+for Tier 2, since tool definitions are sent with every request) and reports
+the real token counts, the smallest common context window each skill fits in
+with room for a response, which window sizes it overflows, and a size
+histogram. Use it to route each skill to the smallest model that can hold
+it, and with --check to catch metadata.yaml requirements that are out of
+date. See skill_tokens.py for the tokenizers.
+"""
+
+import sys
+import json
+import yaml
+import argparse
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from skill_matrix import expand_skills
+from skill_pool import map_in_processes
+from skill_tokens import (
+    COMMON_WINDOWS, DEFAULT_RESPONSE_TOKENS, DEFAULT_TOKENIZER, analyze_skill, get_tokenizer,
+    histogram, render_histogram,
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+UNIVERSAL_DIR = REPO_ROOT / "universal"
+DEFAULT_SKILLS = [
+    str(UNIVERSAL_DIR / "tier-1-instruction-only"),
+    str(UNIVERSAL_DIR / "tier-2-tool-enhanced"),
+]
+
+# Prompt size buckets (tokens) for the histogram
+HISTOGRAM_EDGES = [500, 1000, 2000, 4000, 8000, 16000, 32000]
+
+
+def recorded_requirements(skill_dir: Path) -> Dict:
+    """The requirements section of a skill's metadata.yaml ({} if missing)"""
+    try:
+        with open(Path(skill_dir) / "metadata.yaml", 'r', encoding='utf-8') as f:
+            requirements = (yaml.safe_load(f) or {}).get("requirements")
+    except (OSError, yaml.YAMLError, AttributeError):
+        return {}
+    return requirements if isinstance(requirements, dict) else {}
+
+
+def analyze(skill_dirs: List[Path], tokenizer: str, response_tokens: int,
+            windows: List[int], jobs: Optional[int] = None) -> List[Dict]:
+    """analyze_skill() for every skill, largest first, with the recorded requirements"""
+    results = map_in_processes(
+        partial(analyze_skill, tokenizer_spec=tokenizer, response_tokens=response_tokens, windows=windows),
+        skill_dirs, jobs)
+    for skill_dir, result in zip(skill_dirs, results):
+        recorded = recorded_requirements(skill_dir)
+        result["recorded_min_context_window"] = recorded.get("min_context_window")
+        result["recorded_recommended_context_window"] = recorded.get("recommended_context_window")
+        result["stale"] = (recorded.get("min_context_window") != result["min_context_window"] or
+                           recorded.get("recommended_context_window") != result["recommended_context_window"])
+    return sorted(results, key=lambda r: (-r["total_tokens"], r["skill"]))
+
+
+def print_report(results: List[Dict], windows: List[int], tokenizer: str, response_tokens: int,
+                 max_window: Optional[int]):
+    print(f"Context analysis: {len(results)} skills, tokenizer {tokenizer}, "
+          f"{response_tokens} tokens reserved for the response")
+    print("=" * 78)
+    print(f"{'Skill':<34} {'Tier':<5} {'Prompt':>7} {'Tools':>6} {'Total':>7} {'Min':>7} {'Rec':>7}  Metadata")
+    for r in results:
+        tier = r["tier"].split("-")[1] if r["tier"].startswith("tier-") else "?"
+        recorded = r["recorded_min_context_window"]
+        note = "stale" if r["stale"] else "ok"
+        if r["stale"] and recorded:
+            note = f"stale (min {recorded})"
+        flag = " ⚠" if max_window and r["min_context_window"] > max_window else ""
+        print(f"{r['skill'][:34]:<34} {tier:<5} {r['system_prompt_tokens']:>7} {r['tool_schema_tokens']:>6} "
+              f"{r['total_tokens']:>7} {r['min_context_window']:>7} {r['recommended_context_window']:>7}  "
+              f"{note}{flag}")
+
+    print("\nOverflows (prompt + response larger than the window):")
+    for window in windows:
+        over = [r["skill"] for r in results if window in r["overflows"]]
+        names = ", ".join(over[:5]) + (f", ... (+{len(over) - 5})" if len(over) > 5 else "")
+        print(f"  {window:>7}: {len(over):>3} skills" + (f"  {names}" if over else ""))
+
+    print("\nPrompt size histogram (total tokens):")
+    print(render_histogram(histogram([r["total_tokens"] for r in results], HISTOGRAM_EDGES)))
+
+    print("\nSmallest window per skill:")
+    for window in sorted({r["min_context_window"] for r in results}):
+        count = sum(1 for r in results if r["min_context_window"] == window)
+        print(f"  {window:>7}: {count} skills")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analyze universal skill prompt sizes against model context windows"
+    )
+    parser.add_argument(
+        "skills",
+        nargs="*",
+        help="Skill directories, tier directories or globs (default: Tier 1 and Tier 2)"
+    )
+    parser.add_argument(
+        "--tokenizer",
+        default=DEFAULT_TOKENIZER,
+        help="approx, chars[:N], tiktoken[:ENCODING] or hf:NAME "
+             f"(default: {DEFAULT_TOKENIZER}, as used by convert.py)"
+    )
+    parser.add_argument(
+        "--response-tokens",
+        type=int,
+        default=DEFAULT_RESPONSE_TOKENS,
+        help=f"Tokens to reserve for the response (default: {DEFAULT_RESPONSE_TOKENS})"
+    )
+    parser.add_argument(
+        "--windows",
+        default=",".join(str(w) for w in COMMON_WINDOWS),
+        help="Comma-separated context window sizes to check (default: common sizes 2048-200000)"
+    )
+    parser.add_argument(
+        "--max-window",
+        type=int,
+        help="Flag skills that need more than this window and exit 1 if there are any"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit 1 if any metadata.yaml records different context requirements"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: all cores, 1 = sequential)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Report format (default: text)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Write the JSON report to a file instead of stdout"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        windows = sorted({int(w) for w in args.windows.split(",") if w.strip()})
+        if not windows:
+            raise ValueError("--windows needs at least one size")
+        get_tokenizer(args.tokenizer)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    skill_dirs = expand_skills(args.skills or DEFAULT_SKILLS)
+    if not skill_dirs:
+        print("Error: No skills with a system-prompt.md matched")
+        return 1
+
+    results = analyze(skill_dirs, args.tokenizer, args.response_tokens, windows, jobs=args.jobs)
+
+    if args.format == "json":
+        report = json.dumps({
+            "tokenizer": get_tokenizer(args.tokenizer).name,
+            "response_tokens": args.response_tokens,
+            "windows": windows,
+            "histogram": dict(histogram([r["total_tokens"] for r in results], HISTOGRAM_EDGES)),
+            "skills": results,
+        }, indent=2) + "\n"
+        if args.output:
+            Path(args.output).write_text(report, encoding='utf-8')
+        else:
+            sys.stdout.write(report)
+    else:
+        print_report(results, windows, get_tokenizer(args.tokenizer).name, args.response_tokens, args.max_window)
+
+    failed = False
+    if args.max_window:
+        too_large = [r for r in results if r["min_context_window"] > args.max_window]
+        if too_large:
+            print(f"\n❌ {len(too_large)} skills need more than a {args.max_window}-token window",
+                  file=sys.stderr)
+            failed = True
+    if args.check:
+        stale = [r for r in results if r["stale"]]
+        if stale:
+            print(f"\n❌ {len(stale)} skills have out-of-date context requirements in metadata.yaml "
+                  f"(reconvert with convert.py --tokenizer {args.tokenizer})", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
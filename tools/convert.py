@@ -10,37 +10,141 @@ Key principles:
 - Universal format is DERIVED from original skills
 - Re-runnable: Can regenerate universal format at any time
 - Tracks which original skill each universal skill came from
+- Incremental: a manifest records each skill's inputs and outputs, so only
+  stale skills are reconverted and unchanged files are never rewritten
+- Tier 2 tool schemas are extracted from the scripts' syntax trees and cached
+  by script content hash
+- Context window requirements come from the rendered prompt's token count
+  (see skill_tokens.py; --tokenizer picks the tokenizer)
 """
 
 import os
-import re
 import json
+import hashlib
 import yaml
 import argparse
 from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
+from skill_pool import MIN_PARALLEL_ITEMS, default_jobs
+from skill_rewrite import CLAUDE_SPECIFIC, claude_language
+from skill_tokens import DEFAULT_RESPONSE_TOKENS, DEFAULT_TOKENIZER, context_requirements, get_tokenizer
+from skill_tool_schema import ToolSchemaCache, script_tool
+
 # Directories
 REPO_ROOT = Path(__file__).parent.parent
 UNIVERSAL_DIR = REPO_ROOT / "universal"
 TIER1_DIR = UNIVERSAL_DIR / "tier-1-instruction-only"
 TIER2_DIR = UNIVERSAL_DIR / "tier-2-tool-enhanced"
 TIER3_DIR = UNIVERSAL_DIR / "tier-3-claude-only"
+MANIFEST_PATH = UNIVERSAL_DIR / ".convert-manifest.json"
+TOOL_CACHE_PATH = UNIVERSAL_DIR / ".tool-schema-cache.json"
+
+# Bump whenever the rendered output changes so every skill is reconverted
+CONVERTER_VERSION = 6
+
+# Files under scripts/ that never affect the conversion
+IGNORED_SCRIPT_PARTS = {"__pycache__", ".DS_Store"}
+
+
+def file_digest(path: Path) -> str:
+    """Hex SHA-256 of a file's contents"""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def tree_digest(path: Path) -> str:
+    """Hex SHA-256 over the names and contents of every file under a directory
+
+    Returns an empty string when the directory does not exist, so adding or
+    removing scripts/ (which changes the tier) is also detected.
+    """
+    if not path.is_dir():
+        return ""
+    digest = hashlib.sha256()
+    for file in sorted(path.rglob("*")):
+        relative = file.relative_to(path)
+        if not file.is_file() or IGNORED_SCRIPT_PARTS.intersection(relative.parts):
+            continue
+        digest.update(relative.as_posix().encode("utf-8") + b"\0")
+        digest.update(file_digest(file).encode("ascii") + b"\0")
+    return digest.hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write ``content`` unless the file already holds it; True if written"""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+class ConversionManifest:
+    """Inputs and outputs of the last conversion of each skill
+
+    Each entry (keyed by the skill's path relative to the repository) holds
+    the SKILL.md hash, the scripts/ tree hash, the converter version, the
+    tier, the files written and the ``last_sync`` date stamped into them.
+    """
+    
+    def __init__(self, path: Optional[Path] = MANIFEST_PATH):
+        # path=None gives an empty, in-memory manifest
+        self.path = path
+        self.skills: Dict[str, Dict] = {}
+        if path is not None and path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.skills = json.load(f).get("skills", {})
+            except (OSError, json.JSONDecodeError):
+                self.skills = {}
+    
+    def get(self, key: str) -> Optional[Dict]:
+        return self.skills.get(key)
+    
+    def is_fresh(self, key: str, inputs: Dict) -> bool:
+        """True if the skill's inputs are unchanged and all its outputs exist"""
+        entry = self.skills.get(key)
+        if not entry or any(entry.get(k) != v for k, v in inputs.items()):
+            return False
+        return all((REPO_ROOT / output).exists() for output in entry["outputs"])
+    
+    def save(self):
+        """Atomically write the manifest (sorted, one entry field per line)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.path, json.dumps({"skills": self.skills}, indent=2, sort_keys=True) + "\n")
 
 
 class SkillConverter:
     """Converts Claude skills to universal format"""
     
-    def __init__(self, dry_run=False):
+    def __init__(self, dry_run=False, incremental=False, manifest: Optional[ConversionManifest] = None,
+                 tool_cache: Optional[ToolSchemaCache] = None, tokenizer: str = DEFAULT_TOKENIZER):
         self.dry_run = dry_run
+        self.incremental = incremental
+        self.manifest = manifest if manifest is not None else ConversionManifest()
+        self.tool_cache = tool_cache if tool_cache is not None else ToolSchemaCache(TOOL_CACHE_PATH)
+        self.tokenizer = get_tokenizer(tokenizer)
         self.stats = {
             "tier1": 0,
             "tier2": 0,
             "tier3": 0,
             "skipped": 0,
-            "errors": 0
+            "errors": 0,
+            "files_written": 0,
+            "files_unchanged": 0,
+            "files_removed": 0
         }
+        # Rewrite-rule match counts across all converted skills
+        self.rewrite_stats: Counter = Counter()
     
     def find_skills(self) -> List[Path]:
         """Find all SKILL.md files in the repository"""
@@ -79,29 +183,24 @@ class SkillConverter:
         
         return frontmatter, body
     
-    def classify_skill(self, skill_path: Path, frontmatter: Dict, content: str) -> int:
+    def classify_skill(self, skill_path: Path, frontmatter: Dict, content: str,
+                       matches: Optional[Counter] = None) -> int:
         """
         Classify skill into tiers:
         1 = Instruction-only
         2 = Tool-enhanced
         3 = Claude-only
+        
+        ``matches`` are rewrite-rule match counts for ``content`` from an
+        earlier claude_language pass; the content is scanned when omitted.
         """
         # Check for scripts directory
         has_scripts = (skill_path / "scripts").exists()
         
-        # Check for Claude-specific features
-        claude_specific_patterns = [
-            r'claude\.ai',
-            r'artifacts?',
-            r'MCP server',
-            r'Model Context Protocol',
-            r'canvas',
-        ]
-        
-        is_claude_specific = any(
-            re.search(pattern, content, re.IGNORECASE)
-            for pattern in claude_specific_patterns
-        )
+        # Check for Claude-specific features (claude.ai, artifacts, MCP, canvas)
+        if matches is None:
+            matches = claude_language.scan(content)
+        is_claude_specific = claude_language.has_tag(matches, CLAUDE_SPECIFIC)
         
         # Classification logic
         if is_claude_specific and not has_scripts:
@@ -115,29 +214,18 @@ class SkillConverter:
             return 1
     
     def remove_claude_language(self, content: str) -> str:
-        """Remove Claude-specific language from content"""
-        replacements = [
-            (r'\bClaude should\b', 'The assistant should'),
-            (r'\bClaude can\b', 'The assistant can'),
-            (r'\bClaude will\b', 'The assistant will'),
-            (r'\bClaude\b', 'The assistant'),
-            (r'\bclaude\.ai\b', 'your AI interface'),
-            (r'\bClaude Code\b', 'your development environment'),
-            (r'\bthis skill\b', 'these instructions'),
-        ]
-        
-        result = content
-        for pattern, replacement in replacements:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
-        return result
+        """Remove Claude-specific language from content (one pass, see skill_rewrite)"""
+        return claude_language.rewrite(content)[0]
     
-    def convert_tier1_skill(self, skill_path: Path, frontmatter: Dict, content: str) -> Dict:
+    def convert_tier1_skill(self, skill_path: Path, frontmatter: Dict, content: str,
+                            last_sync: Optional[str] = None,
+                            universal_content: Optional[str] = None) -> Dict:
         """Convert a Tier 1 (instruction-only) skill"""
         skill_name = skill_path.name
         
-        # Clean content
-        universal_content = self.remove_claude_language(content)
+        # Clean content (unless already cleaned by the caller)
+        if universal_content is None:
+            universal_content = self.remove_claude_language(content)
         
         # Create system prompt
         system_prompt = f"""# {frontmatter.get('name', skill_name).replace('-', ' ').title()}
@@ -155,13 +243,12 @@ class SkillConverter:
             "version": "1.0",
             "source": {
                 "original_path": str(skill_path.relative_to(REPO_ROOT)),
-                "last_sync": datetime.now().isoformat()[:10],
+                "last_sync": last_sync or datetime.now().isoformat()[:10],
                 "upstream_repo": "anthropics/skills"
             },
             "requirements": {
                 "tool_calling": False,
-                "min_context_window": 4096,
-                "recommended_context_window": 8192
+                **self.context_requirements(system_prompt)
             },
             "compatibility": {
                 "tested_providers": ["openrouter", "ollama"],
@@ -189,7 +276,7 @@ class SkillConverter:
                 }
             ],
             "temperature": 0.7,
-            "max_tokens": 2000
+            "max_tokens": DEFAULT_RESPONSE_TOKENS
         }
         
         return {
@@ -198,43 +285,34 @@ class SkillConverter:
             "api_example": api_example
         }
     
-    def convert_tier2_skill(self, skill_path: Path, frontmatter: Dict, content: str) -> Dict:
+    def convert_tier2_skill(self, skill_path: Path, frontmatter: Dict, content: str,
+                            last_sync: Optional[str] = None,
+                            universal_content: Optional[str] = None) -> Dict:
         """Convert a Tier 2 (tool-enhanced) skill"""
         # Start with Tier 1 conversion
-        result = self.convert_tier1_skill(skill_path, frontmatter, content)
+        result = self.convert_tier1_skill(skill_path, frontmatter, content, last_sync, universal_content)
         result["metadata"]["tier"] = 2
         result["metadata"]["requirements"]["tool_calling"] = True
         
-        # Analyze scripts to create tool schema
+        # Analyze scripts to create tool schema (parameters, types, defaults,
+        # docstrings and argparse options; unchanged scripts come from the cache)
         scripts_dir = skill_path / "scripts"
         tools = []
         
         if scripts_dir.exists():
-            for script_file in scripts_dir.glob("*.py"):
-                # Parse script to extract function info (basic heuristic)
-                with open(script_file, 'r', encoding='utf-8') as f:
-                    script_content = f.read()
-                
-                # Look for function definitions
-                func_pattern = r'def\s+(\w+)\s*\((.*?)\):'
-                matches = re.findall(func_pattern, script_content)
-                
-                for func_name, params in matches:
-                    if not func_name.startswith('_'):  # Skip private functions
-                        tools.append({
-                            "type": "function",
-                            "function": {
-                                "name": func_name,
-                                "description": f"Function from {script_file.name}",
-                                "parameters": {
-                                    "type": "object",
-                                    "properties": {},
-                                    "required": []
-                                }
-                            }
-                        })
+            for script_file in sorted(scripts_dir.glob("*.py")):
+                # Package markers, private modules and test suites are not tools
+                stem = script_file.stem
+                if stem.startswith("_") or stem.endswith("_test") or stem.startswith("test_"):
+                    continue
+                tools.extend(self.tool_cache.tools_for(script_file))
+            for script_file in sorted(scripts_dir.glob("*.sh")):
+                tools.append(script_tool(script_file.name))
         
         result["tools_schema"] = tools
+        # Tool definitions are sent with every request, so they need room too
+        result["metadata"]["requirements"].update(self.context_requirements(
+            result["system_prompt"], json.dumps(tools, indent=2)))
         
         # Create manual fallback version
         manual_version = f"""# {result['metadata']['name']} - Manual Version
@@ -247,7 +325,9 @@ For models without tool calling support, follow these manual instructions:
 ## Manual Workflow
 
 {content}
-
+"""
+        if tools:
+            manual_version += f"""
 ## Note
 If your model supports tool calling, use the tools-schema.json file for better integration.
 Available tools: {', '.join([t['function']['name'] for t in tools])}
@@ -257,7 +337,15 @@ Available tools: {', '.join([t['function']['name'] for t in tools])}
         
         return result
     
-    def convert_tier3_skill(self, skill_path: Path, frontmatter: Dict, content: str) -> Dict:
+    def context_requirements(self, *texts: str) -> Dict:
+        """Token count and min/recommended context windows for prompt texts"""
+        prompt_tokens = sum(self.tokenizer.count(text) for text in texts)
+        requirements = context_requirements(prompt_tokens)
+        requirements["tokenizer"] = self.tokenizer.name
+        return requirements
+    
+    def convert_tier3_skill(self, skill_path: Path, frontmatter: Dict, content: str,
+                            last_sync: Optional[str] = None) -> Dict:
         """Convert a Tier 3 (Claude-only) skill - mostly documentation"""
         skill_name = skill_path.name
         
@@ -298,7 +386,7 @@ To use this skill, please refer to the original version in the repository root:
                 "version": "1.0",
                 "source": {
                     "original_path": str(skill_path.relative_to(REPO_ROOT)),
-                    "last_sync": datetime.now().isoformat()[:10]
+                    "last_sync": last_sync or datetime.now().isoformat()[:10]
                 },
                 "compatibility": {
                     "claude_only": True,
@@ -307,84 +395,189 @@ To use this skill, please refer to the original version in the repository root:
             }
         }
     
-    def write_converted_skill(self, tier: int, skill_name: str, converted: Dict):
-        """Write converted skill to universal directory"""
-        # Determine output directory
+    def render_converted_skill(self, tier: int, converted: Dict) -> Dict[str, str]:
+        """Render a converted skill to its output files (file name -> content)"""
+        files = {}
+        
+        if tier in [1, 2]:
+            files["system-prompt.md"] = converted["system_prompt"]
+            files["metadata.yaml"] = yaml.dump(converted["metadata"], default_flow_style=False, sort_keys=False)
+            
+            # Update api_example to use actual system prompt content
+            converted["api_example"]["messages"][0]["content"] = f"[Content from system-prompt.md]"
+            files["api-example.json"] = json.dumps(converted["api_example"], indent=2)
+        
+        if tier == 2:
+            # A skill whose scripts/ holds no scripts has no tools to describe
+            if converted["tools_schema"]:
+                files["tools-schema.json"] = json.dumps(converted["tools_schema"], indent=2)
+            files["manual-version.md"] = converted["manual_version"]
+        
+        if tier == 3:
+            files["README.md"] = converted["readme"]
+            files["metadata.yaml"] = yaml.dump(converted["metadata"], default_flow_style=False, sort_keys=False)
+        
+        return files
+    
+    def output_dir(self, tier: int, skill_name: str) -> Path:
+        """Universal directory a skill of the given tier is written to"""
         if tier == 1:
-            output_dir = TIER1_DIR / skill_name
+            return TIER1_DIR / skill_name
         elif tier == 2:
-            output_dir = TIER2_DIR / skill_name
+            return TIER2_DIR / skill_name
         else:
-            output_dir = TIER3_DIR / skill_name
+            return TIER3_DIR / skill_name
+    
+    def tested_compatibility(self, tier: int, skill_name: str) -> Optional[Dict]:
+        """The compatibility section model-tester.py --matrix recorded, if any
+        
+        Measured results are kept across reconversions instead of being reset
+        to the defaults.
+        """
+        metadata_path = self.output_dir(tier, skill_name) / "metadata.yaml"
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                compatibility = (yaml.safe_load(f) or {}).get("compatibility")
+        except (OSError, yaml.YAMLError, AttributeError):
+            return None
+        if isinstance(compatibility, dict) and "last_tested" in compatibility:
+            return compatibility
+        return None
+    
+    def write_converted_skill(self, tier: int, skill_name: str, files: Dict[str, str]) -> List[str]:
+        """Write rendered skill files to universal directory
+        
+        Each file is written atomically, and files whose content is unchanged
+        are left untouched. Returns the paths of all output files, relative to
+        the repository root.
+        """
+        output_dir = self.output_dir(tier, skill_name)
         
         if self.dry_run:
             print(f"[DRY RUN] Would create: {output_dir}")
-            return
+            return []
         
         # Create directory
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Write files based on tier
-        if tier in [1, 2]:
-            # System prompt
-            with open(output_dir / "system-prompt.md", 'w', encoding='utf-8') as f:
-                f.write(converted["system_prompt"])
-            
-            # Metadata
-            with open(output_dir / "metadata.yaml", 'w', encoding='utf-8') as f:
-                yaml.dump(converted["metadata"], f, default_flow_style=False, sort_keys=False)
-            
-            # API example
-            # Update api_example to use actual system prompt content
-            converted["api_example"]["messages"][0]["content"] = f"[Content from system-prompt.md]"
-            with open(output_dir / "api-example.json", 'w', encoding='utf-8') as f:
-                json.dump(converted["api_example"], f, indent=2)
+        outputs = []
+        for file_name, content in files.items():
+            output_file = output_dir / file_name
+            if write_if_changed(output_file, content):
+                self.stats["files_written"] += 1
+            else:
+                self.stats["files_unchanged"] += 1
+            outputs.append(output_file.relative_to(REPO_ROOT).as_posix())
+        return outputs
+    
+    def remove_outputs(self, outputs: List[str]):
+        """Delete previously generated files (e.g. after a tier change) and empty directories"""
+        for output in outputs:
+            output_file = REPO_ROOT / output
+            if self.dry_run:
+                print(f"[DRY RUN] Would remove: {output_file}")
+                continue
+            if output_file.exists():
+                output_file.unlink()
+                self.stats["files_removed"] += 1
+            try:
+                output_file.parent.rmdir()
+            except OSError:
+                pass  # Not empty
+    
+    def skill_inputs(self, skill_path: Path) -> Dict:
+        """Everything a skill's conversion depends on"""
+        return {
+            "skill_md": file_digest(skill_path / "SKILL.md"),
+            "scripts": tree_digest(skill_path / "scripts"),
+            "converter": CONVERTER_VERSION,
+            "tokenizer": self.tokenizer.name
+        }
+    
+    def plan_skill(self, skill_path: Path) -> Optional[Tuple[str, Dict, Optional[Dict], str]]:
+        """Return (key, inputs, previous entry, last_sync), or None if up to date"""
+        key = skill_path.relative_to(REPO_ROOT).as_posix()
+        inputs = self.skill_inputs(skill_path)
+        if self.incremental and self.manifest.is_fresh(key, inputs):
+            return None
         
-        if tier == 2:
-            # Tools schema
-            with open(output_dir / "tools-schema.json", 'w', encoding='utf-8') as f:
-                json.dump(converted["tools_schema"], f, indent=2)
-            
-            # Manual version
-            with open(output_dir / "manual-version.md", 'w', encoding='utf-8') as f:
-                f.write(converted["manual_version"])
+        # Keep the previous sync date unless the source itself changed
+        previous = self.manifest.get(key)
+        source_unchanged = previous and all(
+            previous.get(k) == inputs[k] for k in ("skill_md", "scripts")
+        )
+        last_sync = previous["last_sync"] if source_unchanged else datetime.now().isoformat()[:10]
+        return key, inputs, previous, last_sync
+    
+    def render_skill(self, skill_path: Path, last_sync: str) -> Dict:
+        """Parse, classify, transform and render one skill without writing anything
         
-        if tier == 3:
-            # README
-            with open(output_dir / "README.md", 'w', encoding='utf-8') as f:
-                f.write(converted["readme"])
-            
-            # Metadata
-            with open(output_dir / "metadata.yaml", 'w', encoding='utf-8') as f:
-                yaml.dump(converted["metadata"], f, default_flow_style=False, sort_keys=False)
+        Returns ``{"tier": n, "files": {file name: content}, "matches": counts,
+        "tool_schemas": cache entries}``. Runs in worker processes for parallel
+        conversions, so it must not touch shared state; the tool schema cache
+        entries it used are handed back for the parent to merge.
+        """
+        # Parse skill
+        frontmatter, content = self.parse_skill_md(skill_path)
+        
+        # One pass both cleans the text and collects the classification evidence
+        universal_content, matches = claude_language.rewrite(content)
+        
+        # Classify tier
+        tier = self.classify_skill(skill_path, frontmatter, content, matches)
+        
+        # Convert based on tier
+        if tier == 1:
+            converted = self.convert_tier1_skill(skill_path, frontmatter, content, last_sync, universal_content)
+        elif tier == 2:
+            converted = self.convert_tier2_skill(skill_path, frontmatter, content, last_sync, universal_content)
+        else:
+            converted = self.convert_tier3_skill(skill_path, frontmatter, content, last_sync)
+        
+        if tier in (1, 2):
+            tested = self.tested_compatibility(tier, skill_path.name)
+            if tested:
+                converted["metadata"]["compatibility"] = tested
+        
+        return {
+            "tier": tier,
+            "files": self.render_converted_skill(tier, converted),
+            "matches": matches,
+            "tool_schemas": self.tool_cache.take_recent()
+        }
+    
+    def apply_rendered_skill(self, skill_path: Path, plan: Tuple[str, Dict, Optional[Dict], str],
+                             rendered: Dict):
+        """Write a rendered skill, update stats and record it in the manifest"""
+        key, inputs, previous, last_sync = plan
+        tier = rendered["tier"]
+        print(f"  Classified as: Tier {tier}")
+        self.stats[f"tier{tier}"] += 1
+        self.rewrite_stats.update(rendered["matches"])
+        self.tool_cache.merge(rendered["tool_schemas"])
+        
+        # Write to universal directory
+        outputs = self.write_converted_skill(tier, skill_path.name, rendered["files"])
+        
+        if not self.dry_run:
+            # Outputs from an earlier conversion to a different tier are stale
+            if previous:
+                self.remove_outputs([o for o in previous["outputs"] if o not in outputs])
+            self.manifest.skills[key] = dict(inputs, tier=tier, outputs=outputs, last_sync=last_sync)
+        
+        print(f"  ✓ Converted successfully")
     
     def convert_skill(self, skill_path: Path) -> bool:
-        """Convert a single skill"""
+        """Convert a single skill, skipping it in incremental mode if it is up to date"""
         try:
-            print(f"Converting: {skill_path.name}")
-            
-            # Parse skill
-            frontmatter, content = self.parse_skill_md(skill_path)
-            
-            # Classify tier
-            tier = self.classify_skill(skill_path, frontmatter, content)
-            print(f"  Classified as: Tier {tier}")
-            
-            # Convert based on tier
-            if tier == 1:
-                converted = self.convert_tier1_skill(skill_path, frontmatter, content)
-                self.stats["tier1"] += 1
-            elif tier == 2:
-                converted = self.convert_tier2_skill(skill_path, frontmatter, content)
-                self.stats["tier2"] += 1
-            else:
-                converted = self.convert_tier3_skill(skill_path, frontmatter, content)
-                self.stats["tier3"] += 1
+            plan = self.plan_skill(skill_path)
+            if plan is None:
+                self.stats["skipped"] += 1
+                return True
             
-            # Write to universal directory
-            self.write_converted_skill(tier, skill_path.name, converted)
-            
-            print(f"  ✓ Converted successfully")
+            print(f"Converting: {skill_path.name}")
+            rendered = self.render_skill(skill_path, plan[3])
+            self.apply_rendered_skill(skill_path, plan, rendered)
             return True
             
         except Exception as e:
@@ -392,14 +585,98 @@ To use this skill, please refer to the original version in the repository root:
             self.stats["errors"] += 1
             return False
     
-    def convert_all(self):
-        """Convert all skills in the repository"""
+    def prune_removed_skills(self, skills: List[Path]):
+        """Drop manifest entries and outputs of skills that no longer exist"""
+        present = {skill_path.relative_to(REPO_ROOT).as_posix() for skill_path in skills}
+        for key in [k for k in self.manifest.skills if k not in present]:
+            print(f"Removing outputs of deleted skill: {key}")
+            self.remove_outputs(self.manifest.skills[key]["outputs"])
+            if not self.dry_run:
+                del self.manifest.skills[key]
+    
+    def save_manifest(self, prune_tool_cache: bool = False):
+        """Persist the manifest and the tool schema cache (never in dry-run mode)"""
+        if not self.dry_run:
+            self.manifest.save()
+            self.tool_cache.save(prune=prune_tool_cache)
+    
+    def submit_render(self, pool: ProcessPoolExecutor, skill_path: Path,
+                      plan: Tuple[str, Dict, Optional[Dict], str]) -> Future:
+        """Render a skill in a pool worker"""
+        return pool.submit(_render_in_worker, skill_path, plan[3], self.tokenizer.name)
+    
+    def render_isolated(self, skill_path: Path, plan: Tuple[str, Dict, Optional[Dict], str]) -> Dict:
+        """Render a skill in a worker process of its own, so a crash only fails this skill"""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            try:
+                return self.submit_render(pool, skill_path, plan).result()
+            except BrokenProcessPool as e:
+                raise RuntimeError(f"worker process crashed ({e})") from e
+    
+    def convert_all(self, jobs: Optional[int] = None):
+        """Convert all skills in the repository
+        
+        Skills are rendered across ``jobs`` worker processes (None = all
+        cores, 1 = in-process). The parent process writes every output, keeps
+        the statistics and the manifest, and handles results in skill order,
+        so the outcome matches a sequential run. A skill that fails, even by
+        crashing its worker, is counted as an error without stopping the batch.
+        """
         skills = self.find_skills()
         print(f"Found {len(skills)} skills to convert\n")
         
+        plans = []
         for skill_path in skills:
-            self.convert_skill(skill_path)
-            print()
+            try:
+                plan = self.plan_skill(skill_path)
+            except OSError as e:
+                print(f"Converting: {skill_path.name}")
+                print(f"  ✗ Error: {e}\n")
+                self.stats["errors"] += 1
+                continue
+            if plan is None:
+                self.stats["skipped"] += 1
+            else:
+                plans.append((skill_path, plan))
+        
+        jobs = default_jobs() if jobs is None else max(1, jobs)
+        pool = None
+        if jobs > 1 and len(plans) >= MIN_PARALLEL_ITEMS:
+            workers = min(jobs, len(plans))
+            pool = ProcessPoolExecutor(max_workers=workers)
+            futures = [self.submit_render(pool, skill_path, plan) for skill_path, plan in plans]
+        
+        try:
+            for position, (skill_path, plan) in enumerate(plans):
+                print(f"Converting: {skill_path.name}")
+                try:
+                    if pool is None:
+                        rendered = self.render_skill(skill_path, plan[3])
+                    else:
+                        try:
+                            rendered = futures[position].result()
+                        except BrokenProcessPool:
+                            # A crashed worker fails every unfinished future, so the
+                            # culprit is unknown: rerun this skill alone and the rest
+                            # in a fresh pool (a skill that crashes again fails alone)
+                            pool.shutdown()
+                            pool = ProcessPoolExecutor(max_workers=workers)
+                            for later in range(position + 1, len(plans)):
+                                if not futures[later].done() or futures[later].exception():
+                                    futures[later] = self.submit_render(pool, *plans[later])
+                            rendered = self.render_isolated(skill_path, plan)
+                    self.apply_rendered_skill(skill_path, plan, rendered)
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+                    self.stats["errors"] += 1
+                print()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        self.prune_removed_skills(skills)
+        # A full run looks up every script, so cache entries it didn't use are stale
+        self.save_manifest(prune_tool_cache=not self.incremental and not self.stats["errors"])
         
         # Print summary
         print("=" * 60)
@@ -407,10 +684,34 @@ To use this skill, please refer to the original version in the repository root:
         print(f"  Tier 1 (Instruction-only): {self.stats['tier1']}")
         print(f"  Tier 2 (Tool-enhanced):    {self.stats['tier2']}")
         print(f"  Tier 3 (Claude-only):      {self.stats['tier3']}")
+        print(f"  Up to date (skipped):      {self.stats['skipped']}")
         print(f"  Errors:                    {self.stats['errors']}")
+        print(f"  Files written:             {self.stats['files_written']}")
+        print(f"  Files unchanged:           {self.stats['files_unchanged']}")
+        print(f"  Files removed:             {self.stats['files_removed']}")
+        rewrites = [(rule.name, self.rewrite_stats[rule.name]) for rule in claude_language.rules
+                    if rule.replacement is not None and self.rewrite_stats[rule.name]]
+        if rewrites:
+            print(f"  Language rewrites:         {sum(n for _, n in rewrites)} "
+                  f"({', '.join(f'{name} {n}' for name, n in rewrites)})")
         print("=" * 60)
 
 
+# Converter used by worker processes (created once per process)
+_worker_converter: Optional[SkillConverter] = None
+
+
+def _render_in_worker(skill_path: Path, last_sync: str, tokenizer: str) -> Dict:
+    """Process-pool entry point for SkillConverter.render_skill"""
+    global _worker_converter
+    if _worker_converter is None:
+        # Reads the persisted tool schema cache; new entries go back to the parent
+        _worker_converter = SkillConverter(manifest=ConversionManifest(path=None),
+                                           tool_cache=ToolSchemaCache(TOOL_CACHE_PATH),
+                                           tokenizer=tokenizer)
+    return _worker_converter.render_skill(skill_path, last_sync)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert Claude skills to universal format"
@@ -435,10 +736,32 @@ def main():
         action="store_true",
         help="Preview conversion without writing files"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reconvert skills whose SKILL.md, scripts/ or converter version changed"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes for --all (default: all cores, 1 = sequential)"
+    )
+    parser.add_argument(
+        "--tokenizer",
+        default=DEFAULT_TOKENIZER,
+        help="Tokenizer for context window requirements: approx, chars[:N], "
+             f"tiktoken[:ENCODING] or hf:NAME (default: {DEFAULT_TOKENIZER})"
+    )
     
     args = parser.parse_args()
     
-    converter = SkillConverter(dry_run=args.dry_run)
+    try:
+        converter = SkillConverter(dry_run=args.dry_run, incremental=args.incremental,
+                                   tokenizer=args.tokenizer)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
     
     if args.skill:
         # Convert specific skill
@@ -447,10 +770,11 @@ def main():
             print(f"Error: Skill not found: {args.skill}")
             return 1
         converter.convert_skill(skill_path)
+        converter.save_manifest()
     
     elif args.all:
         # Convert all skills
-        converter.convert_all()
+        converter.convert_all(jobs=args.jobs)
     
     else:
         parser.print_help()
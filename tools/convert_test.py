@@ -0,0 +1,73 @@
+import io
+import multiprocessing
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import convert
+from convert import ConversionManifest, SkillConverter
+from skill_tool_schema import ToolSchemaCache
+
+render_skill = SkillConverter.render_skill
+
+
+def crash_on_skill_07(self, skill_path, last_sync):
+    if skill_path.name == "skill-07":
+        os._exit(1)  # Like a segfault or the OOM killer: no exception, no cleanup
+    return render_skill(self, skill_path, last_sync)
+
+
+class TestToolSchemaCache(unittest.TestCase):
+
+    def test_warm_cache_renders_like_cold(self):
+        """tools-schema.json doesn't depend on whether the cache was warm"""
+        skill = convert.REPO_ROOT / "mcp-builder"
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.json"
+            renders = []
+            for _ in range(2):
+                converter = SkillConverter(dry_run=True, manifest=ConversionManifest(path=None),
+                                           tool_cache=ToolSchemaCache(cache_path))
+                renders.append(converter.render_skill(skill, "2026-01-01")["files"])
+                converter.tool_cache.save()
+            self.assertEqual(converter.tool_cache.stats["misses"], 0)
+        self.assertEqual(renders[0]["tools-schema.json"], renders[1]["tools-schema.json"])
+        self.assertEqual(renders[0], renders[1])
+
+
+@unittest.skipUnless(multiprocessing.get_start_method() == "fork", "workers must inherit the patched renderer")
+class TestConvertAll(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for number in range(40):
+            skill = self.root / f"skill-{number:02d}"
+            skill.mkdir()
+            (skill / "SKILL.md").write_text(
+                f"---\nname: skill-{number:02d}\ndescription: Test skill {number}\n---\n\n# Skill {number}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def convert_all(self):
+        converter = SkillConverter(dry_run=True, manifest=ConversionManifest(path=None),
+                                   tool_cache=ToolSchemaCache())
+        with mock.patch.object(convert, "REPO_ROOT", self.root), \
+                mock.patch.object(SkillConverter, "render_skill", crash_on_skill_07), \
+                redirect_stdout(io.StringIO()) as output:
+            converter.convert_all(jobs=4)
+        return converter.stats, output.getvalue()
+
+    def test_worker_crash_fails_only_its_skill(self):
+        stats, output = self.convert_all()
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["tier1"], 39)
+        self.assertIn("Converting: skill-07\n  ✗ Error: worker process crashed", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
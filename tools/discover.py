@@ -10,13 +10,24 @@ import os
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
+
+from skill_facets import SkillFacets
+from skill_index_binary import open_search_index
+from skill_search import SkillSearchIndex
 
 def load_index(index_path: str) -> Dict:
     """Load skill index from file."""
+    return load_search_index(index_path)[0]
+
+def load_search_index(index_path: str) -> Tuple[Dict, SkillSearchIndex]:
+    """Load skill index and its search structures.
+
+    Memory-maps SKILL-INDEX.bin when it is present and up to date, so the
+    JSON catalogue is only parsed as a fallback.
+    """
     try:
-        with open(index_path, 'r') as f:
-            return json.load(f)
+        return open_search_index(index_path)
     except FileNotFoundError:
         print(f"❌ Skill index not found at {index_path}")
         print("Run 'python tools/index-skills.py' to generate the index first.")
@@ -25,38 +36,36 @@ def load_index(index_path: str) -> Dict:
         print(f"❌ Invalid skill index file at {index_path}")
         sys.exit(1)
 
-def search_skills(skills: List[Dict], query: str) -> List[Dict]:
-    """Search skills by keywords in name, description, and tags."""
-    query_lower = query.lower()
-    results = []
-    
-    for skill in skills:
-        # Search in name
-        if query_lower in skill['name'].lower():
-            results.append({'skill': skill, 'score': 10})
-            continue
-        
-        # Search in description
-        if query_lower in skill['description'].lower():
-            results.append({'skill': skill, 'score': 5})
-            continue
-        
-        # Search in tags
-        if any(query_lower in tag for tag in skill['tags']):
-            results.append({'skill': skill, 'score': 3})
-            continue
-    
-    # Sort by score and return skills
-    results.sort(key=lambda x: x['score'], reverse=True)
-    return [r['skill'] for r in results]
+def search_skills(skills: List[Dict], query: str,
+                  search_index: Optional[SkillSearchIndex] = None,
+                  top_k: Optional[int] = None,
+                  category: Optional[str] = None,
+                  tags: Sequence[str] = ()) -> List[Dict]:
+    """Search skills by keywords in name, description, tags, and category.
+
+    Results are ranked with BM25. Pass a prebuilt ``search_index`` to avoid
+    re-indexing the catalogue on every query. ``category`` and ``tags``
+    narrow the results using the index's precomputed facets.
+    """
+    if search_index is None:
+        search_index = SkillSearchIndex(skills)
+    return search_index.search(query, top_k=top_k, category=category, tags=tags)
 
-def filter_by_category(skills: List[Dict], category: str) -> List[Dict]:
-    """Filter skills by category."""
-    return [s for s in skills if s['category'].lower() == category.lower()]
+def filter_by_category(skills: List[Dict], category: str,
+                       facets: Optional[SkillFacets] = None) -> List[Dict]:
+    """Filter skills by category (uses ``facets`` when given instead of scanning)."""
+    if facets is not None:
+        return [skills[i] for i in facets.category_ids(category)]
+    category = category.lower()
+    return [s for s in skills if s['category'].lower() == category]
 
-def filter_by_tag(skills: List[Dict], tag: str) -> List[Dict]:
-    """Filter skills by tag."""
-    return [s for s in skills if tag.lower() in [t.lower() for t in s['tags']]]
+def filter_by_tag(skills: List[Dict], tag: str,
+                  facets: Optional[SkillFacets] = None) -> List[Dict]:
+    """Filter skills by tag (uses ``facets`` when given instead of scanning)."""
+    if facets is not None:
+        return [skills[i] for i in facets.tag_ids(tag)]
+    tag = tag.lower()
+    return [s for s in skills if any(t.lower() == tag for t in s['tags'])]
 
 def display_skill_summary(skill: Dict, index: Optional[int] = None):
     """Display a brief summary of a skill."""
@@ -92,24 +101,33 @@ def display_skill_details(skill: Dict, repo_root: str):
     print(f"   Claude Code: cp -r {skill['path']} ~/.config/claude-code/skills/")
     
     # Check for universal format
-    universal_tiers = ['tier-1-instruction-only', 'tier-2-tool-enhanced', 'tier-3-claude-only']
-    for tier in universal_tiers:
-        universal_path = Path(repo_root) / 'universal' / tier / skill['name']
-        if universal_path.exists():
-            print(f"   Universal (Any LLM): See universal/{tier}/{skill['name']}/")
-            break
+    universal = universal_path(skill, repo_root)
+    if universal:
+        print(f"   Universal (Any LLM): See {universal}/")
     
     print(f"\n{'='*80}\n")
 
-def interactive_mode(index: Dict, repo_root: str):
+def universal_path(skill: Dict, repo_root: str) -> Optional[str]:
+    """Return the repo-relative universal-format directory of a skill, if any."""
+    universal_tiers = ['tier-1-instruction-only', 'tier-2-tool-enhanced', 'tier-3-claude-only']
+    for tier in universal_tiers:
+        if (Path(repo_root) / 'universal' / tier / skill['name']).exists():
+            return f"universal/{tier}/{skill['name']}"
+    return None
+
+def interactive_mode(index: Dict, repo_root: str, search_index: Optional[SkillSearchIndex] = None):
     """Interactive skill discovery interface."""
+    if search_index is None:
+        search_index = SkillSearchIndex(index['skills'])
+    facets = search_index.facets
+    
     print("\n" + "="*80)
     print("🔍 Claude Skills Discovery Tool")
     print("="*80)
     print(f"\nWelcome! I'll help you find the perfect skill for your needs.")
     print(f"Total skills available: {index['total_skills']}")
     print(f"\nCommands:")
-    print("  search <keywords>  - Search for skills by keywords")
+    print("  search <keywords>  - Search for skills by keywords (use OR for either)")
     print("  category <name>    - Show skills in a category")
     print("  tag <name>         - Filter by tag")
     print("  list               - List all skills")
@@ -135,7 +153,7 @@ def interactive_mode(index: Dict, repo_root: str):
             
             if command.lower() == 'help':
                 print("\nCommands:")
-                print("  search <keywords>  - Search for skills by keywords")
+                print("  search <keywords>  - Search for skills by keywords (use OR for either)")
                 print("  category <name>    - Show skills in a category")
                 print("  tag <name>         - Filter by tag")
                 print("  list               - List all skills")
@@ -156,18 +174,13 @@ def interactive_mode(index: Dict, repo_root: str):
             if command.lower() == 'categories':
                 print("\n📂 Available Categories:")
                 for i, cat in enumerate(index['categories'], 1):
-                    count = len([s for s in index['skills'] if s['category'] == cat])
-                    print(f"  {i}. {cat} ({count} skills)")
+                    print(f"  {i}. {cat} ({facets.category_count(cat)} skills)")
                 print("\nUse 'category <name>' to see skills in a category")
                 continue
             
             if command.lower() == 'tags':
-                all_tags = set()
-                for skill in index['skills']:
-                    all_tags.update(skill['tags'])
                 print("\n🏷️  Available Tags:")
-                for i, tag in enumerate(sorted(all_tags), 1):
-                    count = len([s for s in index['skills'] if tag in s['tags']])
+                for i, (tag, count) in enumerate(facets.tag_counts().items(), 1):
                     print(f"  {tag} ({count})", end='  ')
                     if i % 5 == 0:
                         print()
@@ -180,7 +193,7 @@ def interactive_mode(index: Dict, repo_root: str):
                     print("❌ Please provide search keywords")
                     continue
                 
-                results = search_skills(index['skills'], query)
+                results = search_skills(index['skills'], query, search_index)
                 current_results = results
                 
                 if results:
@@ -199,7 +212,7 @@ def interactive_mode(index: Dict, repo_root: str):
                     print("❌ Please provide a category name")
                     continue
                 
-                results = filter_by_category(index['skills'], category)
+                results = filter_by_category(index['skills'], category, facets)
                 current_results = results
                 
                 if results:
@@ -218,7 +231,7 @@ def interactive_mode(index: Dict, repo_root: str):
                     print("❌ Please provide a tag name")
                     continue
                 
-                results = filter_by_tag(index['skills'], tag)
+                results = filter_by_tag(index['skills'], tag, facets)
                 current_results = results
                 
                 if results:
@@ -248,32 +261,40 @@ def interactive_mode(index: Dict, repo_root: str):
         except EOFError:
             break
 
-def quick_search(index: Dict, query: str, repo_root: str):
-    """Quick non-interactive search."""
-    results = search_skills(index['skills'], query)
+def quick_search(index: Dict, query: str, repo_root: str,
+                 search_index: Optional[SkillSearchIndex] = None,
+                 top_k: Optional[int] = None,
+                 category: Optional[str] = None,
+                 tags: Sequence[str] = ()):
+    """Quick non-interactive search, optionally narrowed to a category and tags."""
+    results = search_skills(index['skills'], query, search_index, top_k=top_k,
+                            category=category, tags=tags)
     
+    where = ''.join([f" in '{category}'" if category else ''] + [f" tagged '{t}'" for t in tags])
     if results:
-        print(f"\n🔍 Found {len(results)} skill(s) matching '{query}':\n")
+        print(f"\n🔍 Found {len(results)} skill(s) matching '{query}'{where}:\n")
         for skill in results:
             display_skill_details(skill, repo_root)
     else:
-        print(f"❌ No skills found matching '{query}'")
+        print(f"❌ No skills found matching '{query}'{where}")
         print("\nTry:")
         print(f"  - Different keywords")
         print(f"  - Run 'python tools/discover.py' for interactive mode")
         print(f"  - Browse categories with '--categories'")
 
-def list_categories(index: Dict):
+def list_categories(index: Dict, facets: Optional[SkillFacets] = None):
     """List all categories."""
+    if facets is None:
+        facets = SkillFacets.build(index['skills'])
     print("\n📂 Available Categories:\n")
     for cat in index['categories']:
-        count = len([s for s in index['skills'] if s['category'] == cat])
-        print(f"  • {cat} ({count} skills)")
+        print(f"  • {cat} ({facets.category_count(cat)} skills)")
     print(f"\nUse '--category <name>' to see skills in a category")
 
-def list_category_skills(index: Dict, category: str, repo_root: str):
+def list_category_skills(index: Dict, category: str, repo_root: str,
+                         facets: Optional[SkillFacets] = None):
     """List skills in a category."""
-    results = filter_by_category(index['skills'], category)
+    results = filter_by_category(index['skills'], category, facets)
     
     if results:
         print(f"\n📂 Skills in '{category}' ({len(results)}):\n")
@@ -299,6 +320,8 @@ Examples:
   # Quick search
   python tools/discover.py --search "domain name"
   python tools/discover.py --search "pdf"
+  python tools/discover.py --search "pdf OR docx" --top 5
+  python tools/discover.py --search "send" --category "App Automation" --tag mcp
   
   # Browse by category
   python tools/discover.py --categories
@@ -306,6 +329,10 @@ Examples:
   
   # List all skills
   python tools/discover.py --list
+  
+  # Keep the index warm and answer JSON queries (see tools/skill_server.py)
+  python tools/discover.py --serve --port 8765
+  python tools/discover.py --serve --socket /tmp/skills.sock
         """
     )
     
@@ -319,6 +346,12 @@ Examples:
         metavar='QUERY',
         help='Search for skills by keywords'
     )
+    parser.add_argument(
+        '--top',
+        type=int,
+        metavar='N',
+        help='Show only the N best search results'
+    )
     parser.add_argument(
         '--categories',
         action='store_true',
@@ -327,13 +360,51 @@ Examples:
     parser.add_argument(
         '--category',
         metavar='NAME',
-        help='Show skills in a specific category'
+        help='Show skills in a specific category (with --search: only search it)'
+    )
+    parser.add_argument(
+        '--tag',
+        metavar='NAME',
+        action='append',
+        default=[],
+        help='With --search, only return skills with this tag (repeatable)'
     )
     parser.add_argument(
         '--list',
         action='store_true',
         help='List all skills'
     )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run a JSON API server over the index (reloads when it changes)'
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to serve on (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Port to serve on (default: 8765)'
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help='Serve on a Unix socket instead of TCP'
+    )
+    parser.add_argument(
+        '--nlp',
+        action='store_true',
+        help='With --serve, also expose /semantic backed by nlp-discover'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='With --serve, log every request'
+    )
     
     args = parser.parse_args()
     
@@ -343,22 +414,35 @@ Examples:
     
     # Load index
     index_path = args.index if os.path.isabs(args.index) else os.path.join(repo_root, args.index)
-    index = load_index(index_path)
+    
+    if args.serve:
+        from skill_server import serve
+        load_search_index(index_path)  # fail early with the usual message
+        try:
+            serve(index_path, repo_root, host=args.host, port=args.port,
+                  socket_path=args.socket, nlp=args.nlp, verbose=args.verbose)
+        except FileExistsError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        return
+    
+    index, search_index = load_search_index(index_path)
     
     # Handle command-line arguments
     if args.search:
-        quick_search(index, args.search, repo_root)
+        quick_search(index, args.search, repo_root, search_index, top_k=args.top,
+                     category=args.category, tags=args.tag)
     elif args.categories:
-        list_categories(index)
+        list_categories(index, search_index.facets)
     elif args.category:
-        list_category_skills(index, args.category, repo_root)
+        list_category_skills(index, args.category, repo_root, search_index.facets)
     elif args.list:
         print(f"\n📋 All Skills ({index['total_skills']}):\n")
         for skill in index['skills']:
             display_skill_details(skill, repo_root)
     else:
         # Interactive mode
-        interactive_mode(index, repo_root)
+        interactive_mode(index, repo_root, search_index)
 
 if __name__ == '__main__':
     main()
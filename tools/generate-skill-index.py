@@ -3,39 +3,47 @@
 Generate SKILL-INDEX.json from all SKILL.md files in the repository.
 Parses YAML frontmatter and auto-categorizes skills.
 
+Also writes the derived search files used by the discovery tools:
+SKILL-INDEX.bin, a memory-mappable search index (see skill_index_binary.py),
+and SKILL-INDEX.vectors.npz, skill embeddings for offline semantic search
+(see skill_vectors.py; needs numpy).
+
 Usage:
     python generate-skill-index.py [--output FILE] [--verbose]
     
 Options:
     --output FILE    Output file path (default: SKILL-INDEX.json)
+    --no-binary      Do not write the binary search index
+    --no-vectors     Do not write the semantic search vectors
+    --derived-only   Rebuild only the derived search files from the existing JSON
+    --incremental    Only reparse SKILL.md files changed since the last run
+    --validate       Validate frontmatter in the same pass; write nothing on errors
+    --jobs N, -j N   Parse SKILL.md files in N processes (default: all cores)
     --verbose, -v    Show detailed progress
     --help, -h       Show this help message
     
 Examples:
     python generate-skill-index.py
     python generate-skill-index.py --output custom-index.json -v
+    python generate-skill-index.py --incremental
+    python generate-skill-index.py --validate
 """
 
 import argparse
 import json
 import os
-import re
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
-import yaml
-
-
-def extract_yaml_frontmatter(content: str) -> Optional[Dict]:
-    """Extract YAML frontmatter from markdown content."""
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1))
-        except yaml.YAMLError as e:
-            print(f"YAML parse error: {e}")
-            return None
-    return None
+from typing import Callable, Dict, List, Optional, Tuple
+
+from skill_index_binary import binary_index_path, write_binary_index
+from skill_lint import LintIssue, LintResult, SkillDocument, find_skill_files, lint_file, load_document, print_report
+from skill_vectors import NUMPY_AVAILABLE, SkillVectorIndex, vectors_path
+from skill_manifest import SkillManifest, manifest_path_for
+from skill_pool import map_in_processes
+
+INDEX_VERSION = "2.0"
 
 
 def categorize_skill(skill_name: str, description: str, tags: List[str]) -> str:
@@ -90,23 +98,15 @@ def categorize_skill(skill_name: str, description: str, tags: List[str]) -> str:
     return "Other"
 
 
-def find_skill_files(root_dir: Path) -> List[Path]:
-    """Find all SKILL.md files in the repository."""
-    skill_files = []
-    for skill_file in root_dir.glob("*/SKILL.md"):
-        # Skip hidden directories and specific paths
-        if not any(part.startswith('.') for part in skill_file.parts):
-            skill_files.append(skill_file)
-    return sorted(skill_files)
-
-
-def parse_skill_file(skill_file: Path, root_dir: Path) -> Optional[Dict]:
-    """Parse a SKILL.md file and extract metadata."""
+def skill_entry(document: SkillDocument, root_dir: Path) -> Optional[Dict]:
+    """Build the index entry for a parsed SKILL.md (None if it has no frontmatter)."""
+    skill_file = document.path
     try:
-        content = skill_file.read_text(encoding='utf-8')
-        frontmatter = extract_yaml_frontmatter(content)
+        frontmatter = document.frontmatter
         
         if not frontmatter:
+            if document.error and not document.error.startswith("No "):
+                print(f"{document.error}")
             print(f"Warning: No YAML frontmatter in {skill_file}")
             return None
         
@@ -147,16 +147,70 @@ def parse_skill_file(skill_file: Path, root_dir: Path) -> Optional[Dict]:
         return None
 
 
-def generate_skill_index(root_dir: Path) -> Dict:
-    """Generate the complete skill index."""
+def parse_skill_file(skill_file: Path, root_dir: Path) -> Optional[Dict]:
+    """Parse a SKILL.md file and extract metadata."""
+    return skill_entry(load_document(skill_file), root_dir)
+
+
+def lint_skill_file(skill_file: Path, root_dir: Path) -> Dict:
+    """Validate a SKILL.md and build its index entry from the same parse.
+
+    Returns ``{"entry": ..., "issues": [[rule, severity, message], ...]}``
+    (JSON-friendly, so it can be kept in the incremental manifest).
+    """
+    result = lint_file(skill_file, emit=partial(skill_entry, root_dir=root_dir))
+    return {"entry": result.entry, "issues": [list(issue) for issue in result.issues]}
+
+
+def parse_skill_files(root_dir: Path, parse: Callable[[Path], Optional[Dict]],
+                      manifest: Optional[SkillManifest] = None,
+                      jobs: Optional[int] = None) -> Tuple[List[Path], List]:
+    """Find every SKILL.md and run ``parse`` on it (or reuse the manifest)."""
     skill_files = find_skill_files(root_dir)
     print(f"Found {len(skill_files)} SKILL.md files")
     
+    if manifest is not None:
+        parsed = manifest.update(skill_files, root_dir, parse, jobs=jobs)
+        stats = manifest.stats
+        print(f"Incremental: {stats['added']} added, {stats['reparsed']} changed, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+    else:
+        parsed = map_in_processes(parse, skill_files, jobs)
+    return skill_files, parsed
+
+
+def generate_skill_index(root_dir: Path, manifest: Optional[SkillManifest] = None,
+                         jobs: Optional[int] = None) -> Dict:
+    """Generate the complete skill index.
+
+    SKILL.md files are parsed across ``jobs`` processes (None = all cores);
+    results keep file order, so the output matches a sequential run. With a
+    ``manifest``, only SKILL.md files whose content changed since the
+    manifest was saved are parsed again; other entries come from the cache.
+    """
+    skill_files, parsed = parse_skill_files(
+        root_dir, partial(parse_skill_file, root_dir=root_dir), manifest, jobs)
+    return build_index(skill_files, parsed)
+
+
+def lint_and_generate_skill_index(root_dir: Path, manifest: Optional[SkillManifest] = None,
+                                  jobs: Optional[int] = None) -> Tuple[Dict, List[LintResult]]:
+    """generate_skill_index() that also validates every SKILL.md in the same pass."""
+    skill_files, parsed = parse_skill_files(
+        root_dir, partial(lint_skill_file, root_dir=root_dir), manifest, jobs)
+    results = [
+        LintResult(skill_file, [LintIssue(*issue) for issue in item["issues"]])
+        for skill_file, item in zip(skill_files, parsed)
+    ]
+    return build_index(skill_files, [item["entry"] for item in parsed]), results
+
+
+def build_index(skill_files: List[Path], parsed: List[Optional[Dict]]) -> Dict:
+    """Assemble the index from the entries of each SKILL.md (None = skipped)."""
     skills = []
     categories_set = set()
     
-    for skill_file in skill_files:
-        skill_data = parse_skill_file(skill_file, root_dir)
+    for skill_file, skill_data in zip(skill_files, parsed):
         if skill_data:
             skills.append(skill_data)
             categories_set.add(skill_data['category'])
@@ -170,7 +224,7 @@ def generate_skill_index(root_dir: Path) -> Dict:
     categories = sorted(categories_set)
     
     index = {
-        "version": "2.0",
+        "version": INDEX_VERSION,
         "generated_date": "2026-02-06",
         "total_skills": len(skills),
         "categories": categories,
@@ -180,6 +234,28 @@ def generate_skill_index(root_dir: Path) -> Dict:
     return index
 
 
+def write_search_files(index: Dict, output_file: Path, binary: bool = True,
+                       vectors: bool = True, missing_only: bool = False) -> List[str]:
+    """Write the binary index and vectors derived from a JSON index.
+
+    Returns the paths written. With ``missing_only``, existing files are kept.
+    """
+    written = []
+    binary_file = binary_index_path(str(output_file))
+    if binary and not (missing_only and os.path.exists(binary_file)):
+        write_binary_index(index, binary_file, str(output_file))
+        written.append(binary_file)
+    
+    vectors_file = vectors_path(str(output_file))
+    if vectors and not NUMPY_AVAILABLE:
+        print("Note: numpy not installed, skipping semantic search vectors")
+    elif vectors and not (missing_only and os.path.exists(vectors_file)):
+        vector_index = SkillVectorIndex.build(index['skills'], source_path=str(output_file))
+        vector_index.save(vectors_file)
+        written.append(vectors_file)
+    return written
+
+
 def main():
     """Main function to generate SKILL-INDEX.json."""
     parser = argparse.ArgumentParser(
@@ -189,6 +265,8 @@ def main():
 Examples:
   python generate-skill-index.py
   python generate-skill-index.py --output custom-index.json -v
+  python generate-skill-index.py --derived-only
+  python generate-skill-index.py --incremental
   python generate-skill-index.py --help
         """
     )
@@ -198,6 +276,39 @@ Examples:
         default='SKILL-INDEX.json',
         help='Output file path (default: SKILL-INDEX.json)'
     )
+    parser.add_argument(
+        '--no-binary',
+        action='store_true',
+        help='Do not write the memory-mappable binary search index'
+    )
+    parser.add_argument(
+        '--no-vectors',
+        action='store_true',
+        help='Do not write the semantic search vectors'
+    )
+    parser.add_argument(
+        '--derived-only', '--binary-only',
+        dest='derived_only',
+        action='store_true',
+        help='Rebuild only the binary index and vectors from the existing JSON index'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only reparse SKILL.md files whose content changed since the last run'
+    )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Validate frontmatter (as validate-skill-yaml.py does) in the same pass; '
+             'nothing is written if any SKILL.md is invalid'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of parser processes (default: all cores, 1 = sequential)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -208,18 +319,55 @@ Examples:
     
     root_dir = Path(__file__).parent.parent
     output_file = root_dir / args.output
+    derived = dict(binary=not args.no_binary, vectors=not args.no_vectors)
+    
+    if args.derived_only:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        for path in write_search_files(index, output_file, **derived):
+            print(f"✅ Generated {path} from {output_file}")
+        return
     
     print("Generating SKILL-INDEX.json...")
     print(f"Root directory: {root_dir}")
     print(f"Output file: {output_file}")
     
-    index = generate_skill_index(root_dir)
+    manifest = None
+    if args.incremental:
+        manifest = SkillManifest(
+            manifest_path_for(output_file, "generate-skill-index"),
+            context={"generator": "generate-skill-index", "index_version": INDEX_VERSION,
+                     "validate": args.validate},
+        )
+    
+    if args.validate:
+        index, results = lint_and_generate_skill_index(root_dir, manifest, jobs=args.jobs)
+        print()
+        if not print_report(results, root_dir, verbose=args.verbose):
+            print(f"\n❌ Not writing {output_file}: fix the errors above first")
+            return 1
+    else:
+        index = generate_skill_index(root_dir, manifest, jobs=args.jobs)
+    
+    if manifest is not None and not manifest.changed and manifest.output_current(output_file):
+        manifest.save()
+        write_search_files(index, output_file, missing_only=True, **derived)
+        print(f"\n✅ {output_file} is up to date")
+        return
     
     # Write to file with pretty formatting
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(index, f, indent=2, ensure_ascii=False)
     
+    written = write_search_files(index, output_file, **derived)
+    
+    if manifest is not None:
+        manifest.record_output(output_file)
+        manifest.save()
+    
     print(f"\n✅ Generated {output_file}")
+    for path in written:
+        print(f"✅ Generated {path}")
     print(f"   Total skills: {index['total_skills']}")
     print(f"   Categories: {len(index['categories'])}")
     if args.verbose:
@@ -227,4 +375,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -8,11 +8,16 @@ that can be used for skill discovery and search.
 
 import os
 import json
+import hashlib
 import yaml
 import re
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from skill_manifest import SkillManifest, manifest_path_for
+from skill_pool import map_in_processes
+
 def extract_yaml_frontmatter(content: str) -> Optional[Dict]:
     """Extract YAML frontmatter from markdown file."""
     pattern = r'^---\s*\n(.*?)\n---\s*\n'
@@ -71,100 +76,148 @@ def extract_tags(content: str, skill_name: str, category: str) -> List[str]:
     
     return sorted(list(tags))
 
-def determine_category(skill_path: str, readme_content: str) -> str:
-    """Determine category from README.md."""
-    categories = {
-        'Document Processing': ['docx', 'pdf', 'pptx', 'xlsx'],
-        'Development & Code Tools': [
-            'artifacts-builder', 'changelog-generator', 'mcp-builder', 
-            'skill-creator', 'webapp-testing'
-        ],
-        'Business & Marketing': [
-            'brand-guidelines', 'competitive-ads-extractor', 
-            'domain-name-brainstormer', 'internal-comms', 'lead-research-assistant'
-        ],
-        'Communication & Writing': [
-            'content-research-writer', 'meeting-insights-analyzer'
-        ],
-        'Creative & Media': [
-            'canvas-design', 'image-enhancer', 'slack-gif-creator', 
-            'theme-factory', 'video-downloader'
-        ],
-        'Productivity & Organization': [
-            'file-organizer', 'invoice-organizer', 'raffle-winner-picker'
-        ]
-    }
+# Skills with a fixed category, regardless of README placement
+CATEGORY_SKILLS = {
+    'Document Processing': ['docx', 'pdf', 'pptx', 'xlsx'],
+    'Development & Code Tools': [
+        'artifacts-builder', 'changelog-generator', 'mcp-builder', 
+        'skill-creator', 'webapp-testing'
+    ],
+    'Business & Marketing': [
+        'brand-guidelines', 'competitive-ads-extractor', 
+        'domain-name-brainstormer', 'internal-comms', 'lead-research-assistant'
+    ],
+    'Communication & Writing': [
+        'content-research-writer', 'meeting-insights-analyzer'
+    ],
+    'Creative & Media': [
+        'canvas-design', 'image-enhancer', 'slack-gif-creator', 
+        'theme-factory', 'video-downloader'
+    ],
+    'Productivity & Organization': [
+        'file-organizer', 'invoice-organizer', 'raffle-winner-picker'
+    ]
+}
+
+SKILL_CATEGORIES = {
+    skill: category
+    for category, skills in CATEGORY_SKILLS.items()
+    for skill in skills
+}
+
+def build_category_sections(readme_content: str) -> Dict[str, str]:
+    """Map each category to the text of its '### <category>' README section.
     
+    Computed once per run so categorizing a skill is a handful of substring
+    checks instead of a regex scan of the whole README.
+    """
+    sections = {}
+    for category in CATEGORY_SKILLS:
+        section_pattern = rf'### {re.escape(category)}.*?(?=###|\Z)'
+        section_match = re.search(section_pattern, readme_content, re.DOTALL)
+        if section_match:
+            sections[category] = section_match.group(0)
+    return sections
+
+def determine_category(skill_path: str, readme_sections: Dict[str, str]) -> str:
+    """Determine category from the precomputed README sections."""
     skill_name = os.path.basename(skill_path)
     
-    for category, skills in categories.items():
-        if skill_name in skills:
-            return category
+    if skill_name in SKILL_CATEGORIES:
+        return SKILL_CATEGORIES[skill_name]
     
     # Check if skill is mentioned under a category in README
-    if skill_name in readme_content:
-        for category in categories.keys():
-            # Find section
-            section_pattern = rf'### {re.escape(category)}.*?(?=###|\Z)'
-            section_match = re.search(section_pattern, readme_content, re.DOTALL)
-            if section_match and skill_name in section_match.group(0):
-                return category
+    for category, section in readme_sections.items():
+        if skill_name in section:
+            return category
     
     return 'Other'
 
-def scan_skills(repo_root: str) -> List[Dict]:
-    """Scan repository for all skills and build index."""
-    skills = []
-    repo_path = Path(repo_root)
-    
-    # Read README for category information
+def parse_skill(skill_file: Path, repo_path: Path, readme_sections: Dict[str, str]) -> Optional[Dict]:
+    """Build the index entry for one SKILL.md file."""
+    try:
+        content = skill_file.read_text()
+        frontmatter = extract_yaml_frontmatter(content)
+        
+        # Get skill directory
+        skill_dir = skill_file.parent
+        skill_name = frontmatter.get('name') if frontmatter else skill_dir.name
+        category = determine_category(str(skill_dir), readme_sections)
+        
+        # Build skill entry
+        skill_entry = {
+            'name': skill_name,
+            'path': str(skill_dir.relative_to(repo_path)),
+            'skill_file': str(skill_file.relative_to(repo_path)),
+            'description': extract_description(content, frontmatter),
+            'category': category,
+            'tags': extract_tags(content, skill_name, category)
+        }
+        
+        # Add optional fields from frontmatter
+        if frontmatter:
+            if 'author' in frontmatter:
+                skill_entry['author'] = frontmatter['author']
+            if 'version' in frontmatter:
+                skill_entry['version'] = frontmatter['version']
+        
+        return skill_entry
+        
+    except Exception as e:
+        print(f"Warning: Failed to process {skill_file}: {e}")
+        return None
+
+def read_readme(repo_path: Path) -> str:
+    """Read README for category information."""
     readme_path = repo_path / 'README.md'
-    readme_content = ''
     if readme_path.exists():
-        readme_content = readme_path.read_text()
-    
-    # Find all SKILL.md files
+        return readme_path.read_text()
+    return ''
+
+def find_skill_files(repo_path: Path) -> List[Path]:
+    """Find all SKILL.md files, one and two levels deep."""
     skill_files = list(repo_path.glob('*/SKILL.md'))
     skill_files.extend(list(repo_path.glob('*/*/SKILL.md')))
+    return sorted(skill_files)
+
+def scan_skills(repo_root: str, manifest: Optional[SkillManifest] = None,
+                jobs: Optional[int] = None) -> List[Dict]:
+    """Scan repository for all skills and build index.
     
-    for skill_file in skill_files:
-        try:
-            content = skill_file.read_text()
-            frontmatter = extract_yaml_frontmatter(content)
-            
-            # Get skill directory
-            skill_dir = skill_file.parent
-            skill_name = frontmatter.get('name') if frontmatter else skill_dir.name
-            
-            # Build skill entry
-            skill_entry = {
-                'name': skill_name,
-                'path': str(skill_dir.relative_to(repo_path)),
-                'skill_file': str(skill_file.relative_to(repo_path)),
-                'description': extract_description(content, frontmatter),
-                'category': determine_category(str(skill_dir), readme_content),
-                'tags': extract_tags(content, skill_name, determine_category(str(skill_dir), readme_content))
-            }
-            
-            # Add optional fields from frontmatter
-            if frontmatter:
-                if 'author' in frontmatter:
-                    skill_entry['author'] = frontmatter['author']
-                if 'version' in frontmatter:
-                    skill_entry['version'] = frontmatter['version']
-            
-            skills.append(skill_entry)
-            
-        except Exception as e:
-            print(f"Warning: Failed to process {skill_file}: {e}")
-            continue
-    
-    return sorted(skills, key=lambda x: x['name'].lower())
-
-def generate_index(repo_root: str, output_file: str):
+    SKILL.md files are parsed across ``jobs`` processes (None = all cores) in
+    chunks; results keep file order so output is deterministic. With a
+    ``manifest``, unchanged SKILL.md files are served from the cache instead
+    of being read and parsed again.
+    """
+    repo_path = Path(repo_root)
+    readme_sections = build_category_sections(read_readme(repo_path))
+    skill_files = find_skill_files(repo_path)
+    
+    parse = partial(parse_skill, repo_path=repo_path, readme_sections=readme_sections)
+    if manifest is not None:
+        entries = manifest.update(skill_files, repo_path, parse, jobs=jobs)
+    else:
+        entries = map_in_processes(parse, skill_files, jobs)
+    
+    skills = [entry for entry in entries if entry]
+    return sorted(skills, key=lambda x: (x['name'].lower(), x['path']))
+
+def generate_index(repo_root: str, output_file: str, incremental: bool = False,
+                   jobs: Optional[int] = None):
     """Generate skill index file."""
     print("Scanning repository for skills...")
-    skills = scan_skills(repo_root)
+    output_path = Path(output_file)
+    
+    manifest = None
+    if incremental:
+        # Categories come from the README, so a README change invalidates everything
+        readme_digest = hashlib.sha256(read_readme(Path(repo_root)).encode('utf-8')).hexdigest()
+        manifest = SkillManifest(
+            manifest_path_for(output_path, 'index-skills'),
+            context={'generator': 'index-skills', 'index_version': '1.0', 'readme': readme_digest},
+        )
+    
+    skills = scan_skills(repo_root, manifest, jobs=jobs)
     
     index = {
         'version': '1.0',
@@ -175,11 +228,23 @@ def generate_index(repo_root: str, output_file: str):
     
     print(f"Found {len(skills)} skills across {len(index['categories'])} categories")
     
+    if manifest is not None:
+        stats = manifest.stats
+        print(f"Incremental: {stats['added']} added, {stats['reparsed']} changed, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        if not manifest.changed and manifest.output_current(output_path):
+            manifest.save()
+            print(f"✅ {output_path} is up to date")
+            return
+    
     # Write index file
-    output_path = Path(output_file)
     with open(output_path, 'w') as f:
         json.dump(index, f, indent=2)
     
+    if manifest is not None:
+        manifest.record_output(output_path)
+        manifest.save()
+    
     print(f"✅ Index written to {output_path}")
     
     # Print summary
@@ -203,6 +268,17 @@ def main():
         default='SKILL-INDEX.json',
         help='Output file for skill index (default: SKILL-INDEX.json)'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only reparse SKILL.md files whose content changed since the last run'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of parser processes (default: all cores, 1 = sequential)'
+    )
     
     args = parser.parse_args()
     
@@ -210,7 +286,7 @@ def main():
     script_dir = Path(__file__).parent
     repo_root = script_dir.parent
     
-    generate_index(str(repo_root), args.output)
+    generate_index(str(repo_root), args.output, incremental=args.incremental, jobs=args.jobs)
 
 if __name__ == '__main__':
     main()
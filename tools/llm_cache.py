@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache - Persistent SQLite cache for chat-completion results.
+
+Entries are keyed by model, a hash of the request (messages and sampling
+parameters) and the version of the skill index the prompt was built from.
+Opening the cache with a new index version drops every entry built from an
+older one, so regenerating SKILL-INDEX.json invalidates cached answers
+automatically.
+
+Entries expire after a TTL, and the least recently used entries are evicted
+once the cache holds more than ``max_entries``. Hit/miss counters are kept
+both for the current process (``stats``) and across runs (``totals()``).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    index_version TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def default_cache_path() -> Path:
+    """Per-user cache location (honours XDG_CACHE_HOME)."""
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'awesome-claude-skills' / 'llm-responses.sqlite3'
+
+
+def index_version(index_path: str) -> str:
+    """Version tag for a skill index: SHA-256 of the JSON file's contents."""
+    try:
+        return hashlib.sha256(Path(index_path).read_bytes()).hexdigest()
+    except OSError:
+        return 'missing'
+
+
+def request_key(model: str, messages: List[Dict], params: Dict) -> str:
+    """Stable hash of a chat-completion request."""
+    payload = json.dumps(
+        {'model': model, 'messages': messages, 'params': params},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed TTL + LRU cache for LLM responses. Thread-safe."""
+
+    def __init__(self, path: Optional[Path] = None, index_version: str = '',
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path else default_cache_path()
+        self.index_version = index_version
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._db:
+            self._db.executescript(SCHEMA)
+            # Regenerated index: everything built from the old one is stale
+            self._db.execute(
+                "DELETE FROM responses WHERE index_version != ?", (self.index_version,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _count(self, name: str):
+        self.stats[name] += 1
+        self._db.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, model: str, messages: List[Dict], params: Dict) -> Optional[str]:
+        """Return the cached response text, or None on a miss."""
+        key = request_key(model, messages, params)
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT response, created FROM responses WHERE key = ? AND index_version = ?",
+                (key, self.index_version),
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self._count('misses')
+                return None
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._count('hits')
+            return row[0]
+
+    def put(self, model: str, messages: List[Dict], params: Dict, response: str):
+        """Store a response and evict expired and least recently used entries."""
+        key = request_key(model, messages, params)
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, index_version, response, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, self.index_version, response, now, now),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def totals(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters accumulated across runs."""
+        with self._lock:
+            counters = dict(self._db.execute("SELECT name, value FROM counters").fetchall())
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            'entries': entries,
+            'hits': counters.get('hits', 0),
+            'misses': counters.get('misses', 0),
+        }
+
+    def clear(self):
+        """Remove every cached response (counters are kept)."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+LLM Stub Server - Local OpenAI-compatible stand-in for offline testing.
+
+Answers ``POST /v1/chat/completions`` (streaming and non-streaming) and
+``GET /v1/models`` with canned text, after a configurable time to first
+token and per-token delay. Usage counts are estimated at four characters
+per token. model-tester.py's benchmark and matrix modes can be pointed at
+it with ``--base-url`` to exercise the whole harness without a model or an
+API key:
+
+    python tools/llm_stub_server.py --port 8088 --ttft 0.2 --token-delay 0.02
+    python tools/model-tester.py --benchmark --providers ollama \\
+        --base-url http://127.0.0.1:8088/v1 --models ollama:stub \\
+        --skills universal/tier-1-instruction-only/domain-name-brainstormer
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8088
+DEFAULT_REPLY = ("Here is a brief example of what I can do based on my instructions: "
+                 "I follow the workflow step by step, ask for missing details, and "
+                 "summarize the result clearly at the end.")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def split_tokens(text: str) -> List[str]:
+    """Split text into word-sized pieces, keeping the spaces."""
+    pieces = []
+    for i, word in enumerate(text.split(' ')):
+        pieces.append(word if i == 0 else ' ' + word)
+    return [piece for piece in pieces if piece]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = 'LLMStub/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/v1/models':
+            self.send_json(HTTPStatus.OK, {
+                'object': 'list',
+                'data': [{'id': 'stub', 'object': 'model', 'owned_by': 'llm-stub'}],
+            })
+        else:
+            self.send_json(HTTPStatus.NOT_FOUND, {'error': {'message': f"unknown endpoint '{self.path}'"}})
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/v1/chat/completions':
+            self.send_json(HTTPStatus.NOT_FOUND, {'error': {'message': f"unknown endpoint '{self.path}'"}})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            messages = request['messages']
+        except (ValueError, KeyError) as e:
+            self.send_json(HTTPStatus.BAD_REQUEST, {'error': {'message': f"invalid request: {e}"}})
+            return
+
+        self.server.requests += 1
+        if self.server.fail_every and self.server.requests % self.server.fail_every == 0:
+            self.send_json(HTTPStatus.TOO_MANY_REQUESTS, {'error': {'message': 'rate limited (stub)'}},
+                           headers={'Retry-After': '0'})
+            return
+
+        model = request.get('model', 'stub')
+        prompt_tokens = sum(estimate_tokens(str(m.get('content', ''))) for m in messages)
+        pieces = split_tokens(self.server.reply)
+        max_tokens = request.get('max_tokens') or request.get('max_completion_tokens')
+        if max_tokens:
+            pieces = pieces[:max_tokens]
+        usage = {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': len(pieces),
+            'total_tokens': prompt_tokens + len(pieces),
+        }
+
+        time.sleep(self.server.ttft)
+        if request.get('stream'):
+            include_usage = (request.get('stream_options') or {}).get('include_usage')
+            self.stream(model, pieces, usage if include_usage else None)
+        else:
+            time.sleep(self.server.token_delay * max(0, len(pieces) - 1))
+            self.send_json(HTTPStatus.OK, {
+                'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': ''.join(pieces)},
+                    'finish_reason': 'stop',
+                }],
+                'usage': usage,
+            })
+
+    def stream(self, model: str, pieces: List[str], usage: Optional[Dict]):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        def event(choices, **extra):
+            payload = {'id': chunk_id, 'object': 'chat.completion.chunk', 'created': created,
+                       'model': model, 'choices': choices, **extra}
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        for i, piece in enumerate(pieces):
+            if i:
+                time.sleep(self.server.token_delay)
+            delta = {'role': 'assistant', 'content': piece} if i == 0 else {'content': piece}
+            event([{'index': 0, 'delta': delta, 'finish_reason': None}])
+        event([{'index': 0, 'delta': {}, 'finish_reason': 'stop'}])
+        if usage is not None:
+            event([], usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def send_json(self, status: HTTPStatus, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], ttft: float = 0.05, token_delay: float = 0.01,
+                 reply: str = DEFAULT_REPLY, fail_every: int = 0, verbose: bool = False):
+        self.ttft = ttft
+        self.token_delay = token_delay
+        self.reply = reply
+        self.fail_every = fail_every    # answer every Nth request with a 429 (0 = never)
+        self.verbose = verbose
+        self.requests = 0
+        super().__init__(address, StubHandler)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/v1"
+
+
+def start_stub_server(**options) -> StubServer:
+    """Start a StubServer on a free local port in a daemon thread (for tests)."""
+    server = StubServer((DEFAULT_HOST, 0), **options)
+    threading.Thread(target=server.serve_forever, name='llm-stub', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local OpenAI-compatible stand-in server for offline testing"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--ttft", type=float, default=0.05,
+                        help="Seconds before the first token (default: 0.05)")
+    parser.add_argument("--token-delay", type=float, default=0.01,
+                        help="Seconds between tokens (default: 0.01)")
+    parser.add_argument("--reply", default=DEFAULT_REPLY, help="Text every completion returns")
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Answer every Nth request with HTTP 429, to exercise retries (default: never)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), ttft=args.ttft, token_delay=args.token_delay,
+                        reply=args.reply, fail_every=args.fail_every, verbose=args.verbose)
+    print(f"🚀 Stub OpenAI API on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
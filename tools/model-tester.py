@@ -3,6 +3,17 @@
 Model Tester for Universal Skills
 
 Tests a skill across different models and providers to verify compatibility.
+
+With --matrix, tests many skills (skill directories, tier directories or
+globs) against every provider/model pair concurrently, with per-provider
+concurrency limits, rate limiting and retries (see skill_matrix.py). Results
+go to a resumable JSONL store; --update-metadata writes them into each
+skill's metadata.yaml compatibility section.
+
+With --benchmark, measures streaming latency and throughput with the full
+system prompt over repeated runs and writes CSV or JSON (see
+skill_benchmark.py). --base-url points either mode at any OpenAI-compatible
+server, such as llm_stub_server.py for offline runs.
 """
 
 import os
@@ -11,6 +22,12 @@ import argparse
 from pathlib import Path
 from typing import Dict, List
 
+from skill_benchmark import summarize_benchmark, write_benchmark
+from skill_matrix import (
+    PROVIDERS, ChatCaller, MatrixCase, MatrixRunner, ResultsStore, build_cases, expand_skills,
+    summarize, update_compatibility,
+)
+
 try:
     from openai import OpenAI
     OPENAI_AVAILABLE = True
@@ -19,6 +36,11 @@ except ImportError:
     print("Warning: openai package not installed. Install with: pip install openai")
 
 REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_MATRIX_SKILLS = [
+    str(REPO_ROOT / "universal" / "tier-1-instruction-only"),
+    str(REPO_ROOT / "universal" / "tier-2-tool-enhanced"),
+]
+DEFAULT_RESULTS_PATH = REPO_ROOT / "universal" / ".model-matrix.jsonl"
 
 
 def test_skill_with_model(skill_path: Path, provider: str, model: str, api_key: str = None) -> Dict:
@@ -112,15 +134,252 @@ def test_skill(skill_path: Path, providers: List[str], models: Dict[str, List[st
     return results
 
 
+def parse_provider_values(items: List[str], option: str) -> Dict[str, float]:
+    """Parse repeated PROVIDER=N options"""
+    values = {}
+    for item in items or []:
+        provider, _, value = item.partition("=")
+        if provider not in PROVIDERS or not value:
+            raise ValueError(f"{option} expects PROVIDER=N with a known provider, got '{item}'")
+        values[provider] = float(value)
+    return values
+
+
+def provider_configs(args, benchmark: bool = False) -> Dict:
+    """PROVIDERS with the --concurrency, --rpm and --base-url overrides applied
+    
+    Benchmarks default to one call at a time per provider, so concurrent
+    calls don't inflate each other's latency.
+    """
+    concurrency = parse_provider_values(args.concurrency, "--concurrency")
+    rpm = parse_provider_values(args.rpm, "--rpm")
+    configs = {}
+    for name, config in PROVIDERS.items():
+        default_concurrency = 1 if benchmark else config.concurrency
+        configs[name] = config._replace(
+            base_url=args.base_url or config.base_url,
+            concurrency=max(1, int(concurrency.get(name, default_concurrency))),
+            requests_per_minute=rpm.get(name, config.requests_per_minute))
+    return configs
+
+
+def select_matrix(args, providers: List[str], models: Dict[str, List[str]],
+                  api_keys: Dict[str, str]):
+    """Skill directories and provider -> models to run, or None after printing why not"""
+    skills = expand_skills(args.skills or DEFAULT_MATRIX_SKILLS)
+    if not skills:
+        print("Error: No skills with a system-prompt.md matched")
+        return None
+    selected = {}
+    for provider in providers:
+        if not models.get(provider):
+            continue
+        if not api_keys.get(provider):
+            print(f"Skipping {provider}: no API key (set {PROVIDERS[provider].api_key_env})")
+            continue
+        selected[provider] = models[provider]
+    if not selected:
+        print("Error: No provider/model pairs to test")
+        return None
+    return skills, selected
+
+
+def print_progress(result: Dict):
+    status = "✓" if result["success"] else f"✗ ({result.get('error', 'unknown error')})"
+    run = "warm-up" if result["run"] < 0 else f"#{result['run']}"
+    print(f"{Path(result['skill']).name} {result['provider']}/{result['model']} "
+          f"{run}: {status}", flush=True)
+
+
+def run_matrix(args, providers: List[str], models: Dict[str, List[str]], api_keys: Dict[str, str]) -> int:
+    """Run every selected skill against every provider/model pair"""
+    try:
+        configs = provider_configs(args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    selection = select_matrix(args, providers, models, api_keys)
+    if selection is None:
+        return 1
+    skills, selected = selection
+    args.repeat = args.repeat or 1
+    cases = build_cases(skills, selected, repeat=args.repeat)
+    
+    store = ResultsStore(Path(args.results))
+    remaining = sum(1 for case in cases if not store.passed(case))
+    print(f"\nMatrix: {len(skills)} skills x {sum(len(m) for m in selected.values())} models "
+          f"x {args.repeat} runs = {len(cases)} cases ({len(cases) - remaining} already passed)")
+    print("=" * 60)
+    
+    caller = ChatCaller(api_keys, configs, max_tokens=args.max_tokens)
+    runner = MatrixRunner(caller, store, configs, max_retries=args.retries, progress=print_progress)
+    try:
+        runner.run(cases)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; rerun with --results {args.results} to resume")
+        return 1
+    
+    # Summarize this matrix only (the store may hold other skills and models)
+    keys = {case.key for case in cases}
+    results = [r for key, r in store.results.items() if key in keys]
+    print("\n" + "=" * 60)
+    print("Matrix Summary:")
+    print("=" * 60)
+    print(f"{'Model':<45} {'Pass':>7} {'p50 s':>7} {'p90 s':>7} {'p99 s':>7} {'TTFT p50':>9} {'Tokens':>8}")
+    for name, stats in summarize(results).items():
+        def seconds(value):
+            return f"{value:.2f}" if value is not None else "-"
+        print(f"{name:<45} {stats['passed']:>3}/{stats['cases']:<3} "
+              f"{seconds(stats['latency_p50_s']):>7} {seconds(stats['latency_p90_s']):>7} "
+              f"{seconds(stats['latency_p99_s']):>7} {seconds(stats['ttft_p50_s']):>9} "
+              f"{stats['prompt_tokens'] + stats['completion_tokens']:>8}")
+    print(f"\nResults stored in: {args.results}")
+    
+    if args.update_metadata:
+        updated = sum(update_compatibility(skill, results) for skill in skills)
+        print(f"Updated compatibility in {updated} metadata.yaml files")
+    
+    return 0 if all(r.get("success") for r in results) else 1
+
+
+def run_benchmark(args, providers: List[str], models: Dict[str, List[str]], api_keys: Dict[str, str]) -> int:
+    """Measure streaming latency and throughput for every skill and model"""
+    try:
+        configs = provider_configs(args, benchmark=True)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if args.skill and not args.skills:
+        args.skills = [args.skill]
+    selection = select_matrix(args, providers, models, api_keys)
+    if selection is None:
+        return 1
+    skills, selected = selection
+    runs = args.repeat or 5
+    cases = build_cases(skills, selected, repeat=runs)
+    # Warm-up runs (negative run numbers) load the model and are not measured
+    cases = [MatrixCase(c.skill, c.provider, c.model, -1 - i)
+             for c in cases if c.run == 0 for i in range(args.warmup)] + cases
+    
+    print(f"\nBenchmark: {len(skills)} skills x {sum(len(m) for m in selected.values())} models "
+          f"x {runs} runs (+{args.warmup} warm-up)")
+    print("=" * 60)
+    
+    caller = ChatCaller(api_keys, configs, max_tokens=args.max_tokens, record_gaps=True)
+    runner = MatrixRunner(caller, ResultsStore(None), configs, max_retries=args.retries,
+                          progress=print_progress if args.verbose else None)
+    try:
+        results = runner.run(cases)
+    except KeyboardInterrupt:
+        print("\nInterrupted")
+        return 1
+    rows = summarize_benchmark(results)
+    
+    print(f"\n{'Skill':<30} {'Model':<30} {'Prompt':>8} {'TTFT p50':>9} {'ITL p50':>8} "
+          f"{'ITL p99':>8} {'tok/s':>7} {'Fail':>5}")
+    for row in rows:
+        def value(key, fmt):
+            return format(row[key], fmt) if row[key] is not None else "-"
+        print(f"{row['skill'][:30]:<30} {(row['provider'] + '/' + row['model'])[:30]:<30} "
+              f"{value('prompt_chars', 'd'):>8} {value('ttft_p50_s', '.3f'):>9} "
+              f"{value('itl_p50_s', '.4f'):>8} {value('itl_p99_s', '.4f'):>8} "
+              f"{value('tokens_per_s_mean', '.1f'):>7} {row['failures']:>5}")
+    
+    if args.output:
+        write_benchmark(rows, Path(args.output), args.format)
+        print(f"\nBenchmark results saved to: {args.output}")
+    
+    return 0 if all(row["failures"] == 0 for row in rows) else 1
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test universal skills across different models"
     )
     parser.add_argument(
         "--skill",
-        required=True,
         help="Path to skill directory (e.g., universal/tier-1-instruction-only/domain-name-brainstormer)"
     )
+    parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Test many skills against all selected models concurrently"
+    )
+    parser.add_argument(
+        "--skills",
+        nargs="+",
+        help="Skill directories, tier directories or globs for --matrix (default: Tier 1 and Tier 2)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure streaming TTFT, inter-token latency and tokens/s with the full system prompt"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=None,
+        help="Runs per skill and model (default: 1 for --matrix, 5 for --benchmark)"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Unmeasured warm-up runs per skill and model in --benchmark mode (default: 1)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write --benchmark results to this file (CSV, or JSON for a .json name)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "json"],
+        help="Format for --output (default: from the file extension)"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="OpenAI-compatible endpoint to use for the selected providers "
+             "(e.g. a remote Ollama or tools/llm_stub_server.py)"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Print every --benchmark run as it finishes"
+    )
+    parser.add_argument(
+        "--concurrency",
+        action="append",
+        metavar="PROVIDER=N",
+        help="Calls in flight per provider (defaults: openrouter=4, ollama=1)"
+    )
+    parser.add_argument(
+        "--rpm",
+        action="append",
+        metavar="PROVIDER=N",
+        help="Requests per minute per provider, 0 = unlimited (defaults: openrouter=60, ollama=0)"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries for rate limits, server errors and timeouts (default: 3)"
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=200,
+        help="Completion token limit per call in --matrix and --benchmark modes (default: 200)"
+    )
+    parser.add_argument(
+        "--results",
+        default=str(DEFAULT_RESULTS_PATH),
+        help="Resumable JSONL results store for --matrix (default: universal/.model-matrix.jsonl)"
+    )
+    parser.add_argument(
+        "--update-metadata",
+        action="store_true",
+        help="Write --matrix results into each skill's metadata.yaml compatibility section"
+    )
     parser.add_argument(
         "--providers",
         nargs="+",
@@ -148,12 +407,6 @@ def main():
         print("Error: openai package required. Install with: pip install openai")
         return 1
     
-    # Parse skill path
-    skill_path = Path(args.skill)
-    if not skill_path.exists():
-        print(f"Error: Skill path not found: {args.skill}")
-        return 1
-    
     # Configure models to test
     if args.quick:
         models = {
@@ -165,7 +418,7 @@ def main():
         # Parse models from command line
         models = {}
         for item in args.models.split(","):
-            provider, model = item.split(":")
+            provider, model = item.split(":", 1)
             if provider not in models:
                 models[provider] = []
             models[provider].append(model)
@@ -188,6 +441,19 @@ def main():
         "ollama": "ollama"
     }
     
+    if args.benchmark:
+        return run_benchmark(args, providers, models, api_keys)
+    if args.matrix:
+        return run_matrix(args, providers, models, api_keys)
+    
+    # Parse skill path
+    if not args.skill:
+        parser.error("--skill is required unless --matrix or --benchmark is given")
+    skill_path = Path(args.skill)
+    if not skill_path.exists():
+        print(f"Error: Skill path not found: {args.skill}")
+        return 1
+    
     # Run tests
     print(f"\nTesting skill: {skill_path.name}")
     print("=" * 60)
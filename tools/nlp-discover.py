@@ -7,13 +7,44 @@ Uses Ollama Cloud Service with Gemini 3 Flash Preview model for:
 - Intelligent query interpretation
 - Skill explanations and recommendations
 - Natural language interactions
+
+Without network access, --mode vector ranks skills by cosine similarity of
+local TF-IDF/SVD embeddings (SKILL-INDEX.vectors.npz, see skill_vectors.py).
 """
 
 import os
 import json
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from llm_cache import DEFAULT_TTL_SECONDS, ResponseCache, index_version
+from skill_index_binary import open_search_index
+from skill_matrix import is_retryable, retry_delay
+from skill_search import SkillSearchIndex
+from skill_vectors import NUMPY_AVAILABLE, SkillVectorIndex, open_vector_index
+
+# Search modes: auto picks llm when a client is available, otherwise vector
+# (when numpy is installed), otherwise keyword
+SEARCH_MODES = ['auto', 'llm', 'vector', 'keyword']
+
+# Skills retrieved locally and sent to the model for reranking (0 = whole catalogue)
+DEFAULT_RERANK_CANDIDATES = 50
+
+# Reciprocal rank fusion constant for merging keyword and vector rankings
+RRF_K = 60
+
+MODEL = "gemini-3-flash-preview"  # Gemini 3 Flash Preview model
+
+# Retry policy for rate-limited or failed model calls
+MAX_RETRIES = 4
+
+# Concurrent model calls in the CLI (interpretation, search, explanations)
+DEFAULT_WORKERS = 4
+
 
 # Try to import OpenAI library for Ollama cloud
 try:
@@ -27,9 +58,20 @@ except ImportError:
 class NLPSkillDiscovery:
     """NLP-powered skill discovery using Ollama Cloud + Gemini 3 Flash Preview"""
     
-    def __init__(self, index_path: str, api_key: Optional[str] = None, endpoint: Optional[str] = None):
-        """Initialize NLP discovery tool."""
-        self.index = self.load_index(index_path)
+    def __init__(self, index_path: str, api_key: Optional[str] = None, endpoint: Optional[str] = None,
+                 mode: str = 'auto', rerank_candidates: int = DEFAULT_RERANK_CANDIDATES,
+                 cache: Optional[ResponseCache] = None):
+        """Initialize NLP discovery tool.
+        
+        ``cache`` stores model responses across runs; pass None to always call
+        the model.
+        """
+        self.index_path = index_path
+        self.index, self.search_index = self.load_index(index_path)
+        self.mode = mode
+        self.rerank_candidates = rerank_candidates
+        self.cache = cache
+        self._vector_index: Optional[SkillVectorIndex] = None
         
         # Try API keys in order of preference (OLLAMA_API_KEY is primary)
         self.api_key = (
@@ -53,12 +95,16 @@ class NLPSkillDiscovery:
         
         self.client = None
         
-        if OLLAMA_AVAILABLE and self.api_key:
+        if mode in ('vector', 'keyword'):
+            # Offline modes never touch the network
+            pass
+        elif OLLAMA_AVAILABLE and self.api_key:
             try:
                 # Initialize Ollama Cloud client
                 self.client = OpenAI(
                     base_url=self.endpoint,
-                    api_key=self.api_key
+                    api_key=self.api_key,
+                    max_retries=0  # _complete() retries with its own backoff
                 )
                 endpoint_name = self.endpoint.split('//')[1].split('/')[0]
                 print(f"✅ NLP-enhanced search enabled via {endpoint_name}")
@@ -67,33 +113,115 @@ class NLPSkillDiscovery:
                 print(f"⚠️  Could not initialize Ollama Cloud: {e}")
                 self.client = None
         elif not self.api_key:
-            print("⚠️  No Ollama API key found. Using basic search.")
+            print("⚠️  No Ollama API key found. Using local search.")
             print("   Required: OLLAMA_API_KEY environment variable")
             print("   Set with: export OLLAMA_API_KEY='your-key'")
     
-    def load_index(self, index_path: str) -> Dict:
-        """Load skill index from file."""
+    def load_index(self, index_path: str) -> Tuple[Dict, SkillSearchIndex]:
+        """Load skill index and search structures (memory-mapped when available)."""
         try:
-            with open(index_path, 'r') as f:
-                return json.load(f)
+            return open_search_index(index_path)
         except FileNotFoundError:
             print(f"❌ Skill index not found at {index_path}")
             print("Run 'python tools/index-skills.py' to generate the index first.")
             sys.exit(1)
     
-    def semantic_search(self, query: str, top_k: int = 5) -> List[Dict]:
+    def reload_index(self):
+        """Re-open the skill index after it was regenerated, keeping the client warm."""
+        self.index, self.search_index = self.load_index(self.index_path)
+        self._vector_index = None
+        if self.cache is not None:
+            self.cache.index_version = index_version(self.index_path)
+
+    @property
+    def vector_index(self) -> Optional[SkillVectorIndex]:
+        """Skill embeddings, loaded on first use (None without numpy)."""
+        if self._vector_index is None and NUMPY_AVAILABLE:
+            self._vector_index = open_vector_index(self.index_path, self.index['skills'])
+        return self._vector_index
+    
+    def resolve_mode(self) -> str:
+        """Return the concrete search mode for 'auto'."""
+        if self.mode != 'auto':
+            return self.mode
+        if self.client:
+            return 'llm'
+        return 'vector' if NUMPY_AVAILABLE else 'keyword'
+    
+    def _complete(self, messages: List[Dict], temperature: float, max_tokens: int) -> str:
+        """Run a chat completion, answering from the response cache when possible.
+        
+        Rate-limit (429), server (5xx), timeout and connection errors are
+        retried with exponential backoff, honouring Retry-After when the
+        server sends it.
+        """
+        params = {"temperature": temperature, "max_tokens": max_tokens}
+        if self.cache is not None:
+            cached = self.cache.get(MODEL, messages, params)
+            if cached is not None:
+                return cached
+        
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    model=MODEL,
+                    messages=messages,
+                    **params
+                )
+                break
+            except Exception as e:
+                if attempt == MAX_RETRIES or not is_retryable(e):
+                    raise
+                time.sleep(retry_delay(e, attempt))
+        content = response.choices[0].message.content
+        
+        if self.cache is not None:
+            self.cache.put(MODEL, messages, params, content)
+        return content
+    
+    def retrieve_candidates(self, query: str, limit: int) -> List[Dict]:
+        """
+        Fast local first stage: fuse BM25 (any term) and vector rankings with
+        reciprocal rank fusion and return the best ``limit`` skills.
+        """
+        rankings = [self.search_index.search_ids(query, limit, match='any')]
+        if self.mode != 'keyword' and self.vector_index is not None:
+            rankings.append(self.vector_index.search_ids(query, limit))
+        
+        fused: Dict[int, float] = {}
+        for ranking in rankings:
+            for rank, (skill_id, _) in enumerate(ranking):
+                fused[skill_id] = fused.get(skill_id, 0.0) + 1.0 / (RRF_K + rank + 1)
+        
+        best = sorted(fused, key=lambda skill_id: (-fused[skill_id], skill_id))[:limit]
+        return [self.index['skills'][skill_id] for skill_id in best]
+    
+    def semantic_search(self, query: str, top_k: int = 5, candidates: Optional[int] = None) -> List[Dict]:
         """
         Use Gemini 3 Flash Preview to understand query intent and find relevant skills.
         
         This goes beyond keyword matching to understand what the user actually wants.
+        In vector mode (or offline) ranking uses local embeddings instead.
+        
+        The model only reranks the ``candidates`` skills picked by the local
+        retriever (default: the instance's rerank_candidates); pass 0 to send
+        the whole catalogue as context.
         """
-        if not self.client:
-            # Fallback to basic keyword search
-            return self._basic_search(query)[:top_k]
+        mode = self.resolve_mode()
+        if mode == 'vector':
+            return self._vector_search(query, top_k)
+        if mode == 'keyword' or not self.client:
+            return self._local_search(query, top_k)
+        
+        if candidates is None:
+            candidates = self.rerank_candidates
         
         try:
-            # Create context with all skills
-            skills_context = self._build_skills_context()
+            # Stage 1: shortlist locally; stage 2: the model reranks the shortlist
+            pool = self.retrieve_candidates(query, max(candidates, top_k)) if candidates else []
+            if not pool:
+                pool = self.index['skills']
+            skills_context = self._build_skills_context(pool)
             
             # Ask Gemini to analyze the query and recommend skills
             prompt = f"""You are an expert skill recommender. A user is searching for: "{query}"
@@ -114,9 +242,8 @@ Respond ONLY with a JSON array of skill names, ranked by relevance:
 Example: ["pdf", "domain-name-brainstormer"]
 """
             
-            response = self.client.chat.completions.create(
-                model="gemini-3-flash-preview",  # Gemini 3 Flash Preview model
-                messages=[
+            content = self._complete(
+                [
                     {"role": "system", "content": "You are a helpful skill recommendation system. Respond only with valid JSON."},
                     {"role": "user", "content": prompt}
                 ],
@@ -125,7 +252,7 @@ Example: ["pdf", "domain-name-brainstormer"]
             )
             
             # Parse recommended skills
-            content = response.choices[0].message.content.strip()
+            content = content.strip()
             # Remove markdown code blocks if present
             if content.startswith("```"):
                 content = content.split("```")[1]
@@ -136,19 +263,22 @@ Example: ["pdf", "domain-name-brainstormer"]
             recommended_names = json.loads(content)
             
             # Return full skill objects in recommended order
+            lookup = {}
+            for skill in pool:
+                lookup.setdefault(skill['name'].lower(), skill)
+                lookup.setdefault(skill['path'].lower(), skill)
             result = []
             for name in recommended_names:
-                for skill in self.index['skills']:
-                    if skill['name'].lower() == name.lower() or skill['path'].lower() == name.lower():
-                        result.append(skill)
-                        break
+                skill = lookup.get(str(name).lower())
+                if skill is not None and skill not in result:
+                    result.append(skill)
             
             return result[:top_k]
             
         except Exception as e:
             print(f"⚠️  NLP search failed: {e}")
-            print("   Falling back to basic keyword search...")
-            return self._basic_search(query)[:top_k]
+            print("   Falling back to local search...")
+            return self._local_search(query, top_k)
     
     def explain_skill(self, skill: Dict) -> str:
         """
@@ -173,17 +303,14 @@ Provide:
 
 Keep it concise and practical."""
             
-            response = self.client.chat.completions.create(
-                model="gemini-3-flash-preview",
-                messages=[
+            return self._complete(
+                [
                     {"role": "system", "content": "You are a helpful assistant explaining software tools clearly and concisely."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.5,
                 max_tokens=300
-            )
-            
-            return response.choices[0].message.content.strip()
+            ).strip()
             
         except Exception as e:
             print(f"⚠️  Could not generate explanation: {e}")
@@ -214,48 +341,57 @@ Example queries:
 - "business stuff" → "You're looking for business and marketing tools like brand guidelines, lead research, or competitive analysis."
 """
             
-            response = self.client.chat.completions.create(
-                model="gemini-3-flash-preview",
-                messages=[
+            return self._complete(
+                [
                     {"role": "system", "content": "You are a helpful search assistant that clarifies user intentions."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.4,
                 max_tokens=100
-            )
-            
-            return response.choices[0].message.content.strip()
+            ).strip()
             
         except Exception as e:
             return f"Searching for: {query}"
     
-    def _build_skills_context(self) -> str:
-        """Build a concise context string with all skills."""
+    def _build_skills_context(self, skills: Optional[List[Dict]] = None) -> str:
+        """Build a concise context string with the given skills (default: all)."""
         lines = []
-        for skill in self.index['skills']:
+        for skill in (self.index['skills'] if skills is None else skills):
             desc = skill['description'][:150] + "..." if len(skill['description']) > 150 else skill['description']
             lines.append(f"- {skill['name']}: {desc} (Category: {skill['category']})")
         return "\n".join(lines)
     
+    def _vector_search(self, query: str, top_k: int) -> List[Dict]:
+        """Offline semantic search: cosine similarity over skill embeddings."""
+        if self.vector_index is None:
+            print("⚠️  numpy not installed. Using basic search.")
+            print("   Install with: pip install numpy")
+            return self._basic_search(query)[:top_k]
+        results = self.vector_index.search_ids(query, top_k)
+        if not results:
+            return self._basic_search(query)[:top_k]
+        return [self.index['skills'][skill_id] for skill_id, _ in results]
+    
+    def _local_search(self, query: str, top_k: int) -> List[Dict]:
+        """Best available offline search (vector if possible, else keyword)."""
+        if self.mode != 'keyword' and NUMPY_AVAILABLE:
+            return self._vector_search(query, top_k)
+        return self._basic_search(query)[:top_k]
+    
     def _basic_search(self, query: str) -> List[Dict]:
-        """Fallback basic keyword search."""
-        query_lower = query.lower()
-        results = []
-        
-        for skill in self.index['skills']:
-            score = 0
-            if query_lower in skill['name'].lower():
-                score += 10
-            if query_lower in skill['description'].lower():
-                score += 5
-            if any(query_lower in tag for tag in skill['tags']):
-                score += 3
-            
-            if score > 0:
-                results.append({'skill': skill, 'score': score})
-        
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return [r['skill'] for r in results]
+        """Fallback keyword search (BM25 over the inverted index)."""
+        # Natural-language queries rarely share every term with a skill, so rank by any term
+        return self.search_index.search(query, match='any')
+
+def print_cache_stats(cache: Optional[ResponseCache]):
+    """Print response cache counters for this run and overall."""
+    if cache is None:
+        print("\n🗄️  Response cache disabled")
+        return
+    totals = cache.totals()
+    print(f"\n🗄️  Response cache: {cache.stats['hits']} hit(s), {cache.stats['misses']} miss(es) this run")
+    print(f"   All time: {totals['hits']} hits, {totals['misses']} misses, {totals['entries']} entries")
+    print(f"   File: {cache.path}")
 
 def main():
     import argparse
@@ -275,6 +411,9 @@ Examples:
   
   # Show more results
   python tools/nlp-discover.py "business tools" --top 10
+  
+  # Offline semantic search (no API key or network needed)
+  python tools/nlp-discover.py "send messages to my team" --mode vector
 
 Requirements:
   - Set OLLAMA_API_KEY environment variable (available in repo secrets)
@@ -302,6 +441,46 @@ Environment Variables:
         action='store_true',
         help='Generate detailed explanations for each skill'
     )
+    parser.add_argument(
+        '--mode',
+        choices=SEARCH_MODES,
+        default='auto',
+        help='Search mode: llm (Ollama Cloud), vector (offline embeddings), '
+             'keyword (BM25), or auto (default)'
+    )
+    parser.add_argument(
+        '--candidates',
+        type=int,
+        default=DEFAULT_RERANK_CANDIDATES,
+        help=f'Skills retrieved locally for the model to rerank '
+             f'(default: {DEFAULT_RERANK_CANDIDATES}, 0 = send the whole catalogue)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Maximum concurrent model calls (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the model instead of reusing cached responses'
+    )
+    parser.add_argument(
+        '--cache-path',
+        help='Response cache file (default: ~/.cache/awesome-claude-skills/llm-responses.sqlite3)'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_TTL_SECONDS / 3600,
+        help='Hours a cached response stays valid (default: %(default)g)'
+    )
+    parser.add_argument(
+        '--cache-stats',
+        action='store_true',
+        help='Print response cache hit/miss counters after the search'
+    )
     parser.add_argument(
         '--index',
         default='SKILL-INDEX.json',
@@ -324,50 +503,81 @@ Environment Variables:
     index_path = args.index if os.path.isabs(args.index) else os.path.join(repo_root, args.index)
     
     # Initialize NLP discovery
-    nlp = NLPSkillDiscovery(index_path, api_key=args.api_key, endpoint=args.endpoint)
-    
-    # Interpret the query
-    print(f"\n🔍 Query: \"{args.query}\"")
-    interpretation = nlp.interpret_query(args.query)
-    print(f"💡 {interpretation}\n")
-    
-    # Perform semantic search
-    results = nlp.semantic_search(args.query, top_k=args.top)
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResponseCache(
+                args.cache_path,
+                index_version=index_version(index_path),
+                ttl_seconds=args.cache_ttl * 3600,
+            )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Response cache unavailable: {e}")
     
-    if not results:
-        print("❌ No skills found matching your query.")
-        print("\nTry:")
-        print("  - Being more specific about what you want to accomplish")
-        print("  - Using different words to describe your need")
-        print("  - Browsing categories with: python tools/discover.py --categories")
-        return
+    nlp = NLPSkillDiscovery(index_path, api_key=args.api_key, endpoint=args.endpoint, mode=args.mode,
+                            rerank_candidates=args.candidates, cache=cache)
     
-    # Display results
-    print(f"Found {len(results)} relevant skill(s):\n")
-    print("="*80)
+    print(f"\n🔍 Query: \"{args.query}\"")
     
-    for i, skill in enumerate(results, 1):
-        print(f"\n{i}. 📦 {skill['name']}")
-        print(f"   📂 Category: {skill['category']}")
-        print(f"   📁 Path: {skill['path']}")
+    # Interpretation, search and explanations all run concurrently, so the
+    # wall-clock time is that of the slowest call rather than their sum
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        interpretation_future = pool.submit(nlp.interpret_query, args.query)
+        results = pool.submit(nlp.semantic_search, args.query, args.top).result()
         
+        explanation_futures = {}
         if args.explain:
-            print(f"\n   📝 Detailed Explanation:")
-            explanation = nlp.explain_skill(skill)
-            for line in explanation.split('\n'):
-                print(f"      {line}")
-        else:
-            desc = skill['description'][:200] + "..." if len(skill['description']) > 200 else skill['description']
-            print(f"   📝 {desc}")
+            explanation_futures = {
+                pool.submit(nlp.explain_skill, skill): (i, skill)
+                for i, skill in enumerate(results, 1)
+            }
+        
+        print(f"💡 {interpretation_future.result()}\n")
         
-        print(f"\n   📥 Installation:")
-        print(f"      Claude.ai: Upload '{skill['skill_file']}'")
-        print(f"      Claude Code: cp -r {skill['path']} ~/.config/claude-code/skills/")
+        if not results:
+            print("❌ No skills found matching your query.")
+            print("\nTry:")
+            print("  - Being more specific about what you want to accomplish")
+            print("  - Using different words to describe your need")
+            print("  - Browsing categories with: python tools/discover.py --categories")
+            if args.cache_stats:
+                print_cache_stats(cache)
+            return
         
-        print("\n" + "-"*80)
+        # Display results
+        print(f"Found {len(results)} relevant skill(s):\n")
+        print("="*80)
+        
+        for i, skill in enumerate(results, 1):
+            print(f"\n{i}. 📦 {skill['name']}")
+            print(f"   📂 Category: {skill['category']}")
+            print(f"   📁 Path: {skill['path']}")
+            
+            if not args.explain:
+                desc = skill['description'][:200] + "..." if len(skill['description']) > 200 else skill['description']
+                print(f"   📝 {desc}")
+            
+            print(f"\n   📥 Installation:")
+            print(f"      Claude.ai: Upload '{skill['skill_file']}'")
+            print(f"      Claude Code: cp -r {skill['path']} ~/.config/claude-code/skills/")
+            
+            print("\n" + "-"*80)
+        
+        # Stream explanations in the order they finish
+        if explanation_futures:
+            print(f"\n📝 Detailed Explanations:")
+            for future in as_completed(explanation_futures):
+                i, skill = explanation_futures[future]
+                print(f"\n{i}. 📦 {skill['name']}")
+                for line in future.result().split('\n'):
+                    print(f"      {line}")
+            print("\n" + "-"*80)
     
     print(f"\n💡 Tip: Use --explain flag for detailed explanations")
     print(f"💡 Tip: Use --top N to see more results")
+    
+    if args.cache_stats:
+        print_cache_stats(cache)
 
 if __name__ == '__main__':
     main()
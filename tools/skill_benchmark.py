@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Skill Benchmark - Streaming latency and throughput per skill and model.
+
+``model-tester.py --benchmark`` sends each skill's full system-prompt.md to
+each model with streaming on, one call at a time per provider so runs don't
+slow each other down, and repeats it. The calls go through
+skill_matrix.MatrixRunner (rate limits and retries included). Warm-up runs
+have negative run numbers and are left out of the statistics.
+
+summarize_benchmark() turns the runs into one row per skill and model:
+time to first token, inter-token latency (all gaps of all runs pooled),
+decode tokens per second, total latency and prompt size. write_benchmark()
+saves the rows as CSV or JSON.
+"""
+
+import csv
+import json
+import statistics
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from skill_matrix import percentile
+
+# Column order for CSV output
+BENCHMARK_FIELDS = [
+    "skill", "provider", "model", "runs", "failures",
+    "prompt_chars", "prompt_tokens", "completion_tokens",
+    "ttft_mean_s", "ttft_p50_s", "ttft_p90_s",
+    "itl_p50_s", "itl_p90_s", "itl_p99_s",
+    "tokens_per_s_mean", "tokens_per_s_p50",
+    "latency_p50_s", "latency_p90_s",
+]
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return statistics.fmean(values) if values else None
+
+
+def _round(value: Optional[float], digits: int = 4) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
+def summarize_benchmark(results: Iterable[Dict]) -> List[Dict]:
+    """One row per (skill, provider, model), sorted, from measured (run >= 0) results."""
+    groups: Dict[tuple, List[Dict]] = {}
+    for result in results:
+        if result.get("run", 0) < 0:
+            continue  # warm-up
+        groups.setdefault((result["skill"], result["provider"], result["model"]), []).append(result)
+
+    rows = []
+    for (skill, provider, model), runs in sorted(groups.items()):
+        passed = [r for r in runs if r.get("success")]
+        ttfts = [r["ttft_s"] for r in passed if r.get("ttft_s") is not None]
+        gaps = [gap for r in passed for gap in r.get("inter_token_s") or []]
+        rates = [r["tokens_per_s"] for r in passed if r.get("tokens_per_s")]
+        latencies = [r["latency_s"] for r in passed]
+        prompt_tokens = [r["prompt_tokens"] for r in passed if r.get("prompt_tokens") is not None]
+        completion_tokens = [r["completion_tokens"] for r in passed if r.get("completion_tokens") is not None]
+        prompt_file = Path(skill) / "system-prompt.md"
+        rows.append({
+            "skill": Path(skill).name,
+            "provider": provider,
+            "model": model,
+            "runs": len(runs),
+            "failures": len(runs) - len(passed),
+            "prompt_chars": len(prompt_file.read_text(encoding='utf-8')) if prompt_file.exists() else None,
+            "prompt_tokens": max(prompt_tokens) if prompt_tokens else None,
+            "completion_tokens": _round(_mean(completion_tokens), 1),
+            "ttft_mean_s": _round(_mean(ttfts)),
+            "ttft_p50_s": _round(percentile(ttfts, 50)),
+            "ttft_p90_s": _round(percentile(ttfts, 90)),
+            "itl_p50_s": _round(percentile(gaps, 50)),
+            "itl_p90_s": _round(percentile(gaps, 90)),
+            "itl_p99_s": _round(percentile(gaps, 99)),
+            "tokens_per_s_mean": _round(_mean(rates), 2),
+            "tokens_per_s_p50": _round(percentile(rates, 50), 2),
+            "latency_p50_s": _round(percentile(latencies, 50)),
+            "latency_p90_s": _round(percentile(latencies, 90)),
+        })
+    return rows
+
+
+def write_benchmark(rows: List[Dict], path: Path, fmt: Optional[str] = None):
+    """Write rows as CSV or JSON (``fmt``, else from the file extension)."""
+    path = Path(path)
+    fmt = fmt or ("json" if path.suffix.lower() == ".json" else "csv")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "json":
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"fields": BENCHMARK_FIELDS, "results": rows}, f, indent=2)
+            f.write("\n")
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=BENCHMARK_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
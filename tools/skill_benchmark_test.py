@@ -0,0 +1,77 @@
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from llm_stub_server import start_stub_server
+from skill_benchmark import BENCHMARK_FIELDS, summarize_benchmark, write_benchmark
+from skill_matrix import ChatCaller, MatrixCase, MatrixRunner, ProviderConfig, ResultsStore
+
+try:
+    import openai  # noqa: F401
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+
+@unittest.skipUnless(OPENAI_AVAILABLE, "openai package not installed")
+class TestStreamingBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.skill = Path(self.tmp.name) / "brainstormer"
+        self.skill.mkdir()
+        (self.skill / "system-prompt.md").write_text("# Brainstormer\n\n" + "Be helpful. " * 200)
+        self.server = start_stub_server(ttft=0.05, token_delay=0.005, reply="one two three four five six")
+        self.providers = {"stub": ProviderConfig("stub", self.server.base_url, None, 1, 0)}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def run_benchmark(self, cases):
+        caller = ChatCaller({"stub": "test"}, self.providers, max_tokens=50, record_gaps=True)
+        runner = MatrixRunner(caller, ResultsStore(None), self.providers, max_retries=2)
+        return runner.run(cases)
+
+    def test_streaming_metrics(self):
+        results = self.run_benchmark([MatrixCase(str(self.skill), "stub", "stub", 0)])
+        result = results[0]
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertGreaterEqual(result["ttft_s"], 0.05)
+        self.assertEqual(result["completion_tokens"], 6)
+        self.assertEqual(len(result["inter_token_s"]), 5)
+        self.assertGreater(sum(result["inter_token_s"]), 0.01)
+        self.assertGreater(result["prompt_tokens"], 500)
+        self.assertGreater(result["tokens_per_s"], 0)
+
+    def test_warmup_excluded_and_reports_written(self):
+        cases = [MatrixCase(str(self.skill), "stub", "stub", run) for run in (-1, 0, 1, 2)]
+        rows = summarize_benchmark(self.run_benchmark(cases))
+        self.assertEqual(len(rows), 1)
+        row = rows[0]
+        self.assertEqual((row["skill"], row["runs"], row["failures"]), ("brainstormer", 3, 0))
+        self.assertEqual(row["prompt_chars"], len((self.skill / "system-prompt.md").read_text()))
+        self.assertGreaterEqual(row["ttft_p50_s"], 0.05)
+        self.assertLessEqual(row["itl_p50_s"], row["itl_p99_s"])
+
+        out = Path(self.tmp.name)
+        write_benchmark(rows, out / "bench.csv")
+        with open(out / "bench.csv", newline='') as f:
+            reader = csv.DictReader(f)
+            self.assertEqual(reader.fieldnames, BENCHMARK_FIELDS)
+            self.assertEqual(next(reader)["model"], "stub")
+        write_benchmark(rows, out / "bench.json")
+        self.assertEqual(json.loads((out / "bench.json").read_text())["results"], rows)
+
+    def test_rate_limited_calls_are_retried(self):
+        self.server.fail_every = 2
+        cases = [MatrixCase(str(self.skill), "stub", "stub", run) for run in range(2)]
+        results = self.run_benchmark(cases)
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(self.server.requests, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
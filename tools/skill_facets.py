@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Skill Facets - Precomputed category and tag id sets for drill-down filtering.
+
+Built once per index (and stored inside SKILL-INDEX.bin), so listing
+categories or tags with their counts, filtering by either, and narrowing a
+search to a category or tag never rescans the catalogue. Lookups are
+case-insensitive; each facet keeps the spelling it was first seen with for
+display.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+
+class SkillFacets:
+    """Category -> skill ids and tag -> skill ids, with counts."""
+
+    def __init__(self, categories: Dict[str, List[int]], tags: Dict[str, List[int]],
+                 category_names: Dict[str, str], tag_names: Dict[str, str]):
+        # Keys are lowercased; id lists are ascending (index order)
+        self.categories = categories
+        self.tags = tags
+        self.category_names = category_names
+        self.tag_names = tag_names
+        self._id_sets: Dict[tuple, Set[int]] = {}
+
+    @classmethod
+    def build(cls, skills: Iterable[Dict]) -> 'SkillFacets':
+        categories: Dict[str, List[int]] = {}
+        tags: Dict[str, List[int]] = {}
+        category_names: Dict[str, str] = {}
+        tag_names: Dict[str, str] = {}
+
+        for skill_id, skill in enumerate(skills):
+            category = skill.get('category') or ''
+            key = category.lower()
+            category_names.setdefault(key, category)
+            categories.setdefault(key, []).append(skill_id)
+
+            for tag in skill.get('tags') or []:
+                key = tag.lower()
+                tag_names.setdefault(key, tag)
+                tag_ids = tags.setdefault(key, [])
+                if not tag_ids or tag_ids[-1] != skill_id:
+                    tag_ids.append(skill_id)
+
+        return cls(categories, tags, category_names, tag_names)
+
+    def to_dict(self) -> Dict:
+        return {
+            'categories': {self.category_names[k]: ids for k, ids in self.categories.items()},
+            'tags': {self.tag_names[k]: ids for k, ids in self.tags.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SkillFacets':
+        categories, category_names = {}, {}
+        for name, ids in data['categories'].items():
+            categories[name.lower()] = ids
+            category_names[name.lower()] = name
+        tags, tag_names = {}, {}
+        for name, ids in data['tags'].items():
+            tags[name.lower()] = ids
+            tag_names[name.lower()] = name
+        return cls(categories, tags, category_names, tag_names)
+
+    def category_ids(self, category: str) -> List[int]:
+        """Ids of the skills in a category (case-insensitive), in index order."""
+        return self.categories.get(category.lower(), [])
+
+    def tag_ids(self, tag: str) -> List[int]:
+        """Ids of the skills with a tag (case-insensitive), in index order."""
+        return self.tags.get(tag.lower(), [])
+
+    def category_count(self, category: str) -> int:
+        return len(self.category_ids(category))
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Display tag name -> number of skills, sorted by name."""
+        return {
+            self.tag_names[key]: len(self.tags[key])
+            for key in sorted(self.tags, key=lambda k: self.tag_names[k])
+        }
+
+    def _id_set(self, kind: str, key: str) -> Set[int]:
+        cached = self._id_sets.get((kind, key))
+        if cached is None:
+            source = self.categories if kind == 'category' else self.tags
+            cached = self._id_sets[(kind, key)] = set(source.get(key, ()))
+        return cached
+
+    def filter_ids(self, category: Optional[str] = None,
+                   tags: Sequence[str] = ()) -> Optional[Set[int]]:
+        """Ids matching a category and every given tag; None when unfiltered."""
+        sets = []
+        if category:
+            sets.append(self._id_set('category', category.lower()))
+        sets.extend(self._id_set('tag', tag.lower()) for tag in tags)
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
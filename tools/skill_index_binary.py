@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Binary Skill Index - Compact, memory-mappable companion to SKILL-INDEX.json.
+
+generate-skill-index.py writes SKILL-INDEX.bin next to SKILL-INDEX.json. The
+discovery tools open it with mmap and answer searches straight from the
+mapped pages, so a process never deserializes the whole catalogue and many
+workers share one copy of the index through the page cache.
+
+Layout (all integers little-endian):
+
+    header        fixed struct, see HEADER below; the meta JSON it points to
+                  also carries the category/tag facets (see skill_facets)
+    skill records num_skills x 7 string refs (name, path, skill_file,
+                  description, category, tags JSON, extra fields JSON)
+    term records  num_terms x (term string ref, first posting, posting count),
+                  sorted by term so lookups and prefix scans are binary searches
+    postings      (skill id u32, BM25 impact f32) pairs, grouped by term
+    string table  UTF-8 bytes referenced as (offset, length) pairs
+
+The header records the size, mtime and SHA-256 of the SKILL-INDEX.json it was
+built from; open_search_index() falls back to the JSON whenever they differ.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from skill_facets import SkillFacets
+from skill_search import SkillSearchIndex
+
+MAGIC = b'SKLIDX\x00\x01'
+FORMAT_VERSION = 1
+
+# magic, format version, num_skills, num_terms, source size, source mtime_ns,
+# source sha256, meta JSON ref, section offsets (records, terms, postings, strings)
+HEADER = struct.Struct('<8sIIIQQ32sII4Q')
+STRING_REF = struct.Struct('<II')
+SKILL_RECORD = struct.Struct('<' + 'II' * 7)
+TERM_RECORD = struct.Struct('<IIII')
+POSTING = struct.Struct('<If')
+
+# Meta JSON key holding the precomputed category/tag facets
+FACETS_KEY = '_facets'
+
+# Fields stored in their own record slot; everything else goes into "extra"
+RECORD_FIELDS = ('name', 'path', 'skill_file', 'description', 'category')
+
+
+def binary_index_path(index_path: str) -> str:
+    """Return the binary index path that sits next to a JSON index."""
+    return str(Path(index_path).with_suffix('.bin'))
+
+
+def _file_digest(path: str) -> bytes:
+    """SHA-256 of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+class _StringTable:
+    """Deduplicating UTF-8 string table builder."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, value: str) -> Tuple[int, int]:
+        ref = self.offsets.get(value)
+        if ref is None:
+            encoded = value.encode('utf-8')
+            ref = (len(self.data), len(encoded))
+            self.data.extend(encoded)
+            self.offsets[value] = ref
+        return ref
+
+
+def write_binary_index(index: Dict, output_path: str, source_path: Optional[str] = None):
+    """Serialize a skill index dict (and its search postings) to ``output_path``.
+
+    ``source_path`` is the JSON file the index was written to; its size, mtime
+    and hash are recorded so readers can detect a stale binary index.
+    """
+    skills = index['skills']
+    search_index = SkillSearchIndex(skills)
+    strings = _StringTable()
+
+    meta = {k: v for k, v in index.items() if k != 'skills'}
+    meta[FACETS_KEY] = search_index.facets.to_dict()
+    meta_ref = strings.add(json.dumps(meta, ensure_ascii=False))
+
+    records = bytearray()
+    for skill in skills:
+        refs = [strings.add(str(skill.get(field, ''))) for field in RECORD_FIELDS]
+        refs.append(strings.add(json.dumps(skill.get('tags') or [], ensure_ascii=False)))
+        extra = {k: v for k, v in skill.items() if k not in RECORD_FIELDS and k != 'tags'}
+        refs.append(strings.add(json.dumps(extra, ensure_ascii=False) if extra else ''))
+        records.extend(SKILL_RECORD.pack(*(n for ref in refs for n in ref)))
+
+    terms = bytearray()
+    postings = bytearray()
+    posting_count = 0
+    for term in sorted(search_index.postings, key=lambda t: t.encode('utf-8')):
+        term_postings = search_index.postings[term]
+        terms.extend(TERM_RECORD.pack(*strings.add(term), posting_count, len(term_postings)))
+        for skill_id, impact in term_postings:
+            postings.extend(POSTING.pack(skill_id, impact))
+        posting_count += len(term_postings)
+
+    source_size = source_mtime = 0
+    source_digest = b'\x00' * 32
+    if source_path and os.path.exists(source_path):
+        stat = os.stat(source_path)
+        source_size, source_mtime = stat.st_size, stat.st_mtime_ns
+        source_digest = _file_digest(source_path)
+
+    records_offset = HEADER.size
+    terms_offset = records_offset + len(records)
+    postings_offset = terms_offset + len(terms)
+    strings_offset = postings_offset + len(postings)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(skills), len(search_index.postings),
+        source_size, source_mtime, source_digest, *meta_ref,
+        records_offset, terms_offset, postings_offset, strings_offset,
+    )
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        for section in (header, records, terms, postings, strings.data):
+            f.write(section)
+    os.replace(tmp_path, output_path)
+
+
+class MappedSkillRecords(Sequence):
+    """Read-only sequence of skill dicts decoded on demand from the mapping."""
+
+    def __init__(self, owner: 'MappedSkillIndex'):
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return self._owner.num_skills
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._owner.skill(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('skill index out of range')
+        return self._owner.skill(i)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self._owner.skill(i)
+
+
+class MappedSkillIndex(SkillSearchIndex):
+    """SkillSearchIndex backed by an mmap'ed SKILL-INDEX.bin file."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.num_skills, self.num_terms,
+         self.source_size, self.source_mtime_ns, self.source_digest,
+         meta_offset, meta_length,
+         self._records, self._terms, self._postings, self._strings) = HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} binary skill index")
+
+        self.meta = json.loads(self._string(meta_offset, meta_length))
+        facets = self.meta.pop(FACETS_KEY, None)
+        # Files written before facets were stored build them on first use
+        self._facets = SkillFacets.from_dict(facets) if facets else None
+        self.skills = MappedSkillRecords(self)
+
+    def close(self):
+        self._mm.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def _term_bytes(self, i: int) -> bytes:
+        offset, length, _, _ = TERM_RECORD.unpack_from(self._mm, self._terms + i * TERM_RECORD.size)
+        start = self._strings + offset
+        return self._mm[start:start + length]
+
+    def _find_term(self, term: bytes) -> int:
+        """Index of the first term record >= ``term`` (lower bound)."""
+        lo, hi = 0, self.num_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_bytes(mid) < term:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def skill(self, i: int) -> Dict:
+        """Decode one skill record."""
+        refs = SKILL_RECORD.unpack_from(self._mm, self._records + i * SKILL_RECORD.size)
+        values = [self._string(refs[j], refs[j + 1]) for j in range(0, len(refs), 2)]
+        skill = dict(zip(RECORD_FIELDS, values[:len(RECORD_FIELDS)]))
+        skill['tags'] = json.loads(values[len(RECORD_FIELDS)])
+        extra = values[len(RECORD_FIELDS) + 1]
+        if extra:
+            skill.update(json.loads(extra))
+        return skill
+
+    def get_postings(self, term: str) -> List[Tuple[int, float]]:
+        encoded = term.encode('utf-8')
+        i = self._find_term(encoded)
+        if i >= self.num_terms or self._term_bytes(i) != encoded:
+            return []
+        _, _, first, count = TERM_RECORD.unpack_from(self._mm, self._terms + i * TERM_RECORD.size)
+        start = self._postings + first * POSTING.size
+        return list(POSTING.iter_unpack(self._mm[start:start + count * POSTING.size]))
+
+    def terms_with_prefix(self, prefix: str, limit: int) -> List[str]:
+        encoded = prefix.encode('utf-8')
+        matches = []
+        i = self._find_term(encoded)
+        while i < self.num_terms and len(matches) < limit:
+            term = self._term_bytes(i)
+            if not term.startswith(encoded):
+                break
+            matches.append(term.decode('utf-8'))
+            i += 1
+        return matches
+
+    def is_fresh(self, source_path: str) -> bool:
+        """True if the JSON index this file was built from is unchanged."""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            # No JSON next to it: the binary index is all we have
+            return True
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime_ns == self.source_mtime_ns:
+            return True
+        # mtime changes on checkout; confirm with the content hash
+        return _file_digest(source_path) == self.source_digest
+
+
+def open_search_index(index_path: str, prefer_binary: bool = True) -> Tuple[Dict, SkillSearchIndex]:
+    """Open a skill index for searching.
+
+    Uses the memory-mapped SKILL-INDEX.bin next to ``index_path`` when it
+    exists and is up to date, otherwise loads the JSON and builds the search
+    index in memory. Returns ``(index, search_index)`` where ``index`` has the
+    same keys as SKILL-INDEX.json (``skills`` may be a lazy sequence).
+
+    Raises FileNotFoundError / json.JSONDecodeError like json.load would.
+    """
+    bin_path = binary_index_path(index_path)
+    if prefer_binary and os.path.exists(bin_path):
+        try:
+            mapped = MappedSkillIndex(bin_path)
+        except (ValueError, struct.error, OSError):
+            mapped = None
+        if mapped is not None:
+            if mapped.is_fresh(index_path):
+                index = dict(mapped.meta)
+                index['skills'] = mapped.skills
+                return index, mapped
+            mapped.close()
+
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    return index, SkillSearchIndex(index['skills'])
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Skill Lint - One parse per SKILL.md, pluggable rules, optional index entry.
+
+validate-skill-yaml.py, generate-skill-index.py and skill-creator's
+quick_validate.py all need the same thing from a SKILL.md: its frontmatter
+and body. load_document() reads and parses a file once into a SkillDocument,
+cached per process by path, size and mtime. A SkillLinter runs a profile (a
+set of rules, each with a severity) over it. lint_file() can also hand the
+same document to an ``emit`` callable, so a single traversal both validates
+the tree and builds the index entries.
+
+Rules are plain functions registered with @rule; each yields messages for
+one document. Profiles:
+
+- ``frontmatter``: what CI enforces on every SKILL.md (required fields,
+  field types, the ``requires`` block). Name format and description length
+  are reported as warnings.
+- ``skill-creator``: the stricter checks for newly created skills
+  (hyphen-case names, description length, no angle brackets).
+"""
+
+import re
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import yaml
+
+from skill_pool import map_in_processes
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*(?:\n|$)', re.DOTALL)
+NAME_PATTERN = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+MAX_NAME_LENGTH = 64
+MAX_DESCRIPTION_LENGTH = 1024
+
+# Severities
+ERROR = 'error'
+WARNING = 'warning'
+
+
+class SkillDocument(NamedTuple):
+    path: Path
+    frontmatter: Optional[Dict]    # None when missing or unparseable
+    body: str
+    error: Optional[str]           # why frontmatter is None
+
+
+def parse_document(path: Path, content: str) -> SkillDocument:
+    """Split a SKILL.md into frontmatter and body."""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return SkillDocument(path, None, content, "No YAML frontmatter found (missing --- delimiters)")
+    body = content[match.end():]
+    try:
+        data = yaml.safe_load(match.group(1))
+    except yaml.YAMLError as e:
+        return SkillDocument(path, None, body, f"YAML parse error: {e}")
+    if data is None:
+        return SkillDocument(path, None, body, "No valid YAML frontmatter found")
+    if not isinstance(data, dict):
+        return SkillDocument(path, None, body, "Frontmatter must be a mapping of fields")
+    return SkillDocument(path, data, body, None)
+
+
+# path -> ((size, mtime_ns), document)
+_documents: Dict[str, Tuple[Tuple[int, int], SkillDocument]] = {}
+
+
+def load_document(path: Path) -> SkillDocument:
+    """Read and parse a SKILL.md, reusing the parse while the file is unchanged."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = _documents.get(str(path))
+        if cached and cached[0] == signature:
+            return cached[1]
+        content = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return SkillDocument(path, None, '', f"Error reading file: {e}")
+    document = parse_document(path, content)
+    _documents[str(path)] = (signature, document)
+    return document
+
+
+class LintIssue(NamedTuple):
+    rule: str
+    severity: str
+    message: str
+
+
+class LintRule(NamedTuple):
+    name: str
+    check: Callable[[Dict], Iterable[str]]    # frontmatter -> messages
+    description: str
+
+
+RULES: Dict[str, LintRule] = {}
+
+
+def rule(name: str):
+    """Register a frontmatter check under ``name`` (its docstring describes it)."""
+    def register(check):
+        RULES[name] = LintRule(name, check, (check.__doc__ or '').strip())
+        return check
+    return register
+
+
+@rule('required-fields')
+def check_required_fields(data: Dict) -> Iterator[str]:
+    """name and description are present and are strings"""
+    for field in ('name', 'description'):
+        if field not in data:
+            yield f"Missing required field: '{field}'"
+        elif not isinstance(data[field], str):
+            yield f"Field '{field}' must be a string"
+
+
+@rule('field-types')
+def check_field_types(data: Dict) -> Iterator[str]:
+    """tags is a list of strings and category is a string"""
+    if 'tags' in data:
+        if not isinstance(data['tags'], list):
+            yield "Field 'tags' must be a list"
+        else:
+            for tag in data['tags']:
+                if not isinstance(tag, str):
+                    yield f"Tag must be a string, found: {type(tag).__name__}"
+    if 'category' in data and not isinstance(data['category'], str):
+        yield "Field 'category' must be a string"
+
+
+@rule('requires-block')
+def check_requires_block(data: Dict) -> Iterator[str]:
+    """requires maps each kind of dependency (e.g. mcp) to a list of names"""
+    if 'requires' not in data:
+        return
+    requires = data['requires']
+    if not isinstance(requires, dict):
+        yield "Field 'requires' must be a dictionary"
+        return
+    for kind, names in requires.items():
+        if not isinstance(names, list) or not all(isinstance(n, str) and n.strip() for n in names):
+            yield f"Field 'requires.{kind}' must be a list of names"
+
+
+@rule('name-format')
+def check_name_format(data: Dict) -> Iterator[str]:
+    """name is hyphen-case and at most 64 characters"""
+    name = data.get('name')
+    if not isinstance(name, str):
+        return
+    if not re.match(r'^[a-z0-9-]+$', name):
+        yield f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    elif not NAME_PATTERN.match(name):
+        yield f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+    if len(name) > MAX_NAME_LENGTH:
+        yield f"Name is too long ({len(name)} characters, maximum {MAX_NAME_LENGTH})"
+
+
+@rule('description-length')
+def check_description_length(data: Dict) -> Iterator[str]:
+    """description is not empty and at most 1024 characters"""
+    description = data.get('description')
+    if not isinstance(description, str):
+        return
+    if not description.strip():
+        yield "Description is empty"
+    elif len(description) > MAX_DESCRIPTION_LENGTH:
+        yield f"Description is too long ({len(description)} characters, maximum {MAX_DESCRIPTION_LENGTH})"
+
+
+@rule('description-brackets')
+def check_description_brackets(data: Dict) -> Iterator[str]:
+    """description contains no angle brackets"""
+    description = data.get('description')
+    if isinstance(description, str) and ('<' in description or '>' in description):
+        yield "Description cannot contain angle brackets (< or >)"
+
+
+# Profile name -> {rule name: severity}, in reporting order
+PROFILES: Dict[str, Dict[str, str]] = {
+    'frontmatter': {
+        'required-fields': ERROR,
+        'field-types': ERROR,
+        'requires-block': ERROR,
+        'name-format': WARNING,
+        'description-length': WARNING,
+    },
+    'skill-creator': {
+        'required-fields': ERROR,
+        'name-format': ERROR,
+        'description-length': ERROR,
+        'description-brackets': ERROR,
+    },
+}
+
+
+class LintResult(NamedTuple):
+    path: Path
+    issues: List[LintIssue]
+    entry: Any = None              # what ``emit`` returned, if given
+
+    @property
+    def errors(self) -> List[LintIssue]:
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[LintIssue]:
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class SkillLinter:
+    """Runs a profile's rules over SkillDocuments."""
+
+    def __init__(self, profile: str = 'frontmatter', rules: Optional[Dict[str, str]] = None):
+        # ``rules`` (rule name -> severity) replaces the profile's rule set
+        self.rules = dict(rules if rules is not None else PROFILES[profile])
+        unknown = [name for name in self.rules if name not in RULES]
+        if unknown:
+            raise ValueError(f"Unknown lint rules: {', '.join(unknown)}")
+
+    def lint(self, document: SkillDocument) -> List[LintIssue]:
+        if document.frontmatter is None:
+            return [LintIssue('frontmatter', ERROR, document.error)]
+        return [
+            LintIssue(name, severity, message)
+            for name, severity in self.rules.items()
+            for message in RULES[name].check(document.frontmatter)
+        ]
+
+
+def lint_file(path: Path, profile: str = 'frontmatter',
+              emit: Optional[Callable[[SkillDocument], Any]] = None) -> LintResult:
+    """Lint one SKILL.md and, with ``emit``, derive its index entry from the same parse."""
+    document = load_document(path)
+    issues = SkillLinter(profile).lint(document)
+    return LintResult(Path(path), issues, emit(document) if emit else None)
+
+
+def lint_files(paths: Sequence[Path], profile: str = 'frontmatter',
+               emit: Optional[Callable[[SkillDocument], Any]] = None,
+               jobs: Optional[int] = 1) -> List[LintResult]:
+    """lint_file() over many files across ``jobs`` processes (None = all cores).
+
+    Results keep input order. ``emit`` must be picklable when ``jobs`` is not 1.
+    """
+    return map_in_processes(partial(lint_file, profile=profile, emit=emit), list(paths), jobs)
+
+
+def find_skill_files(root_dir: Path) -> List[Path]:
+    """Find all SKILL.md files in the repository."""
+    skill_files = []
+    for skill_file in root_dir.glob("*/SKILL.md"):
+        # Skip hidden directories
+        if not any(part.startswith('.') for part in skill_file.parts):
+            skill_files.append(skill_file)
+    return sorted(skill_files)
+
+
+def print_report(results: Sequence[LintResult], root_dir: Path, verbose: bool = False) -> bool:
+    """Print errors per file (and warnings with ``verbose``); True if all files are valid."""
+    errors_found = 0
+    files_with_errors = 0
+    warnings_found = 0
+
+    for result in results:
+        rel_path = result.path.relative_to(root_dir) if result.path.is_relative_to(root_dir) else result.path
+        warnings_found += len(result.warnings)
+        if not result.valid:
+            errors_found += len(result.errors)
+            files_with_errors += 1
+            print(f"❌ {rel_path}")
+            for issue in result.errors:
+                print(f"   - {issue.message}")
+        elif verbose:
+            print(f"✅ {rel_path}")
+        if verbose:
+            for issue in result.warnings:
+                print(f"   ⚠️  {issue.message}")
+        if not result.valid:
+            print()
+
+    # Summary
+    print("=" * 70)
+    if errors_found == 0:
+        print(f"✅ All {len(results)} SKILL.md files are valid!")
+    else:
+        print(f"❌ Found {errors_found} errors in {files_with_errors} files")
+        print(f"   Valid files: {len(results) - files_with_errors}/{len(results)}")
+    if warnings_found:
+        hint = "" if verbose else " (use --verbose to list them)"
+        print(f"⚠️  {warnings_found} warnings{hint}")
+    return errors_found == 0
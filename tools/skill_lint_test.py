@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from functools import partial
+from pathlib import Path
+
+from skill_lint import ERROR, WARNING, SkillLinter, lint_file, lint_files, load_document, parse_document
+
+
+def write_skill(root, name, frontmatter, body="# Skill\n"):
+    path = Path(root) / name / "SKILL.md"
+    path.parent.mkdir(parents=True)
+    path.write_text(f"---\n{frontmatter}\n---\n{body}", encoding="utf-8")
+    return path
+
+
+def entry_name(document):
+    return document.frontmatter.get("name") if document.frontmatter else None
+
+
+class TestSkillLint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_document(self):
+        """Frontmatter and body are split once; bad frontmatter is explained"""
+        document = parse_document(Path("SKILL.md"), "---\nname: pdf\n---\n# PDF\n")
+        self.assertEqual((document.frontmatter, document.body), ({"name": "pdf"}, "# PDF\n"))
+        self.assertIn("missing ---", parse_document(Path("x"), "# No frontmatter").error)
+        self.assertIn("YAML parse error", parse_document(Path("x"), "---\nname: [\n---\n").error)
+
+    def test_document_cache(self):
+        """An unchanged file is parsed only once"""
+        path = write_skill(self.tmp.name, "pdf", "name: pdf\ndescription: PDFs")
+        self.assertIs(load_document(path), load_document(path))
+
+    def test_profiles(self):
+        """The same rule can be a warning in CI and an error for new skills"""
+        document = parse_document(Path("SKILL.md"), "---\nname: Apify Automation\ndescription: Run <actors>\n---\n")
+        issues = SkillLinter("frontmatter").lint(document)
+        self.assertEqual([(i.rule, i.severity) for i in issues], [("name-format", WARNING)])
+        issues = SkillLinter("skill-creator").lint(document)
+        self.assertEqual([(i.rule, i.severity) for i in issues],
+                         [("name-format", ERROR), ("description-brackets", ERROR)])
+
+    def test_required_fields_and_requires(self):
+        """Missing fields, wrong types and malformed requires blocks are errors"""
+        document = parse_document(Path("SKILL.md"), "---\nname: x\ntags: a\nrequires:\n  mcp: rube\n---\n")
+        messages = [i.message for i in SkillLinter().lint(document)]
+        self.assertEqual(messages, [
+            "Missing required field: 'description'",
+            "Field 'tags' must be a list",
+            "Field 'requires.mcp' must be a list of names",
+        ])
+
+    def test_lint_and_emit(self):
+        """One pass validates and produces the index entry"""
+        good = write_skill(self.tmp.name, "good", "name: good\ndescription: Works\nrequires:\n  mcp: [rube]")
+        bad = write_skill(self.tmp.name, "bad", "description: No name")
+        results = lint_files([good, bad], emit=entry_name)
+        self.assertEqual([(r.valid, r.entry) for r in results], [(True, "good"), (False, None)])
+        self.assertEqual(lint_file(bad).errors[0].message, "Missing required field: 'name'")
+
+    def test_custom_rules(self):
+        """A linter can run a chosen rule set; unknown rules are rejected"""
+        document = parse_document(Path("SKILL.md"), "---\nname: x\ndescription: ''\n---\n")
+        issues = SkillLinter(rules={"description-length": ERROR}).lint(document)
+        self.assertEqual([i.message for i in issues], ["Description is empty"])
+        self.assertRaises(ValueError, partial(SkillLinter, rules={"nope": ERROR}))
+
+
+if __name__ == "__main__":
+    unittest.main()
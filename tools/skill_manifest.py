@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Skill Manifest - Content-hash manifest for incremental skill indexing.
+
+Records, for every SKILL.md an index generator has parsed, the file's mtime,
+size and SHA-256 together with the index entry produced from it. On the next
+run only files whose size/mtime changed are re-hashed, and only files whose
+content actually changed are re-parsed; everything else is served from the
+manifest.
+
+The manifest also stores a ``context`` (generator name, format version, and
+any shared inputs such as the README digest). If the context differs, every
+cached entry is discarded and the tree is rebuilt from scratch. Each generator
+keeps its own manifest, and the manifest records the SHA-256 of the index it
+last wrote, so an index overwritten by another tool is never mistaken for an
+up-to-date one.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from skill_pool import map_in_processes
+
+MANIFEST_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def manifest_path_for(output_file: Path, generator: str) -> Path:
+    """Return the manifest path that ``generator`` keeps next to an index file."""
+    output_file = Path(output_file)
+    return output_file.with_name(f"{output_file.stem}.{generator}.manifest.json")
+
+
+class SkillManifest:
+    """Per-file cache of (mtime, size, hash) -> parsed index entry."""
+
+    def __init__(self, path: Path, context: Dict[str, Any]):
+        self.path = Path(path)
+        self.context = context
+        self.files: Dict[str, Dict] = {}
+        self.output: Optional[str] = None  # SHA-256 of the index last written
+        self.stats = {"unchanged": 0, "reparsed": 0, "added": 0, "removed": 0}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get('version') == MANIFEST_VERSION and data.get('context') == self.context:
+            self.files = data.get('files', {})
+            self.output = data.get('output')
+
+    @property
+    def changed(self) -> bool:
+        """True if the last update() added, reparsed or removed anything."""
+        return any(self.stats[k] for k in ("reparsed", "added", "removed"))
+
+    def output_current(self, output_file: Path) -> bool:
+        """True if output_file still holds the index recorded with record_output()."""
+        output_file = Path(output_file)
+        return (self.output is not None and output_file.exists()
+                and file_digest(output_file) == self.output)
+
+    def record_output(self, output_file: Path):
+        """Remember the index just written to output_file."""
+        self.output = file_digest(Path(output_file))
+
+    def update(self, skill_files: List[Path], root_dir: Path,
+               parse: Callable[[Path], Optional[Dict]],
+               jobs: Optional[int] = 1) -> List[Optional[Dict]]:
+        """Return the index entry for each file, re-parsing only changed files.
+
+        ``parse`` is called with the SKILL.md path for new or modified files and
+        may return None for files that should be skipped (that result is cached
+        too). Changed files are parsed across ``jobs`` processes (None = all
+        cores), so ``parse`` must be picklable when ``jobs`` is not 1. Entries
+        for files no longer present are dropped.
+        """
+        self.stats = {"unchanged": 0, "reparsed": 0, "added": 0, "removed": 0}
+        entries: List[Optional[Dict]] = []
+        pending = []
+        seen = set()
+
+        for skill_file in skill_files:
+            key = skill_file.relative_to(root_dir).as_posix()
+            seen.add(key)
+            stat = skill_file.stat()
+            cached = self.files.get(key)
+
+            if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+                self.stats["unchanged"] += 1
+                entries.append(cached['entry'])
+                continue
+
+            digest = file_digest(skill_file)
+            if cached and cached['sha256'] == digest:
+                # Touched but identical (e.g. after a checkout): refresh stat only
+                cached['mtime_ns'] = stat.st_mtime_ns
+                cached['size'] = stat.st_size
+                self.stats["unchanged"] += 1
+                entries.append(cached['entry'])
+                continue
+
+            self.stats["reparsed" if cached else "added"] += 1
+            pending.append((len(entries), key, skill_file, stat, digest))
+            entries.append(None)
+
+        parsed = map_in_processes(parse, [item[2] for item in pending], jobs)
+        for (position, key, _, stat, digest), entry in zip(pending, parsed):
+            self.files[key] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest,
+                'entry': entry,
+            }
+            entries[position] = entry
+
+        for key in [k for k in self.files if k not in seen]:
+            del self.files[key]
+            self.stats["removed"] += 1
+
+        return entries
+
+    def save(self):
+        """Atomically write the manifest."""
+        data = {
+            'version': MANIFEST_VERSION,
+            'context': self.context,
+            'files': self.files,
+            'output': self.output,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,63 @@
+import importlib.util
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from skill_manifest import SkillManifest, manifest_path_for
+
+spec = importlib.util.spec_from_file_location("index_skills", Path(__file__).parent / "index-skills.py")
+index_skills = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(index_skills)
+
+
+class TestSkillManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for name in ("pdf", "docx"):
+            (self.root / name).mkdir()
+            (self.root / name / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: The {name} skill\n---\n\n# {name}\n")
+        self.output = self.root / "SKILL-INDEX.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generate(self):
+        with redirect_stdout(io.StringIO()) as output:
+            index_skills.generate_index(str(self.root), str(self.output), incremental=True, jobs=1)
+        return output.getvalue()
+
+    def test_each_generator_has_its_own_manifest(self):
+        self.assertNotEqual(manifest_path_for(self.output, "index-skills"),
+                            manifest_path_for(self.output, "generate-skill-index"))
+
+    def test_unchanged_tree_is_up_to_date(self):
+        self.assertIn("Index written", self.generate())
+        self.assertIn("is up to date", self.generate())
+        manifest = json.loads(manifest_path_for(self.output, "index-skills").read_text())
+        self.assertEqual(len(manifest["output"]), 64)
+
+    def test_overwritten_index_is_regenerated(self):
+        self.generate()
+        expected = self.output.read_text()
+        # Another tool writes its own format to the same file
+        self.output.write_text(json.dumps({"version": "2.0", "skills": []}))
+        self.assertIn("Index written", self.generate())
+        self.assertEqual(self.output.read_text(), expected)
+
+    def test_output_is_only_current_once_recorded(self):
+        manifest = SkillManifest(self.root / "test.manifest.json", context={})
+        self.output.write_text("{}")
+        self.assertFalse(manifest.output_current(self.output))
+        manifest.record_output(self.output)
+        manifest.save()
+        self.assertTrue(SkillManifest(self.root / "test.manifest.json", context={}).output_current(self.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Skill Matrix - Concurrent skill x model compatibility runs.
+
+``model-tester.py --matrix`` sends every selected universal skill to every
+provider/model pair. Each provider gets its own thread pool (its concurrency
+limit) and a token bucket (its request rate), so a slow local Ollama and a
+rate-limited OpenRouter account can be exercised at the same time. Rate
+limits, server errors and timeouts are retried with backoff.
+
+Each call streams its response to measure time-to-first-token and total
+latency, and records the reported token usage. Results are appended to a
+JSONL store as they finish; rerunning with the same store skips cases that
+already passed, so an interrupted overnight run picks up where it stopped.
+summarize() reports latency percentiles per model, and
+update_compatibility() writes the outcome into each skill's metadata.yaml.
+"""
+
+import glob
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import yaml
+
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+TEST_MESSAGE = "Hello! Please provide a brief example of what you can do based on your instructions."
+
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+
+class ProviderConfig(NamedTuple):
+    name: str
+    base_url: str
+    api_key_env: Optional[str]       # None = no key needed
+    concurrency: int                 # calls in flight at once
+    requests_per_minute: float       # 0 = unlimited
+
+
+PROVIDERS: Dict[str, ProviderConfig] = {
+    'openrouter': ProviderConfig('openrouter', 'https://openrouter.ai/api/v1', 'OPENROUTER_API_KEY', 4, 60),
+    # A local server runs one generation at a time anyway
+    'ollama': ProviderConfig('ollama', 'http://localhost:11434/v1', None, 1, 0),
+}
+
+
+class MatrixCase(NamedTuple):
+    skill: str          # skill directory, as given
+    provider: str
+    model: str
+    run: int = 0        # repetition number
+
+    @property
+    def key(self) -> str:
+        return f"{self.skill}|{self.provider}|{self.model}|{self.run}"
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available (never blocks when rate is 0)."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for rate limits, server errors, timeouts and dropped connections."""
+    status = getattr(error, 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error).__name__ in ('APITimeoutError', 'APIConnectionError', 'Timeout')
+
+
+def retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retry ``attempt``: Retry-After, else jittered backoff."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX_SECONDS)
+        except ValueError:
+            pass
+    delay = min(BACKOFF_BASE_SECONDS * (2 ** attempt), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def percentile(values: Sequence[float], p: float) -> Optional[float]:
+    """Linearly interpolated ``p``-th percentile (0-100); None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * p / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+class ChatCaller:
+    """Streams one chat completion per case from an OpenAI-compatible provider."""
+
+    def __init__(self, api_keys: Dict[str, Optional[str]], providers: Dict[str, ProviderConfig] = PROVIDERS,
+                 max_tokens: int = 200, timeout: float = 60.0, record_gaps: bool = False):
+        self.api_keys = api_keys
+        self.providers = providers
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        # Keep every inter-token gap in the result (for benchmarks)
+        self.record_gaps = record_gaps
+        self._clients: Dict[str, 'OpenAI'] = {}
+        self._lock = threading.Lock()
+
+    def client(self, provider: str) -> 'OpenAI':
+        with self._lock:
+            if provider not in self._clients:
+                config = self.providers[provider]
+                api_key = self.api_keys.get(provider) or (os.getenv(config.api_key_env) if config.api_key_env else provider)
+                if not api_key:
+                    raise ValueError(f"No API key provided for {provider}")
+                # Retries are handled by the runner, which knows about rate limits
+                self._clients[provider] = OpenAI(base_url=config.base_url, api_key=api_key,
+                                                 max_retries=0, timeout=self.timeout)
+            return self._clients[provider]
+
+    def __call__(self, case: MatrixCase, system_prompt: str) -> Dict:
+        client = self.client(case.provider)
+        start = time.perf_counter()
+        ttft = None
+        last = start
+        gaps = []
+        parts = []
+        usage = None
+        stream = client.chat.completions.create(
+            model=case.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": TEST_MESSAGE},
+            ],
+            max_tokens=self.max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                now = time.perf_counter()
+                if ttft is None:
+                    ttft = now - start
+                else:
+                    gaps.append(now - last)
+                last = now
+                parts.append(chunk.choices[0].delta.content)
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+        text = ''.join(parts)
+        if not text:
+            raise ValueError("Empty response")
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        # Decode rate: tokens after the first over the time from first to last chunk
+        tokens = completion_tokens or len(parts)
+        decode_time = last - start - ttft
+        result = {
+            "latency_s": time.perf_counter() - start,
+            "ttft_s": ttft,
+            "prompt_tokens": getattr(usage, 'prompt_tokens', None),
+            "completion_tokens": completion_tokens,
+            "completion_chunks": len(parts),
+            "tokens_per_s": (tokens - 1) / decode_time if tokens > 1 and decode_time > 0 else None,
+            "response_preview": text[:200],
+        }
+        if self.record_gaps:
+            result["inter_token_s"] = gaps
+        return result
+
+
+class ResultsStore:
+    """Append-only JSONL store of case results; the latest result per case wins.
+
+    With ``path=None`` results are only kept in memory.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = Path(path) if path is not None else None
+        self.results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        result = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a line cut short by an interrupted run
+                    self.results[result["key"]] = result
+
+    def passed(self, case: MatrixCase) -> bool:
+        return bool(self.results.get(case.key, {}).get("success"))
+
+    def record(self, result: Dict):
+        with self._lock:
+            self.results[result["key"]] = result
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+                f.flush()
+
+
+def expand_skills(patterns: Iterable[str]) -> List[Path]:
+    """Skill directories from paths, tier directories or glob patterns."""
+    skills = []
+    for pattern in patterns:
+        for path in sorted(Path(p) for p in glob.glob(pattern)) or [Path(pattern)]:
+            if (path / "system-prompt.md").exists():
+                skills.append(path)
+            elif path.is_dir():
+                skills.extend(sorted(d for d in path.iterdir() if (d / "system-prompt.md").exists()))
+    # Keep the first occurrence of each directory
+    return list(dict.fromkeys(skills))
+
+
+class MatrixRunner:
+    """Runs MatrixCases with per-provider concurrency, rate limits and retries."""
+
+    def __init__(self, call: Callable[[MatrixCase, str], Dict], store: ResultsStore,
+                 providers: Dict[str, ProviderConfig] = PROVIDERS, max_retries: int = MAX_RETRIES,
+                 progress: Optional[Callable[[Dict], None]] = None):
+        self.call = call
+        self.store = store
+        self.providers = providers
+        self.max_retries = max_retries
+        self.progress = progress
+        self.buckets = {
+            name: TokenBucket(config.requests_per_minute / 60) for name, config in providers.items()
+        }
+        self._prompts: Dict[str, str] = {}
+
+    def system_prompt(self, skill: str) -> str:
+        # The full prompt: truncating it would hide the real cost of long skills
+        if skill not in self._prompts:
+            self._prompts[skill] = (Path(skill) / "system-prompt.md").read_text(encoding='utf-8')
+        return self._prompts[skill]
+
+    def run_case(self, case: MatrixCase) -> Dict:
+        result = {"key": case.key, **case._asdict(), "timestamp": datetime.now().isoformat(timespec='seconds')}
+        for attempt in range(self.max_retries + 1):
+            self.buckets[case.provider].acquire()
+            try:
+                result.update(self.call(case, self.system_prompt(case.skill)))
+                result.update(success=True, attempts=attempt + 1)
+                break
+            except Exception as e:
+                if attempt < self.max_retries and is_retryable(e):
+                    time.sleep(retry_delay(e, attempt))
+                    continue
+                result.update(success=False, attempts=attempt + 1, error=str(e))
+                break
+        self.store.record(result)
+        if self.progress:
+            self.progress(result)
+        return result
+
+    def run(self, cases: Iterable[MatrixCase]) -> List[Dict]:
+        """Run every case not already passed in the store; returns the new results."""
+        pending: Dict[str, List[MatrixCase]] = {}
+        for case in cases:
+            if case.provider not in self.providers:
+                raise ValueError(f"Unknown provider: {case.provider}")
+            if not self.store.passed(case):
+                pending.setdefault(case.provider, []).append(case)
+
+        pools = [ThreadPoolExecutor(max_workers=self.providers[name].concurrency,
+                                    thread_name_prefix=f"matrix-{name}")
+                 for name in pending]
+        try:
+            futures = [pool.submit(self.run_case, case)
+                       for pool, provider_cases in zip(pools, pending.values())
+                       for case in provider_cases]
+            return [future.result() for future in as_completed(futures)]
+        finally:
+            for pool in pools:
+                pool.shutdown(cancel_futures=True)
+
+
+def build_cases(skills: Iterable[Path], models: Dict[str, List[str]], repeat: int = 1) -> List[MatrixCase]:
+    return [
+        MatrixCase(str(skill), provider, model, run)
+        for skill in skills
+        for provider, provider_models in models.items()
+        for model in provider_models
+        for run in range(repeat)
+    ]
+
+
+def summarize(results: Iterable[Dict]) -> Dict[str, Dict]:
+    """Per "provider/model": pass counts, latency and TTFT percentiles, token totals."""
+    groups: Dict[str, List[Dict]] = {}
+    for result in results:
+        groups.setdefault(f"{result['provider']}/{result['model']}", []).append(result)
+
+    summary = {}
+    for name, group in sorted(groups.items()):
+        passed = [r for r in group if r.get("success")]
+        latencies = [r["latency_s"] for r in passed]
+        ttfts = [r["ttft_s"] for r in passed if r.get("ttft_s") is not None]
+        summary[name] = {
+            "cases": len(group),
+            "passed": len(passed),
+            "latency_p50_s": percentile(latencies, 50),
+            "latency_p90_s": percentile(latencies, 90),
+            "latency_p99_s": percentile(latencies, 99),
+            "ttft_p50_s": percentile(ttfts, 50),
+            "ttft_p90_s": percentile(ttfts, 90),
+            "prompt_tokens": sum(r.get("prompt_tokens") or 0 for r in passed),
+            "completion_tokens": sum(r.get("completion_tokens") or 0 for r in passed),
+        }
+    return summary
+
+
+def update_compatibility(skill_dir: Path, results: Iterable[Dict]) -> bool:
+    """Rewrite the ``compatibility`` section of a skill's metadata.yaml from its results.
+
+    A model counts as tested when every recorded run for this skill passed.
+    ``recommended_models`` is kept. Returns True if the file changed.
+    """
+    metadata_path = Path(skill_dir) / "metadata.yaml"
+    if not metadata_path.exists():
+        return False
+    skill_results = [r for r in results if Path(r["skill"]) == Path(skill_dir)]
+    if not skill_results:
+        return False
+
+    by_model: Dict[tuple, List[Dict]] = {}
+    for result in skill_results:
+        by_model.setdefault((result["provider"], result["model"]), []).append(result)
+
+    tested = sorted(key for key, runs in by_model.items() if all(r.get("success") for r in runs))
+    failed = sorted(key for key in by_model if key not in tested)
+    details = {}
+    for (provider, model), runs in sorted(by_model.items()):
+        stats = summarize(runs)[f"{provider}/{model}"]
+        details[f"{provider}/{model}"] = {
+            "passed": f"{stats['passed']}/{stats['cases']}",
+            "latency_p50_s": round(stats["latency_p50_s"], 3) if stats["latency_p50_s"] is not None else None,
+            "ttft_p50_s": round(stats["ttft_p50_s"], 3) if stats["ttft_p50_s"] is not None else None,
+        }
+
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        original = f.read()
+    metadata = yaml.safe_load(original) or {}
+    previous = metadata.get("compatibility") or {}
+    metadata["compatibility"] = {
+        "tested_providers": sorted({provider for provider, _ in tested}),
+        "tested_models": [model for _, model in tested],
+        "failed_models": [model for _, model in failed],
+        "recommended_models": previous.get("recommended_models", []),
+        "last_tested": max(r["timestamp"] for r in skill_results)[:10],
+        "results": details,
+    }
+    content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+    if content == original:
+        return False
+    tmp_path = metadata_path.with_name(f".{metadata_path.name}.tmp")
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, metadata_path)
+    return True
@@ -0,0 +1,132 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import yaml
+
+from skill_matrix import (
+    MatrixCase, MatrixRunner, ProviderConfig, ResultsStore, TokenBucket, build_cases,
+    expand_skills, percentile, summarize, update_compatibility,
+)
+
+PROVIDERS = {
+    "fast": ProviderConfig("fast", "http://fast", None, 4, 0),
+    "slow": ProviderConfig("slow", "http://slow", None, 1, 0),
+}
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class FakeCall:
+    """Stands in for ChatCaller: records concurrency, fails on request."""
+
+    def __init__(self, fail=(), flaky=()):
+        self.fail = set(fail)
+        self.flaky = set(flaky)
+        self.calls = []
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, case, system_prompt):
+        with self.lock:
+            self.calls.append(case)
+            self.in_flight[case.provider] = self.in_flight.get(case.provider, 0) + 1
+            self.max_in_flight[case.provider] = max(self.max_in_flight.get(case.provider, 0),
+                                                    self.in_flight[case.provider])
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight[case.provider] -= 1
+        if case.model in self.flaky:
+            self.flaky.discard(case.model)
+            raise RateLimited("slow down")
+        if case.model in self.fail:
+            raise ValueError("model not found")
+        return {"latency_s": 0.5 + case.run, "ttft_s": 0.1, "prompt_tokens": len(system_prompt),
+                "completion_tokens": 5, "response_preview": "hi"}
+
+
+def make_skill(root, name):
+    skill = Path(root) / "tier-1-instruction-only" / name
+    skill.mkdir(parents=True)
+    (skill / "system-prompt.md").write_text(f"# {name}\n")
+    (skill / "metadata.yaml").write_text(yaml.dump({
+        "name": name, "compatibility": {"tested_models": ["llama3.2"], "recommended_models": ["gpt-4o"]}}))
+    return skill
+
+
+class TestSkillMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.skills = [make_skill(self.tmp.name, name) for name in ("alpha", "beta", "gamma")]
+        self.store_path = Path(self.tmp.name) / "results.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_matrix(self, call, models, repeat=1):
+        runner = MatrixRunner(call, ResultsStore(self.store_path), PROVIDERS, max_retries=2)
+        return runner.run(build_cases(self.skills, models, repeat))
+
+    def test_concurrency_limits(self):
+        """Each provider runs at most its concurrency limit at once"""
+        call = FakeCall()
+        results = self.run_matrix(call, {"fast": ["a", "b"], "slow": ["c"]}, repeat=2)
+        self.assertEqual(len(results), 18)
+        self.assertTrue(all(r["success"] for r in results))
+        self.assertEqual(call.max_in_flight["slow"], 1)
+        self.assertLessEqual(call.max_in_flight["fast"], 4)
+
+    def test_retries_and_resume(self):
+        """Rate limits are retried; a rerun only repeats failed cases"""
+        call = FakeCall(fail={"broken"}, flaky={"a"})
+        results = self.run_matrix(call, {"fast": ["a", "broken"]})
+        passed = [r for r in results if r["success"]]
+        self.assertEqual(len(passed), 3)
+        self.assertEqual(max(r["attempts"] for r in passed), 2)
+
+        call = FakeCall()
+        self.run_matrix(call, {"fast": ["a", "broken"]})
+        self.assertEqual(sorted(c.model for c in call.calls), ["broken"] * 3)
+
+    def test_summary_and_metadata(self):
+        """Percentiles per model and a refreshed compatibility section"""
+        self.run_matrix(FakeCall(fail={"bad"}), {"fast": ["good", "bad"]}, repeat=3)
+        results = list(ResultsStore(self.store_path).results.values())
+        summary = summarize(results)
+        self.assertEqual(summary["fast/good"]["passed"], 9)
+        self.assertEqual(summary["fast/good"]["latency_p50_s"], 1.5)
+        self.assertEqual(summary["fast/bad"]["latency_p50_s"], None)
+
+        self.assertTrue(update_compatibility(self.skills[0], results))
+        compatibility = yaml.safe_load((self.skills[0] / "metadata.yaml").read_text())["compatibility"]
+        self.assertEqual(compatibility["tested_models"], ["good"])
+        self.assertEqual(compatibility["failed_models"], ["bad"])
+        self.assertEqual(compatibility["recommended_models"], ["gpt-4o"])
+        self.assertEqual(compatibility["results"]["fast/good"]["passed"], "3/3")
+        self.assertFalse(update_compatibility(self.skills[0], results))
+
+    def test_helpers(self):
+        """Percentiles, token bucket pacing and skill expansion"""
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertIsNone(percentile([], 90))
+
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+        tier_dir = str(Path(self.tmp.name) / "tier-1-instruction-only")
+        self.assertEqual(expand_skills([tier_dir]), self.skills)
+        self.assertEqual(expand_skills([tier_dir + "/b*"]), self.skills[1:2])
+        self.assertEqual(MatrixCase("s", "p", "m", 1).key, "s|p|m|1")
+
+
+if __name__ == "__main__":
+    unittest.main()
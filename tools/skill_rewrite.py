@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Skill Rewrite - Single-pass, compiled rewrite engine for skill text.
+
+All rules are compiled into one regular expression (an alternation of named
+groups, most specific first), so a text is scanned once no matter how many
+rules there are. Each match is dispatched through a table keyed by the group
+name: rules with a replacement rewrite the match, detect-only rules leave it
+as is. Every scan also counts matches per rule, so one pass over a skill body
+yields the cleaned text for convert.py, the evidence for tier classification
+and the warnings validate.py reports.
+"""
+
+import re
+from collections import Counter
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class RewriteRule(NamedTuple):
+    name: str                      # group name; also the key in match counts
+    pattern: str                   # regex, matched case-insensitively
+    replacement: Optional[str]     # None = detect only
+    label: str = ''                # human-readable form for warnings
+    tags: FrozenSet[str] = frozenset()
+
+
+# Tags
+CLAUDE_SPECIFIC = 'claude_specific'   # evidence the skill needs Claude-only features (Tier 3)
+VALIDATOR_WARNING = 'warn'            # validate.py warns when a converted prompt still contains it
+
+CLAUDE_LANGUAGE_RULES = [
+    # Longer phrases first: the alternation takes the first rule that matches
+    RewriteRule('claude_code', r'\bClaude Code\b', 'your development environment',
+                'Claude Code', frozenset([VALIDATOR_WARNING])),
+    RewriteRule('claude_ai', r'\bclaude\.ai\b', 'your AI interface',
+                'claude.ai', frozenset([CLAUDE_SPECIFIC, VALIDATOR_WARNING])),
+    RewriteRule('claude_should', r'\bClaude should\b', 'The assistant should',
+                'Claude should', frozenset([VALIDATOR_WARNING])),
+    RewriteRule('claude_can', r'\bClaude can\b', 'The assistant can', 'Claude can'),
+    RewriteRule('claude_will', r'\bClaude will\b', 'The assistant will', 'Claude will'),
+    RewriteRule('claude', r'\bClaude\b', 'The assistant', 'Claude'),
+    RewriteRule('this_skill', r'\bthis skill\b', 'these instructions', 'this skill'),
+    RewriteRule('artifacts', r'artifacts?', None, 'artifacts', frozenset([CLAUDE_SPECIFIC])),
+    RewriteRule('mcp_server', r'MCP server', None, 'MCP server', frozenset([CLAUDE_SPECIFIC])),
+    RewriteRule('model_context_protocol', r'Model Context Protocol', None,
+                'Model Context Protocol', frozenset([CLAUDE_SPECIFIC])),
+    RewriteRule('canvas', r'canvas', None, 'canvas', frozenset([CLAUDE_SPECIFIC])),
+]
+
+
+def _first_chars(patterns: Iterable[str]) -> str:
+    """Every case of the first literal character of each pattern, or '' if unknown."""
+    chars = set()
+    for pattern in patterns:
+        if pattern.startswith(r'\b'):
+            pattern = pattern[2:]
+        if not pattern or not pattern[0].isalnum() or '|' in pattern:
+            return ''
+        if len(pattern) > 1 and pattern[1] in '?*{':
+            return ''  # the first character is optional
+        chars.update((pattern[0].lower(), pattern[0].upper()))
+    return ''.join(sorted(chars))
+
+
+class RewriteEngine:
+    """A set of RewriteRules compiled into one case-insensitive alternation."""
+
+    def __init__(self, rules: Iterable[RewriteRule]):
+        self.rules: List[RewriteRule] = list(rules)
+        alternation = '|'.join(f'(?P<{rule.name}>{rule.pattern})' for rule in self.rules)
+        # A leading character-class lookahead lets the regex engine skip
+        # positions that cannot start any rule instead of trying every branch
+        first = _first_chars(rule.pattern for rule in self.rules)
+        if first:
+            alternation = f"(?=[{re.escape(first)}])(?:{alternation})"
+        self._regex = re.compile(alternation, re.IGNORECASE)
+        self._replacements = {rule.name: rule.replacement for rule in self.rules}
+
+    def scan(self, text: str) -> Counter:
+        """Count matches per rule name without rewriting."""
+        return Counter(match.lastgroup for match in self._regex.finditer(text))
+
+    def rewrite(self, text: str) -> Tuple[str, Counter]:
+        """Apply every replacement in one pass; return (new text, match counts)."""
+        counts: Counter = Counter()
+        replacements = self._replacements
+
+        def dispatch(match):
+            name = match.lastgroup
+            counts[name] += 1
+            replacement = replacements[name]
+            return match.group() if replacement is None else replacement
+
+        return self._regex.sub(dispatch, text), counts
+
+    def rules_tagged(self, tag: str) -> List[RewriteRule]:
+        return [rule for rule in self.rules if tag in rule.tags]
+
+    def has_tag(self, counts: Counter, tag: str) -> bool:
+        """True if any rule carrying ``tag`` matched."""
+        return any(counts[rule.name] for rule in self.rules if tag in rule.tags)
+
+
+claude_language = RewriteEngine(CLAUDE_LANGUAGE_RULES)
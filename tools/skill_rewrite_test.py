@@ -0,0 +1,34 @@
+import unittest
+from skill_rewrite import CLAUDE_SPECIFIC, RewriteEngine, RewriteRule, claude_language
+
+
+class TestRewriteEngine(unittest.TestCase):
+
+    def test_specific_rules_win(self):
+        """Longer phrases are rewritten before the bare name"""
+        text, counts = claude_language.rewrite("Claude should open claude.ai or Claude Code.")
+        self.assertEqual(text, "The assistant should open your AI interface or your development environment.")
+        self.assertEqual(counts["claude_should"], 1)
+        self.assertEqual(counts["claude"], 0)
+
+    def test_case_insensitive_and_boundaries(self):
+        """Matching ignores case but respects word boundaries"""
+        text, _ = claude_language.rewrite("CLAUDE uses this skill; claudette does not.")
+        self.assertEqual(text, "The assistant uses these instructions; claudette does not.")
+
+    def test_detect_only_rules(self):
+        """Detect-only rules are counted but leave the text alone"""
+        text, counts = claude_language.rewrite("Build an Artifact on a canvas")
+        self.assertEqual(text, "Build an Artifact on a canvas")
+        self.assertEqual((counts["artifacts"], counts["canvas"]), (1, 1))
+        self.assertTrue(claude_language.has_tag(counts, CLAUDE_SPECIFIC))
+        self.assertFalse(claude_language.has_tag(claude_language.scan("plain text"), CLAUDE_SPECIFIC))
+
+    def test_optional_first_character(self):
+        """Rules whose first character is optional still match"""
+        engine = RewriteEngine([RewriteRule("colour", r"x?colou?r", "color")])
+        self.assertEqual(engine.rewrite("Colour and xcolor")[0], "color and color")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Skill Search Engine - Inverted index with BM25 ranking.
+
+Builds a tokenized, stemmed inverted index over each skill's name, tags,
+category and description once, then answers multi-term AND/OR queries by
+summing precomputed BM25 impacts and selecting the top results with a heap.
+
+Query syntax:
+    pdf forms            - AND: skills matching both terms
+    pdf OR docx          - OR: skills matching either term (``|`` also works)
+    slack message OR email send
+                         - OR of AND-groups
+
+Query terms also match as prefixes (at a slight discount), so partial words
+typed into a chat box ("autom") still find "automation".
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from skill_facets import SkillFacets
+
+# Per-field weights (BM25F-style): a hit in the name counts more than a hit
+# in the description, mirroring the old 10/5/3 substring scores.
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'tags': 2.0,
+    'category': 1.0,
+    'description': 1.0,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Prefix expansion: shortest term that is expanded, how many vocabulary
+# terms it may expand to, and how much a prefix hit counts vs. an exact hit
+MIN_PREFIX_LENGTH = 3
+MAX_PREFIX_EXPANSIONS = 64
+PREFIX_MATCH_WEIGHT = 0.8
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+OR_PATTERN = re.compile(r'\s+OR\s+|\s*\|\s*')
+
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'into', 'is', 'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'via', 'with', 'your',
+])
+
+VOWELS = frozenset('aeiouy')
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer (plural and -ed/-ing forms)."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+
+    # Plurals
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies') and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    # Verb forms, only when a vowel remains in the stem
+    for suffix in ('ing', 'ed'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            base = word[:-len(suffix)]
+            if any(c in VOWELS for c in base):
+                # Undouble trailing consonants: "mapped" -> "map"
+                if len(base) > 3 and base[-1] == base[-2] and base[-1] not in 'lsz':
+                    base = base[:-1]
+                word = base
+            break
+
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem."""
+    return [
+        stem(token)
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+def _field_text(skill: Dict, field: str) -> str:
+    """Return the searchable text for one field of a skill entry."""
+    value = skill.get(field) or ''
+    if field == 'name':
+        # Include the directory name so "-21risk-automation" style entries
+        # are findable by their slug as well as their display name.
+        return f"{value} {skill.get('path', '')}"
+    if isinstance(value, list):
+        return ' '.join(str(v) for v in value)
+    return str(value)
+
+
+class SkillSearchIndex:
+    """Inverted index over a list of skill entries with BM25 scoring."""
+
+    def __init__(self, skills: List[Dict]):
+        self.skills = skills
+        # term -> list of (skill id, BM25 impact), ids ascending
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.vocabulary: List[str] = []
+        self._facets: Optional[SkillFacets] = None
+        self._build()
+
+    @property
+    def facets(self) -> SkillFacets:
+        """Category and tag id sets, built on first use."""
+        if self._facets is None:
+            self._facets = SkillFacets.build(self.skills)
+        return self._facets
+
+    def _build(self):
+        """Tokenize every skill once and precompute per-posting BM25 impacts."""
+        term_freqs: Dict[str, Dict[int, float]] = {}
+        doc_lengths: List[float] = []
+
+        for skill_id, skill in enumerate(self.skills):
+            length = 0.0
+            for field, weight in FIELD_WEIGHTS.items():
+                tokens = tokenize(_field_text(skill, field))
+                length += weight * len(tokens)
+                for token in tokens:
+                    docs = term_freqs.setdefault(token, {})
+                    docs[skill_id] = docs.get(skill_id, 0.0) + weight
+            doc_lengths.append(length)
+
+        total = len(self.skills)
+        avg_length = (sum(doc_lengths) / total) if total else 0.0
+
+        for term, docs in term_freqs.items():
+            df = len(docs)
+            idf = math.log(1.0 + (total - df + 0.5) / (df + 0.5))
+            postings = []
+            for skill_id in sorted(docs):
+                tf = docs[skill_id]
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_lengths[skill_id] / avg_length)
+                postings.append((skill_id, idf * tf * (BM25_K1 + 1.0) / (tf + norm)))
+            self.postings[term] = postings
+
+        self.vocabulary = sorted(self.postings)
+
+    def get_postings(self, term: str) -> List[Tuple[int, float]]:
+        """Return the (skill id, impact) postings for an exact term."""
+        return self.postings.get(term, [])
+
+    def terms_with_prefix(self, prefix: str, limit: int) -> List[str]:
+        """Return up to ``limit`` vocabulary terms starting with ``prefix``, sorted."""
+        matches = []
+        i = bisect_left(self.vocabulary, prefix)
+        while (
+            i < len(self.vocabulary)
+            and self.vocabulary[i].startswith(prefix)
+            and len(matches) < limit
+        ):
+            matches.append(self.vocabulary[i])
+            i += 1
+        return matches
+
+    def expand_term(self, term: str) -> List[str]:
+        """Return the vocabulary terms a query term matches (exact first, then prefixes)."""
+        exact = bool(self.get_postings(term))
+        matches = [term] if exact else []
+        if len(term) < MIN_PREFIX_LENGTH:
+            return matches
+        for candidate in self.terms_with_prefix(term, MAX_PREFIX_EXPANSIONS + exact):
+            if candidate != term and len(matches) < MAX_PREFIX_EXPANSIONS:
+                matches.append(candidate)
+        return matches
+
+    def _term_scores(self, term: str) -> Dict[int, float]:
+        """Score map for one query term, taking the best expansion per skill."""
+        scores: Dict[int, float] = {}
+        for expanded in self.expand_term(term):
+            weight = 1.0 if expanded == term else PREFIX_MATCH_WEIGHT
+            for skill_id, impact in self.get_postings(expanded):
+                impact *= weight
+                if impact > scores.get(skill_id, 0.0):
+                    scores[skill_id] = impact
+        return scores
+
+    @staticmethod
+    def parse_query(query: str) -> List[List[str]]:
+        """Parse a query into OR-separated groups of AND-ed terms."""
+        groups = []
+        for part in OR_PATTERN.split(query.strip()):
+            terms = tokenize(part)
+            if terms:
+                groups.append(terms)
+        return groups
+
+    def score(self, query: str, match: str = 'all') -> Dict[int, float]:
+        """Return a map of skill id to BM25 score for every matching skill.
+
+        ``match='all'`` requires every term of an AND-group; ``match='any'``
+        treats the whole query as one OR of its terms (summing scores), which
+        suits free-text questions used for candidate retrieval.
+        """
+        if match == 'any':
+            results = {}
+            terms = [term for group in self.parse_query(query) for term in group]
+            for term in dict.fromkeys(terms):
+                for skill_id, score in self._term_scores(term).items():
+                    results[skill_id] = results.get(skill_id, 0.0) + score
+            return results
+
+        results: Dict[int, float] = {}
+        for group in self.parse_query(query):
+            group_scores: Optional[Dict[int, float]] = None
+            for term in dict.fromkeys(group):
+                term_scores = self._term_scores(term)
+                if group_scores is None:
+                    group_scores = term_scores
+                else:
+                    group_scores = {
+                        skill_id: score + term_scores[skill_id]
+                        for skill_id, score in group_scores.items()
+                        if skill_id in term_scores
+                    }
+                if not group_scores:
+                    break
+            for skill_id, score in (group_scores or {}).items():
+                if score > results.get(skill_id, 0.0):
+                    results[skill_id] = score
+        return results
+
+    def search_ids(self, query: str, top_k: Optional[int] = None, match: str = 'all',
+                   category: Optional[str] = None,
+                   tags: Sequence[str] = ()) -> List[Tuple[int, float]]:
+        """Return (skill id, score) pairs, best first, ties broken by index order.
+
+        ``category`` and ``tags`` restrict results to skills in that category
+        and carrying every given tag (case-insensitive).
+        """
+        scores = self.score(query, match)
+        allowed = self.facets.filter_ids(category, tags)
+        if allowed is not None:
+            if len(allowed) < len(scores):
+                scores = {i: scores[i] for i in allowed if i in scores}
+            else:
+                scores = {i: s for i, s in scores.items() if i in allowed}
+        ranked: Iterable[Tuple[int, float]] = scores.items()
+        key = lambda item: (-item[1], item[0])
+        if top_k is not None and top_k < len(scores):
+            return heapq.nsmallest(top_k, ranked, key=key)
+        return sorted(ranked, key=key)
+
+    def search(self, query: str, top_k: Optional[int] = None, match: str = 'all',
+               category: Optional[str] = None, tags: Sequence[str] = ()) -> List[Dict]:
+        """Return the matching skill entries, best first."""
+        return [
+            self.skills[skill_id]
+            for skill_id, _ in self.search_ids(query, top_k, match, category, tags)
+        ]
@@ -0,0 +1,73 @@
+import unittest
+from skill_search import SkillSearchIndex, stem, tokenize
+
+
+class TestSkillSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.skills = [
+            {"name": "pdf", "path": "document-skills/pdf", "category": "Document Processing",
+             "description": "Extract text and fill forms in PDF files", "tags": ["pdf", "forms"]},
+            {"name": "docx", "path": "document-skills/docx", "category": "Document Processing",
+             "description": "Create and edit Word documents", "tags": ["word"]},
+            {"name": "slack-automation", "path": "slack-automation", "category": "App Automation",
+             "description": "Send Slack messages and manage channels", "tags": []},
+            {"name": "gmail-automation", "path": "gmail-automation", "category": "App Automation",
+             "description": "Send email and manage labels in Gmail", "tags": []},
+        ]
+        self.index = SkillSearchIndex(self.skills)
+
+    def names(self, query, top_k=None):
+        return [s["name"] for s in self.index.search(query, top_k=top_k)]
+
+    def test_stemming(self):
+        """Plural and verb forms share a stem"""
+        self.assertEqual(stem("messages"), stem("message"))
+        self.assertEqual(stem("mapped"), "map")
+        self.assertEqual(tokenize("Sending the Forms"), ["send", "form"])
+
+    def test_name_ranks_above_description(self):
+        """A name hit outranks a description-only hit"""
+        self.assertEqual(self.names("pdf")[0], "pdf")
+
+    def test_and_query(self):
+        """All terms must match by default"""
+        self.assertEqual(self.names("send email"), ["gmail-automation"])
+        self.assertEqual(self.names("pdf slack"), [])
+
+    def test_or_query(self):
+        """OR and | union the groups"""
+        self.assertEqual(set(self.names("pdf OR word")), {"pdf", "docx"})
+        self.assertEqual(set(self.names("slack | gmail")), {"slack-automation", "gmail-automation"})
+
+    def test_prefix_expansion(self):
+        """Partial words match as prefixes"""
+        self.assertEqual(set(self.names("autom")), {"slack-automation", "gmail-automation"})
+
+    def test_top_k(self):
+        """top_k returns the best k results in ranked order"""
+        full = self.names("send")
+        self.assertEqual(self.names("send", top_k=1), full[:1])
+
+    def test_facets(self):
+        """Category and tag facets are case-insensitive id lists"""
+        facets = self.index.facets
+        self.assertEqual(facets.category_ids("app automation"), [2, 3])
+        self.assertEqual(facets.category_count("Document Processing"), 2)
+        self.assertEqual(facets.tag_ids("PDF"), [0])
+        self.assertEqual(facets.tag_counts(), {"forms": 1, "pdf": 1, "word": 1})
+
+    def test_faceted_search(self):
+        """category/tags intersect the query results"""
+        self.assertEqual({s["name"] for s in self.index.search("send", category="app automation")},
+                         {"slack-automation", "gmail-automation"})
+        self.assertEqual(self.index.search("send", category="Document Processing"), [])
+        self.assertEqual([s["name"] for s in self.index.search("pdf OR word", tags=["forms"])], ["pdf"])
+
+    def test_empty_query(self):
+        """Stopword-only queries match nothing"""
+        self.assertEqual(self.names("the of"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
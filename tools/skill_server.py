@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Skill Server - Long-running JSON API over the skill index.
+
+``discover.py --serve`` keeps the index, its search structures and (with
+``--nlp``) the model client loaded in one process and answers queries over
+local HTTP or a Unix socket, so editors and other integrations don't pay for
+a Python start-up and an index load on every keystroke.
+
+Endpoints (all GET, all JSON):
+
+    /health                       index path, skill count, reload count
+    /search?q=QUERY[&top=N][&match=all|any][&category=NAME][&tag=NAME...]
+    /categories                   category names with skill counts
+    /category/<name>              skills in a category
+    /tags                         tag names with skill counts
+    /tag/<name>                   skills with a tag
+    /skill/<name or path>         one skill, with its universal-format path
+    /semantic?q=QUERY[&top=N]     nlp-discover ranking (``--nlp`` only)
+
+Requests are served on a thread each. The index files are polled for
+changes; when SKILL-INDEX.json (or SKILL-INDEX.bin) is regenerated a fresh
+snapshot is loaded and swapped in, and requests already running finish on
+the snapshot they started with.
+"""
+
+import importlib.util
+import json
+import os
+import signal
+import socketserver
+import stat
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from discover import filter_by_category, filter_by_tag, universal_path
+from skill_index_binary import binary_index_path, open_search_index
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Seconds between checks for a regenerated index
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class CatalogSnapshot:
+    """One loaded version of the index with its lookup tables."""
+
+    def __init__(self, index: Dict, search_index):
+        self.index = index
+        self.search_index = search_index
+        self.facets = search_index.facets
+        self.skills: List[Dict] = list(index['skills'])
+        self.by_name: Dict[str, Dict] = {}
+        for skill in self.skills:
+            self.by_name.setdefault(skill['path'].lower(), skill)
+            self.by_name.setdefault(skill['name'].lower(), skill)
+
+
+class SkillCatalog:
+    """The current CatalogSnapshot, reloaded when the index files change."""
+
+    def __init__(self, index_path: str, repo_root: str, nlp=None):
+        self.index_path = index_path
+        self.repo_root = repo_root
+        self.nlp = nlp
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._signature = self._file_signature()
+        self.snapshot = CatalogSnapshot(*open_search_index(index_path))
+
+    def _file_signature(self) -> Tuple:
+        signature = []
+        for path in (self.index_path, binary_index_path(self.index_path)):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def reload_if_changed(self) -> bool:
+        """Swap in a new snapshot if the index files changed; True if reloaded.
+
+        A half-written, missing or unreadable index keeps the current snapshot
+        (the error is logged to stderr) and is retried on the next call.
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if signature == self._signature:
+                return False
+            try:
+                snapshot = CatalogSnapshot(*open_search_index(self.index_path))
+                if self.nlp is not None:
+                    self.nlp.reload_index()
+            except (OSError, ValueError, KeyError, SystemExit) as e:
+                # nlp-discover exits when the index is missing; keep serving instead
+                reason = f"exit status {e.code}" if isinstance(e, SystemExit) else e
+                print(f"⚠️  Could not reload {self.index_path}: {reason}", file=sys.stderr, flush=True)
+                return False
+            self.snapshot = snapshot
+            self._signature = signature
+            self.reloads += 1
+            return True
+
+    def watch(self, interval: float = DEFAULT_POLL_INTERVAL) -> threading.Event:
+        """Poll for index changes on a daemon thread; set the event to stop."""
+        stop = threading.Event()
+
+        def poll():
+            while not stop.wait(interval):
+                if self.reload_if_changed():
+                    print(f"🔄 Reloaded {self.index_path} "
+                          f"({len(self.snapshot.skills)} skills)", flush=True)
+
+        threading.Thread(target=poll, name='skill-index-watcher', daemon=True).start()
+        return stop
+
+
+class SkillRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the catalog and answers in JSON."""
+
+    server_version = 'SkillServer/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        params = {key: values[-1] for key, values in query.items()}
+        self.tags = query.get('tag', [])
+        parts = [unquote(part) for part in url.path.split('/') if part]
+        route, arg = (parts[0] if parts else ''), '/'.join(parts[1:])
+
+        catalog = self.server.catalog
+        snapshot = catalog.snapshot
+        try:
+            status, payload = self.route(catalog, snapshot, route, arg, params)
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {'error': str(e)}
+        self.send_json(status, payload)
+
+    def route(self, catalog: SkillCatalog, snapshot: CatalogSnapshot, route: str,
+              arg: str, params: Dict[str, str]) -> Tuple[HTTPStatus, Dict]:
+        if route == 'health':
+            return HTTPStatus.OK, {
+                'status': 'ok',
+                'index': catalog.index_path,
+                'total_skills': len(snapshot.skills),
+                'generated_date': snapshot.index.get('generated_date'),
+                'reloads': catalog.reloads,
+                'semantic': catalog.nlp is not None,
+            }
+
+        if route == 'search':
+            query = self.require(params, 'q')
+            match = params.get('match', 'all')
+            if match not in ('all', 'any'):
+                raise ValueError("match must be 'all' or 'any'")
+            results = snapshot.search_index.search(
+                query, top_k=self.top(params), match=match,
+                category=params.get('category'), tags=self.tags,
+            )
+            return HTTPStatus.OK, {'query': query, 'count': len(results), 'skills': results}
+
+        if route == 'semantic':
+            if catalog.nlp is None:
+                return HTTPStatus.NOT_FOUND, {'error': 'semantic search is not enabled (start with --nlp)'}
+            query = self.require(params, 'q')
+            results = catalog.nlp.semantic_search(query, top_k=self.top(params) or 5)
+            return HTTPStatus.OK, {'query': query, 'count': len(results), 'skills': results}
+
+        if route == 'categories' and not arg:
+            categories = [
+                {'name': name, 'count': snapshot.facets.category_count(name)}
+                for name in snapshot.index.get('categories', [])
+            ]
+            return HTTPStatus.OK, {'count': len(categories), 'categories': categories}
+
+        if route == 'category' and arg:
+            results = filter_by_category(snapshot.skills, arg, snapshot.facets)
+            if not results:
+                return HTTPStatus.NOT_FOUND, {'error': f"category '{arg}' not found"}
+            return HTTPStatus.OK, {'category': arg, 'count': len(results), 'skills': results}
+
+        if route == 'tags' and not arg:
+            tags = [{'name': tag, 'count': count} for tag, count in snapshot.facets.tag_counts().items()]
+            return HTTPStatus.OK, {'count': len(tags), 'tags': tags}
+
+        if route == 'tag' and arg:
+            results = filter_by_tag(snapshot.skills, arg, snapshot.facets)
+            if not results:
+                return HTTPStatus.NOT_FOUND, {'error': f"tag '{arg}' not found"}
+            return HTTPStatus.OK, {'tag': arg, 'count': len(results), 'skills': results}
+
+        if route == 'skill' and arg:
+            skill = snapshot.by_name.get(arg.lower())
+            if skill is None:
+                return HTTPStatus.NOT_FOUND, {'error': f"skill '{arg}' not found"}
+            details = dict(skill)
+            details['universal'] = universal_path(skill, catalog.repo_root)
+            return HTTPStatus.OK, details
+
+        return HTTPStatus.NOT_FOUND, {'error': f"unknown endpoint '{self.path}'"}
+
+    @staticmethod
+    def require(params: Dict[str, str], name: str) -> str:
+        value = params.get(name, '').strip()
+        if not value:
+            raise ValueError(f"missing '{name}' parameter")
+        return value
+
+    @staticmethod
+    def top(params: Dict[str, str]) -> Optional[int]:
+        if 'top' not in params:
+            return None
+        try:
+            top = int(params['top'])
+        except ValueError:
+            raise ValueError("top must be an integer")
+        if top < 1:
+            raise ValueError("top must be at least 1")
+        return top
+
+    def send_json(self, status: HTTPStatus, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _QuietDisconnects:
+    """Don't print a traceback when a client hangs up mid-request."""
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class SkillHTTPServer(_QuietDisconnects, ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], catalog: SkillCatalog, verbose: bool = False):
+        self.catalog = catalog
+        self.verbose = verbose
+        super().__init__(address, SkillRequestHandler)
+
+
+class SkillUnixServer(_QuietDisconnects, socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, catalog: SkillCatalog, verbose: bool = False):
+        self.catalog = catalog
+        self.verbose = verbose
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            # Replace a socket left behind by an earlier server, never anything else
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.unlink(path)
+        super().__init__(path, SkillRequestHandler)
+
+
+def load_nlp_discovery(index_path: str, tools_dir: Path):
+    """Instantiate nlp-discover's NLPSkillDiscovery with the response cache."""
+    spec = importlib.util.spec_from_file_location('nlp_discover', tools_dir / 'nlp-discover.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    cache = module.ResponseCache(index_version=module.index_version(index_path))
+    return module.NLPSkillDiscovery(index_path, cache=cache)
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(index_path: str, repo_root: str, host: str = DEFAULT_HOST,
+          port: int = DEFAULT_PORT, socket_path: Optional[str] = None,
+          nlp: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL,
+          verbose: bool = False):
+    """Serve the skill index until interrupted."""
+    nlp_discovery = load_nlp_discovery(index_path, Path(__file__).parent) if nlp else None
+    catalog = SkillCatalog(index_path, repo_root, nlp=nlp_discovery)
+
+    if socket_path:
+        server = SkillUnixServer(socket_path, catalog, verbose)
+        where = f"unix:{socket_path}"
+    else:
+        server = SkillHTTPServer((host, port), catalog, verbose)
+        where = f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+    # Daemons are usually stopped with SIGTERM; shut down as for Ctrl-C
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    stop_watching = catalog.watch(poll_interval)
+    print(f"🚀 Serving {len(catalog.snapshot.skills)} skills on {where}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        stop_watching.set()
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
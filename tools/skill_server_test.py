@@ -0,0 +1,128 @@
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from contextlib import redirect_stderr
+
+from skill_server import SkillCatalog, SkillHTTPServer, SkillUnixServer
+
+
+def write_index(path, skills):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "categories": sorted({s["category"] for s in skills}),
+            "generated_date": "2026-02-06",
+            "total_skills": len(skills),
+            "skills": skills,
+        }, f)
+
+
+def skill(name, category, description, tags=()):
+    return {"name": name, "path": name, "skill_file": f"{name}/SKILL.md",
+            "description": description, "category": category, "tags": list(tags)}
+
+
+class TestSkillServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp.name, "SKILL-INDEX.json")
+        write_index(self.index_path, [
+            skill("pdf", "Document Processing", "Extract text from PDF files", ["pdf"]),
+            skill("slack-automation", "App Automation", "Send Slack messages", ["chat"]),
+        ])
+        self.catalog = SkillCatalog(self.index_path, self.tmp.name)
+        self.server = SkillHTTPServer(("127.0.0.1", 0), self.catalog)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def get(self, path):
+        try:
+            with urllib.request.urlopen(self.base + path) as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as e:
+            return e.code, json.load(e)
+
+    def test_search(self):
+        """Search returns ranked skills as JSON"""
+        status, body = self.get("/search?q=slack")
+        self.assertEqual(status, 200)
+        self.assertEqual([s["name"] for s in body["skills"]], ["slack-automation"])
+
+    def test_facets_and_details(self):
+        """Category, tag and details endpoints"""
+        _, body = self.get("/categories")
+        self.assertIn({"name": "App Automation", "count": 1}, body["categories"])
+        _, body = self.get("/tag/PDF")
+        self.assertEqual(body["count"], 1)
+        status, body = self.get("/skill/pdf")
+        self.assertEqual((status, body["category"]), (200, "Document Processing"))
+
+    def test_health(self):
+        """Health reports the index's generation date"""
+        _, body = self.get("/health")
+        self.assertEqual((body["total_skills"], body["generated_date"]), (2, "2026-02-06"))
+
+    def test_errors(self):
+        """Bad requests and unknown skills get JSON errors"""
+        self.assertEqual(self.get("/search")[0], 400)
+        self.assertEqual(self.get("/skill/nope")[0], 404)
+        self.assertEqual(self.get("/nope")[0], 404)
+        self.assertEqual(self.get("/category/nope")[0], 404)
+        self.assertEqual(self.get("/tag/nope")[0], 404)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix sockets")
+    def test_socket_path_must_be_a_socket(self):
+        """A stale socket is replaced, but any other file is left alone"""
+        path = os.path.join(self.tmp.name, "skills.sock")
+        with open(path, "w") as f:
+            f.write("keep me")
+        with self.assertRaises(FileExistsError):
+            SkillUnixServer(path, self.catalog)
+        with open(path) as f:
+            self.assertEqual(f.read(), "keep me")
+
+        os.unlink(path)
+        SkillUnixServer(path, self.catalog).server_close()  # Leaves the socket file behind
+        server = SkillUnixServer(path, self.catalog)
+        server.server_close()
+
+    def test_reload(self):
+        """A regenerated index is picked up without a restart"""
+        write_index(self.index_path, [
+            skill("gmail-automation", "App Automation", "Send email with Gmail"),
+        ])
+        os.utime(self.index_path, ns=(0, 0))
+        self.assertTrue(self.catalog.reload_if_changed())
+        _, body = self.get("/search?q=email")
+        self.assertEqual([s["name"] for s in body["skills"]], ["gmail-automation"])
+        self.assertFalse(self.catalog.reload_if_changed())
+
+    def test_failed_reload_keeps_serving(self):
+        """A reload that fails (even by exiting) keeps the old snapshot"""
+        class ExitingNLP:
+            def reload_index(self):
+                raise SystemExit(1)
+
+        self.catalog.nlp = ExitingNLP()
+        write_index(self.index_path, [skill("gmail-automation", "App Automation", "Send email")])
+        os.utime(self.index_path, ns=(0, 0))
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertFalse(self.catalog.reload_if_changed())
+        self.assertIn("Could not reload", stderr.getvalue())
+        _, body = self.get("/search?q=slack")
+        self.assertEqual(body["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Skill Tokens - Pluggable tokenizers and context-window budgeting.
+
+A tokenizer is chosen by a spec string, ``family[:argument]``:
+
+- ``approx`` (default): a dependency-free estimate that follows how BPE
+  tokenizers split text (words, number groups, punctuation, newlines). It is
+  deterministic, so converted metadata doesn't depend on what is installed.
+- ``chars[:N]``: one token per N characters (default 4).
+- ``tiktoken[:ENCODING]``: OpenAI encodings (default cl100k_base); needs
+  ``pip install tiktoken``.
+- ``hf:NAME``: a Hugging Face tokenizer, from a tokenizer.json path or a hub
+  model id; needs ``pip install tokenizers``.
+
+More families can be registered with @tokenizer. context_requirements()
+turns a prompt's token count into the smallest common context window that
+holds the prompt plus a response (``min_context_window``) and the next size up
+for multi-turn use (``recommended_context_window``). convert.py writes these
+into metadata.yaml and context-analyzer.py reports them for the whole tree.
+"""
+
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_TOKENIZER = 'approx'
+
+# Context windows models are commonly served with, smallest first. Ollama's
+# default is 2048 (4096 in newer releases); prompts beyond it are cut silently.
+COMMON_WINDOWS = (2048, 4096, 8192, 16384, 32768, 65536, 131072, 200000)
+
+# Room left for the reply (matches max_tokens in the generated api-example.json)
+DEFAULT_RESPONSE_TOKENS = 2000
+
+APPROX_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|\n+|[ \t]{2,}|\s|[^\sA-Za-z\d]")
+
+
+class Tokenizer(NamedTuple):
+    name: str
+    count: Callable[[str], int]    # text -> number of tokens
+
+
+# Family -> factory taking the spec's argument ('' when absent)
+TOKENIZERS: Dict[str, Callable[[str], Tokenizer]] = {}
+
+
+def tokenizer(family: str):
+    """Register a tokenizer factory for ``family`` specs."""
+    def register(factory):
+        TOKENIZERS[family] = factory
+        return factory
+    return register
+
+
+def approx_count(text: str) -> int:
+    """Estimated BPE token count
+
+    Words cost one token per six letters (a leading space is free), number
+    groups of up to three digits, punctuation and other characters one token
+    each, and a run of newlines or indentation one token.
+    """
+    tokens = 0
+    for piece in APPROX_PATTERN.findall(text):
+        if piece[0].isalpha() and piece.isascii():
+            tokens += math.ceil(len(piece) / 6)
+        elif piece != ' ':
+            tokens += 1
+    return tokens
+
+
+@tokenizer('approx')
+def approx_tokenizer(argument: str) -> Tokenizer:
+    return Tokenizer('approx', approx_count)
+
+
+@tokenizer('chars')
+def chars_tokenizer(argument: str) -> Tokenizer:
+    try:
+        per_token = float(argument or 4)
+    except ValueError:
+        raise ValueError(f"chars tokenizer needs a number of characters per token, got '{argument}'")
+    if per_token <= 0:
+        raise ValueError("chars tokenizer needs a positive number of characters per token")
+    return Tokenizer(f"chars:{argument or 4}", lambda text: math.ceil(len(text) / per_token))
+
+
+@tokenizer('tiktoken')
+def tiktoken_tokenizer(argument: str) -> Tokenizer:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ValueError("tiktoken tokenizer requires tiktoken. Install with: pip install tiktoken")
+    encoding = tiktoken.get_encoding(argument or 'cl100k_base')
+    return Tokenizer(f"tiktoken:{encoding.name}",
+                     lambda text: len(encoding.encode(text, disallowed_special=())))
+
+
+@tokenizer('hf')
+def hf_tokenizer(argument: str) -> Tokenizer:
+    if not argument:
+        raise ValueError("hf tokenizer needs a tokenizer.json path or model id (e.g. hf:gpt2)")
+    try:
+        from tokenizers import Tokenizer as HFTokenizer
+    except ImportError:
+        raise ValueError("hf tokenizer requires tokenizers. Install with: pip install tokenizers")
+    if Path(argument).is_file():
+        hf = HFTokenizer.from_file(argument)
+    else:
+        hf = HFTokenizer.from_pretrained(argument)
+    return Tokenizer(f"hf:{argument}", lambda text: len(hf.encode(text, add_special_tokens=False).ids))
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(spec: str = DEFAULT_TOKENIZER) -> Tokenizer:
+    """The tokenizer for ``family[:argument]``; ValueError if unknown or unavailable."""
+    family, _, argument = spec.partition(':')
+    if family not in TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer '{family}' (available: {', '.join(sorted(TOKENIZERS))})")
+    return TOKENIZERS[family](argument)
+
+
+def fit_window(tokens: int, windows: Sequence[int] = COMMON_WINDOWS) -> Optional[int]:
+    """Smallest window holding ``tokens``, or None if none does."""
+    return next((window for window in sorted(windows) if window >= tokens), None)
+
+
+def context_requirements(prompt_tokens: int, response_tokens: int = DEFAULT_RESPONSE_TOKENS,
+                         windows: Sequence[int] = COMMON_WINDOWS) -> Dict[str, int]:
+    """min/recommended context windows for a system prompt of ``prompt_tokens``
+
+    The minimum holds the prompt and one response; the recommendation is the
+    next common size up, leaving room for conversation turns. Prompts larger
+    than every window get the total rounded up to a multiple of 1024.
+    """
+    needed = prompt_tokens + response_tokens
+    windows = sorted(windows)
+    minimum = fit_window(needed, windows) or math.ceil(needed / 1024) * 1024
+    recommended = fit_window(minimum + 1, windows) or max(minimum, windows[-1])
+    return {
+        "prompt_tokens": prompt_tokens,
+        "min_context_window": minimum,
+        "recommended_context_window": recommended,
+    }
+
+
+def analyze_skill(skill_dir: Path, tokenizer_spec: str = DEFAULT_TOKENIZER,
+                  response_tokens: int = DEFAULT_RESPONSE_TOKENS,
+                  windows: Sequence[int] = COMMON_WINDOWS) -> Dict:
+    """Token counts, context requirements and overflowing windows for one universal skill
+
+    Tool schemas (tools-schema.json) are sent with every request, so they
+    count against the context window too.
+    """
+    skill_dir = Path(skill_dir)
+    tokenizer = get_tokenizer(tokenizer_spec)
+    prompt = (skill_dir / "system-prompt.md").read_text(encoding='utf-8')
+    tools_file = skill_dir / "tools-schema.json"
+    tools = tools_file.read_text(encoding='utf-8') if tools_file.exists() else ''
+    prompt_tokens = tokenizer.count(prompt)
+    tool_tokens = tokenizer.count(tools)
+    total = prompt_tokens + tool_tokens
+    requirements = context_requirements(total, response_tokens, windows)
+    return {
+        "skill": skill_dir.name,
+        "path": str(skill_dir),
+        "tier": skill_dir.parent.name,
+        "prompt_chars": len(prompt),
+        "system_prompt_tokens": prompt_tokens,
+        "tool_schema_tokens": tool_tokens,
+        "total_tokens": total,
+        "min_context_window": requirements["min_context_window"],
+        "recommended_context_window": requirements["recommended_context_window"],
+        "overflows": [window for window in sorted(windows) if total + response_tokens > window],
+    }
+
+
+def histogram(values: Iterable[int], edges: Sequence[int]) -> List[Tuple[str, int]]:
+    """Counts of values per bucket: ``<= edges[0]``, ``<= edges[1]``, ..., ``> edges[-1]``."""
+    values = list(values)
+    buckets = []
+    lower = None
+    for edge in sorted(edges):
+        count = sum(1 for v in values if (lower is None or v > lower) and v <= edge)
+        buckets.append((f"<={edge}", count))
+        lower = edge
+    buckets.append((f">{lower}", sum(1 for v in values if v > lower)))
+    return buckets
+
+
+def render_histogram(buckets: Sequence[Tuple[str, int]], width: int = 40) -> str:
+    """Text bar chart of histogram() buckets."""
+    peak = max((count for _, count in buckets), default=0) or 1
+    label_width = max(len(label) for label, _ in buckets)
+    return "\n".join(
+        f"{label:>{label_width}} | {'█' * math.ceil(count * width / peak) if count else '':<{width}} {count}"
+        for label, count in buckets
+    )
+
@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from skill_tokens import (
+    TOKENIZERS, Tokenizer, analyze_skill, approx_count, context_requirements, fit_window,
+    get_tokenizer, histogram, tokenizer,
+)
+
+
+class TestSkillTokens(unittest.TestCase):
+    def test_approx_count(self):
+        self.assertEqual(approx_count(""), 0)
+        self.assertEqual(approx_count("Hello world"), 2)
+        # Long words cost more; digits go in groups of three; newline runs are one token
+        self.assertEqual(approx_count("internationalization"), 4)
+        self.assertEqual(approx_count("1234567"), 3)
+        self.assertEqual(approx_count("# Title\n\n- item"), 5)
+
+    def test_tokenizer_specs(self):
+        self.assertEqual(get_tokenizer("chars").count("abcdefghi"), 3)
+        self.assertEqual(get_tokenizer("chars:3").count("abcdefghi"), 3)
+        self.assertEqual(get_tokenizer("chars:3").name, "chars:3")
+        with self.assertRaises(ValueError):
+            get_tokenizer("nonexistent")
+        with self.assertRaises(ValueError):
+            get_tokenizer("chars:zero")
+
+        @tokenizer("words")
+        def words_tokenizer(argument):
+            return Tokenizer("words", lambda text: len(text.split()))
+        try:
+            self.assertEqual(get_tokenizer("words").count("one two three"), 3)
+        finally:
+            del TOKENIZERS["words"]
+
+    def test_context_requirements(self):
+        self.assertEqual(fit_window(4096), 4096)
+        self.assertIsNone(fit_window(300000))
+        small = context_requirements(1000)
+        self.assertEqual((small["min_context_window"], small["recommended_context_window"]), (4096, 8192))
+        large = context_requirements(7000, response_tokens=2000)
+        self.assertEqual((large["min_context_window"], large["recommended_context_window"]), (16384, 32768))
+        huge = context_requirements(250000)
+        self.assertEqual((huge["min_context_window"], huge["recommended_context_window"]), (252928, 252928))
+
+    def test_histogram(self):
+        buckets = histogram([10, 100, 101, 5000], [100, 1000])
+        self.assertEqual(buckets, [("<=100", 2), ("<=1000", 1), (">1000", 1)])
+
+    def test_analyze_skill_counts_tool_schemas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            skill = Path(tmp) / "tier-2-tool-enhanced" / "pdf"
+            skill.mkdir(parents=True)
+            (skill / "system-prompt.md").write_text("word " * 3000)
+            tools = [{"type": "function", "function": {"name": "fill_form", "description": "Fill a PDF form"}}]
+            (skill / "tools-schema.json").write_text(json.dumps(tools, indent=2))
+            result = analyze_skill(skill, "chars")
+            self.assertEqual(result["system_prompt_tokens"], 3750)
+            self.assertGreater(result["tool_schema_tokens"], 0)
+            self.assertEqual(result["total_tokens"],
+                             result["system_prompt_tokens"] + result["tool_schema_tokens"])
+            self.assertEqual(result["min_context_window"], 8192)
+            self.assertEqual(result["overflows"], [2048, 4096])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Skill Tool Schema - Function-calling schemas extracted from skill scripts.
+
+Tier 2 skills ship Python scripts; convert.py describes them as OpenAI-style
+tools in tools-schema.json. This module parses each script with ``ast`` (it
+is never imported or run) and builds one tool per public module-level
+function and per public method of a public class (named ``Class_method``,
+since tool names can't contain dots), with a JSON-Schema ``parameters``
+object:
+
+- parameter names, required vs. optional (from defaults)
+- types from annotations (int, str, list[str], Optional[...], Literal[...],
+  ``X | None`` ...) or, failing that, from the default value
+- descriptions from the docstring summary and its ``Args:`` / ``:param:``
+  entries
+
+A function that configures argparse (typically ``main()``) becomes a tool
+named after the script, whose parameters are the command-line arguments:
+positionals are required, ``store_true`` flags are booleans, ``choices``
+become ``enum``, ``nargs``/``append`` become arrays, ``help`` becomes the
+description.
+
+Every script yields at least one tool: a script with no public functions
+becomes a parameterless tool named after it, and a script ``ast`` can't parse
+(e.g. Python 2) falls back to the names of the ``def``s found by a regex.
+
+Results are cached by script content hash (ToolSchemaCache), so reconverting
+a skill whose scripts did not change skips parsing them.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Bump when the extracted schemas change so cached results are discarded
+EXTRACTOR_VERSION = 3
+
+ANNOTATION_TYPES = {
+    'int': 'integer',
+    'float': 'number',
+    'complex': 'number',
+    'str': 'string',
+    'bytes': 'string',
+    'Path': 'string',
+    'PathLike': 'string',
+    'bool': 'boolean',
+    'list': 'array',
+    'List': 'array',
+    'tuple': 'array',
+    'Tuple': 'array',
+    'set': 'array',
+    'Set': 'array',
+    'frozenset': 'array',
+    'Sequence': 'array',
+    'Iterable': 'array',
+    'dict': 'object',
+    'Dict': 'object',
+    'Mapping': 'object',
+}
+
+# Fallback for scripts that don't parse: the names of their functions
+DEF_PATTERN = re.compile(r'^\s*(?:async\s+)?def\s+([A-Za-z]\w*)\s*\(', re.MULTILINE)
+
+DOCSTRING_ARGS_HEADER = re.compile(r'^\s*(Args|Arguments|Parameters)\s*:\s*$')
+DOCSTRING_ARG = re.compile(r'^\s*\*{0,2}(\w+)\s*(?:\([^)]*\))?\s*:\s*(.*)$')
+DOCSTRING_PARAM = re.compile(r'^\s*:param\s+(?:[\w\[\], ]+\s+)?(\w+)\s*:\s*(.*)$')
+
+
+def _name(node: ast.AST) -> str:
+    """Dotted-name tail of an annotation node ("typing.List" -> "List")."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ''
+
+
+def annotation_schema(node: Optional[ast.AST]) -> Dict[str, Any]:
+    """JSON-Schema fragment for a type annotation ({} when unknown)."""
+    if node is None:
+        return {}
+
+    if isinstance(node, ast.Constant):
+        if node.value is None:
+            return {'type': 'null'}
+        if isinstance(node.value, str):
+            # String annotation ("List[int]")
+            try:
+                return annotation_schema(ast.parse(node.value, mode='eval').body)
+            except SyntaxError:
+                return {}
+        return {}
+
+    # X | None, X | Y
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _union_schema([node.left, node.right])
+
+    if isinstance(node, ast.Subscript):
+        outer = _name(node.value)
+        args = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        if outer == 'Optional':
+            return annotation_schema(args[0])
+        if outer == 'Union':
+            return _union_schema(args)
+        if outer == 'Literal':
+            values = [a.value for a in args if isinstance(a, ast.Constant)]
+            schema: Dict[str, Any] = {'enum': values}
+            types = {_json_type(v) for v in values}
+            if len(types) == 1:
+                schema['type'] = types.pop()
+            return schema
+        base = ANNOTATION_TYPES.get(outer)
+        if base == 'array':
+            items = annotation_schema(args[0]) if args and outer not in ('tuple', 'Tuple') else {}
+            return {'type': 'array', 'items': items} if items else {'type': 'array'}
+        if base:
+            return {'type': base}
+        return {}
+
+    base = ANNOTATION_TYPES.get(_name(node))
+    return {'type': base} if base else {}
+
+
+def _union_schema(members: List[ast.AST]) -> Dict[str, Any]:
+    schemas = [annotation_schema(m) for m in members]
+    non_null = [s for s in schemas if s != {'type': 'null'}]
+    if len(non_null) == 1:
+        return non_null[0]
+    types = [s.get('type') for s in non_null]
+    if non_null and all(isinstance(t, str) for t in types):
+        return {'type': sorted(set(types))}
+    return {}
+
+
+def _json_type(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number'
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, (list, tuple)):
+        return 'array'
+    if isinstance(value, dict):
+        return 'object'
+    return None
+
+
+def _literal(node: ast.AST) -> Any:
+    """Value of a literal expression; raises ValueError for anything else."""
+    try:
+        return ast.literal_eval(node)
+    except (TypeError, SyntaxError, RecursionError) as e:
+        raise ValueError(str(e))
+
+
+def parse_docstring(docstring: Optional[str]) -> Dict[str, Any]:
+    """Split a docstring into a summary and per-parameter descriptions."""
+    if not docstring:
+        return {'summary': '', 'params': {}}
+
+    lines = docstring.strip().splitlines()
+    summary_lines = []
+    for line in lines:
+        if not line.strip() or DOCSTRING_ARGS_HEADER.match(line) or DOCSTRING_PARAM.match(line):
+            break
+        summary_lines.append(line.strip())
+
+    params: Dict[str, str] = {}
+    in_args = False
+    current = None
+    arg_indent = 0
+    for line in lines:
+        param = DOCSTRING_PARAM.match(line)
+        if param:
+            current = param.group(1)
+            params[current] = param.group(2).strip()
+            continue
+        if DOCSTRING_ARGS_HEADER.match(line):
+            in_args, current = True, None
+            continue
+        if in_args:
+            if not line.strip():
+                current = None
+                continue
+            if re.match(r'^\s*\w[\w ]*:\s*$', line):
+                in_args = False  # Next section (Returns:, Raises:, ...)
+                continue
+            arg = DOCSTRING_ARG.match(line)
+            if arg and (current is None or len(line) - len(line.lstrip()) <= arg_indent):
+                current = arg.group(1)
+                arg_indent = len(line) - len(line.lstrip())
+                params[current] = arg.group(2).strip()
+            elif current:
+                params[current] = f"{params[current]} {line.strip()}".strip()
+
+    return {'summary': ' '.join(summary_lines), 'params': params}
+
+
+def function_parameters(func: ast.FunctionDef) -> Dict[str, Any]:
+    """JSON-Schema object for a function's parameters."""
+    docs = parse_docstring(ast.get_docstring(func))['params']
+    args = func.args
+    properties: Dict[str, Dict] = {}
+    required: List[str] = []
+
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    params = list(zip(positional, defaults)) + list(zip(args.kwonlyargs, args.kw_defaults))
+
+    for arg, default in params:
+        if arg.arg in ('self', 'cls'):
+            continue
+        schema = annotation_schema(arg.annotation)
+        if default is None:
+            required.append(arg.arg)
+        else:
+            try:
+                value = _literal(default)
+            except ValueError:
+                pass  # Computed default: optional, but nothing to record
+            else:
+                value_type = _json_type(value)
+                if value_type and 'type' not in schema:
+                    schema['type'] = value_type
+                if value_type or value is None:
+                    schema['default'] = value
+        if arg.arg in docs:
+            schema['description'] = docs[arg.arg]
+        properties[arg.arg] = schema
+
+    return {'type': 'object', 'properties': properties, 'required': required}
+
+
+def _add_argument_calls(node: ast.AST) -> List[ast.Call]:
+    """``*.add_argument(...)`` calls directly under ``node`` (not in nested defs)."""
+    calls = []
+    stack = list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        if (
+            isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Attribute)
+            and child.func.attr == 'add_argument'
+        ):
+            calls.append(child)
+        stack.extend(ast.iter_child_nodes(child))
+    return sorted(calls, key=lambda c: (c.lineno, c.col_offset))
+
+
+def _parser_description(node: ast.AST) -> str:
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call) and _name(child.func) == 'ArgumentParser':
+            for keyword in child.keywords:
+                if keyword.arg == 'description':
+                    try:
+                        return str(_literal(keyword.value)).strip()
+                    except ValueError:
+                        return ''
+    return ''
+
+
+def argparse_parameters(calls: List[ast.Call]) -> Dict[str, Any]:
+    """JSON-Schema object for a list of ``add_argument`` calls."""
+    properties: Dict[str, Dict] = {}
+    required: List[str] = []
+
+    for call in calls:
+        flags = []
+        for arg in call.args:
+            try:
+                flags.append(str(_literal(arg)))
+            except ValueError:
+                pass
+        if not flags:
+            continue
+        options: Dict[str, Any] = {}
+        for keyword in call.keywords:
+            if keyword.arg is None:
+                continue
+            try:
+                options[keyword.arg] = _literal(keyword.value)
+            except ValueError:
+                # Non-literal (type=int, type=Path, nargs=argparse.REMAINDER ...)
+                options[keyword.arg] = _name(keyword.value) or None
+
+        positional = not flags[0].startswith('-')
+        if 'dest' in options and isinstance(options['dest'], str):
+            name = options['dest']
+        elif positional:
+            name = flags[0]
+        else:
+            long_flags = [f for f in flags if f.startswith('--')]
+            name = (long_flags[0] if long_flags else flags[0]).lstrip('-')
+        name = name.replace('-', '_')
+        if name == 'help':
+            continue
+
+        action = options.get('action')
+        if action in ('help', 'version'):
+            continue
+
+        schema: Dict[str, Any] = {}
+        if action in ('store_true', 'store_false'):
+            schema['type'] = 'boolean'
+        elif action == 'count':
+            schema['type'] = 'integer'
+        else:
+            item_type = ANNOTATION_TYPES.get(options.get('type') or 'str', 'string')
+            if item_type not in ('string', 'integer', 'number', 'boolean'):
+                item_type = 'string'
+            item: Dict[str, Any] = {'type': item_type}
+            if isinstance(options.get('choices'), (list, tuple)):
+                item['enum'] = list(options['choices'])
+            nargs = options.get('nargs')
+            if action in ('append', 'extend') or nargs in ('*', '+', 'REMAINDER') or isinstance(nargs, int) and nargs > 1:
+                schema = {'type': 'array', 'items': item}
+            else:
+                schema = item
+
+        if 'default' in options and options['default'] is not None and _json_type(options['default']):
+            schema['default'] = options['default']
+        help_text = options.get('help')
+        if isinstance(help_text, str) and help_text.strip():
+            schema['description'] = help_text.strip()
+
+        properties[name] = schema
+        is_required = options.get('required') is True or (
+            positional and options.get('nargs') not in ('?', '*', 'REMAINDER')
+        )
+        if is_required:
+            required.append(name)
+
+    return {'type': 'object', 'properties': properties, 'required': required}
+
+
+def _tool(name: str, description: str, parameters: Dict) -> Dict:
+    return {
+        'type': 'function',
+        'function': {
+            'name': name,
+            'description': description,
+            'parameters': parameters,
+        },
+    }
+
+
+def _no_parameters() -> Dict:
+    return {'type': 'object', 'properties': {}, 'required': []}
+
+
+def script_tool(script_name: str, description: str = '') -> Dict:
+    """A parameterless tool that runs a whole script."""
+    stem = Path(script_name).stem.replace('-', '_')
+    return _tool(stem, description or f"Run {script_name}", _no_parameters())
+
+
+def _is_property(node: ast.FunctionDef) -> bool:
+    return any(_name(d) in ('property', 'cached_property', 'setter', 'getter', 'deleter')
+               for d in node.decorator_list)
+
+
+def _method_tools(node: ast.ClassDef, script_name: str) -> List[Dict]:
+    """Tools for the public methods of a class (self and cls are not parameters)."""
+    tools = []
+    for method in node.body:
+        if (not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef))
+                or method.name.startswith('_') or _is_property(method)):
+            continue
+        summary = parse_docstring(ast.get_docstring(method))['summary']
+        description = summary or f"{node.name} method from {script_name}"
+        tools.append(_tool(f"{node.name}_{method.name}", description, function_parameters(method)))
+    return tools
+
+
+def extract_tools(source: str, script_name: str) -> List[Dict]:
+    """Tool definitions for one script's source (see module docstring)."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        names = [name for name in dict.fromkeys(DEF_PATTERN.findall(source)) if not name.startswith('_')]
+        tools = [_tool(name, f"Function from {script_name}", _no_parameters()) for name in names]
+        return tools or [script_tool(script_name)]
+
+    module_doc = parse_docstring(ast.get_docstring(tree))['summary']
+    stem = Path(script_name).stem.replace('-', '_')
+    tools = []
+    cli_found = False
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+            tools.extend(_method_tools(node, script_name))
+            continue
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) or node.name.startswith('_'):
+            continue
+        summary = parse_docstring(ast.get_docstring(node))['summary']
+        calls = _add_argument_calls(node)
+        if calls and not (node.args.args or node.args.kwonlyargs):
+            # Command-line entry point: describe the CLI, not main()
+            cli_found = True
+            description = _parser_description(node) or summary or module_doc
+            tools.append(_tool(stem, description or f"Run {script_name}", argparse_parameters(calls)))
+            continue
+        description = summary or f"Function from {script_name}"
+        tools.append(_tool(node.name, description, function_parameters(node)))
+
+    if not cli_found:
+        # Parsers built at module level (e.g. under ``if __name__ == '__main__':``)
+        calls = _add_argument_calls(tree)
+        if calls:
+            description = _parser_description(tree) or module_doc or f"Run {script_name}"
+            tools.append(_tool(stem, description, argparse_parameters(calls)))
+
+    return tools or [script_tool(script_name, module_doc)]
+
+
+class ToolSchemaCache:
+    """Extracted tools keyed by script content hash, persisted as JSON."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: Dict[str, List[Dict]] = {}
+        self.recent: Dict[str, List[Dict]] = {}
+        self.used: Set[str] = set()
+        self.stats = {'hits': 0, 'misses': 0}
+        if path is not None and path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == EXTRACTOR_VERSION:
+                    self.entries = data.get('scripts', {})
+            except (OSError, json.JSONDecodeError):
+                pass
+
+    def tools_for(self, script_file: Path) -> List[Dict]:
+        """Tools for a script, from the cache when its content is unchanged."""
+        source = script_file.read_bytes()
+        # Tool names and fallback descriptions use the file name, so hash it too
+        key = hashlib.sha256(script_file.name.encode('utf-8') + b'\0' + source).hexdigest()
+        self.used.add(key)
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.stats['hits'] += 1
+            self.recent[key] = cached
+            return cached
+        self.stats['misses'] += 1
+        tools = extract_tools(source.decode('utf-8', errors='replace'), script_file.name)
+        self.entries[key] = self.recent[key] = tools
+        return tools
+
+    def take_recent(self) -> Dict[str, List[Dict]]:
+        """Entries looked up since the last call, for merging into another cache."""
+        recent, self.recent = self.recent, {}
+        return recent
+
+    def merge(self, entries: Dict[str, List[Dict]]):
+        """Add entries computed elsewhere (e.g. in a worker process)."""
+        self.entries.update(entries)
+        self.used.update(entries)
+
+    def save(self, prune: bool = False):
+        """Atomically write the cache; ``prune`` drops entries unused this run."""
+        if self.path is None:
+            return
+        if prune:
+            self.entries = {k: v for k, v in self.entries.items() if k in self.used}
+        # Only the script hashes are sorted: schemas keep their key and parameter
+        # order, so cached tools render exactly like freshly extracted ones
+        scripts = dict(sorted(self.entries.items()))
+        data = json.dumps({'version': EXTRACTOR_VERSION, 'scripts': scripts}, indent=1) + '\n'
+        try:
+            if self.path.read_text(encoding='utf-8') == data:
+                return
+        except OSError:
+            pass
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(data, encoding='utf-8')
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,144 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from skill_tool_schema import ToolSchemaCache, extract_tools, parse_docstring
+
+SCRIPT = '''
+"""Resize images."""
+import argparse
+from typing import List, Literal, Optional
+
+
+def resize(path: str, width: int, height: Optional[int] = None,
+           mode: Literal["fit", "fill"] = "fit", *, quality=85) -> None:
+    """Resize one image.
+
+    Args:
+        path: Image to resize
+        width: Target width in pixels,
+            keeping the aspect ratio
+    """
+
+
+def batch(paths: List[str], scale=0.5):
+    """Resize several images.
+
+    :param paths: Images to resize
+    """
+
+
+def _helper(x):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resize images from the command line")
+    parser.add_argument("images", nargs="+", help="Input files")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--format", choices=["png", "jpg"])
+    parser.add_argument("--verbose", "-v", action="store_true")
+    args = parser.parse_args()
+'''
+
+
+def tool(tools, name):
+    return next(t["function"] for t in tools if t["function"]["name"] == name)
+
+
+class TestToolSchema(unittest.TestCase):
+
+    def test_function_signature(self):
+        """Annotations, defaults and docstrings become JSON Schema"""
+        resize = tool(extract_tools(SCRIPT, "resize-image.py"), "resize")
+        self.assertEqual(resize["description"], "Resize one image.")
+        params = resize["parameters"]
+        self.assertEqual(params["required"], ["path", "width"])
+        self.assertEqual(params["properties"]["width"], {
+            "type": "integer", "description": "Target width in pixels, keeping the aspect ratio"})
+        self.assertEqual(params["properties"]["height"], {"type": "integer", "default": None})
+        self.assertEqual(params["properties"]["mode"], {"enum": ["fit", "fill"], "type": "string", "default": "fit"})
+        self.assertEqual(params["properties"]["quality"], {"type": "integer", "default": 85})
+
+        batch = tool(extract_tools(SCRIPT, "resize-image.py"), "batch")
+        self.assertEqual(batch["parameters"]["properties"]["paths"],
+                         {"type": "array", "items": {"type": "string"}, "description": "Images to resize"})
+        self.assertEqual(batch["parameters"]["properties"]["scale"], {"type": "number", "default": 0.5})
+
+    def test_argparse_cli(self):
+        """main() with argparse becomes a tool named after the script"""
+        tools = extract_tools(SCRIPT, "resize-image.py")
+        self.assertEqual([t["function"]["name"] for t in tools], ["resize", "batch", "resize_image"])
+        cli = tool(tools, "resize_image")
+        self.assertEqual(cli["description"], "Resize images from the command line")
+        self.assertEqual(cli["parameters"]["required"], ["images"])
+        properties = cli["parameters"]["properties"]
+        self.assertEqual(properties["images"], {"type": "array", "items": {"type": "string"}, "description": "Input files"})
+        self.assertEqual(properties["width"], {"type": "integer", "default": 800})
+        self.assertEqual(properties["format"], {"type": "string", "enum": ["png", "jpg"]})
+        self.assertEqual(properties["verbose"], {"type": "boolean"})
+
+    def test_docstring_sections(self):
+        """Sections after Args: are not parameter descriptions"""
+        parsed = parse_docstring("Do it.\n\nArgs:\n    x: the x\n\nReturns:\n    y: not a param\n")
+        self.assertEqual(parsed, {"summary": "Do it.", "params": {"x": "the x"}})
+
+    def test_class_methods(self):
+        """Public methods of public classes become Class_method tools"""
+        source = (
+            "class Document:\n"
+            "    def __init__(self, path): ...\n"
+            "    @property\n"
+            "    def body(self): ...\n"
+            "    def add_comment(self, text: str, author='Claude'):\n"
+            "        \"\"\"Add a comment.\"\"\"\n"
+            "        def helper(): ...\n"
+            "    @classmethod\n"
+            "    def open(cls, path: str): ...\n"
+            "    def _private(self): ...\n"
+            "class _Hidden:\n"
+            "    def run(self): ...\n"
+        )
+        tools = extract_tools(source, "document.py")
+        self.assertEqual([t["function"]["name"] for t in tools], ["Document_add_comment", "Document_open"])
+        add_comment = tool(tools, "Document_add_comment")
+        self.assertEqual(add_comment["description"], "Add a comment.")
+        self.assertEqual(add_comment["parameters"]["required"], ["text"])
+        self.assertEqual(list(tool(tools, "Document_open")["parameters"]["properties"]), ["path"])
+
+    def test_never_empty(self):
+        """Scripts without functions, or that don't parse, still yield tools"""
+        self.assertEqual(extract_tools('"""Print a report."""\nprint(1)\n', "make-report.py"), [{
+            "type": "function",
+            "function": {"name": "make_report", "description": "Print a report.",
+                         "parameters": {"type": "object", "properties": {}, "required": []}},
+        }])
+        broken = extract_tools("def convert(x):\n    print 'py2'\ndef _helper(): pass\n", "old.py")
+        self.assertEqual([t["function"]["name"] for t in broken], ["convert"])
+        self.assertEqual([t["function"]["name"] for t in extract_tools("def broken(:\n", "broken.py")], ["broken"])
+
+    def test_cache(self):
+        """Unchanged scripts are served from the persisted cache"""
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "resize-image.py"
+            script.write_text(SCRIPT)
+            cache_path = Path(tmp) / "cache.json"
+
+            cache = ToolSchemaCache(cache_path)
+            tools = cache.tools_for(script)
+            cache.save()
+            self.assertEqual(cache.stats, {"hits": 0, "misses": 1})
+
+            cache = ToolSchemaCache(cache_path)
+            self.assertEqual(cache.tools_for(script), tools)
+            self.assertEqual(cache.stats, {"hits": 1, "misses": 0})
+
+            script.write_text(SCRIPT.replace("Resize one image.", "Scale one image."))
+            cache = ToolSchemaCache(cache_path)
+            self.assertEqual(tool(cache.tools_for(script), "resize")["description"], "Scale one image.")
+            cache.save(prune=True)
+            self.assertEqual(len(ToolSchemaCache(cache_path).entries), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
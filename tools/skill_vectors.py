@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Skill Vectors - Offline semantic search with a hashed TF-IDF + SVD encoder.
+
+Every skill is embedded once at index time: its text is turned into hashed
+word, word-bigram and character n-gram features, weighted with TF-IDF, and
+projected onto the top singular vectors of the catalogue (latent semantic
+analysis). The resulting unit vectors are saved as a NumPy matrix in
+SKILL-INDEX.vectors.npz next to SKILL-INDEX.json, together with the IDF
+weights and projection needed to encode queries.
+
+A query is answered with one matrix-vector product and an argpartition, so
+semantic ranking takes milliseconds on a CPU with no network and no GPU.
+
+Requires numpy (``pip install numpy``); callers should check
+NUMPY_AVAILABLE and fall back to keyword search without it.
+"""
+
+import hashlib
+import math
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from skill_search import tokenize
+
+ENCODER_VERSION = 1
+
+# Hashed feature space and number of latent dimensions kept from the SVD
+HASH_DIM = 1 << 13
+LATENT_DIM = 128
+
+# Character n-gram size for typo-tolerant matching ("slak" ~ "slack")
+CHAR_NGRAM = 4
+
+# How often each field's text is repeated when embedding a skill
+FIELD_REPEATS = {
+    'name': 3,
+    'tags': 2,
+    'category': 1,
+    'description': 1,
+}
+
+
+def vectors_path(index_path: str) -> str:
+    """Return the vectors file path that sits next to a JSON index."""
+    path = Path(index_path)
+    return str(path.with_name(f"{path.stem}.vectors.npz"))
+
+
+def _features(text: str) -> List[str]:
+    """Word, word-bigram and character n-gram features of a text."""
+    tokens = tokenize(text)
+    features = list(tokens)
+    features.extend(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    for token in tokens:
+        padded = f"#{token}#"
+        if len(padded) > CHAR_NGRAM:
+            features.extend(
+                '~' + padded[i:i + CHAR_NGRAM]
+                for i in range(len(padded) - CHAR_NGRAM + 1)
+            )
+    return features
+
+
+def _hash_counts(text: str) -> Dict[int, float]:
+    """Signed hashed feature counts (the sign bit halves collision bias)."""
+    counts: Dict[int, float] = {}
+    for feature in _features(text):
+        h = zlib.crc32(feature.encode('utf-8'))
+        bucket = h % HASH_DIM
+        sign = 1.0 if (h >> 31) & 1 == 0 else -1.0
+        counts[bucket] = counts.get(bucket, 0.0) + sign
+    return counts
+
+
+def skill_text(skill: Dict) -> str:
+    """The text a skill is embedded from, with per-field repetition."""
+    parts = []
+    for field, repeats in FIELD_REPEATS.items():
+        value = skill.get(field) or ''
+        if field == 'name':
+            value = f"{value} {skill.get('path', '')}"
+        elif isinstance(value, list):
+            value = ' '.join(str(v) for v in value)
+        parts.extend([str(value)] * repeats)
+    return '\n'.join(parts)
+
+
+def _tfidf_rows(texts: Sequence[str], idf=None):
+    """Hashed, sublinear-TF, L2-normalized TF-IDF matrix (and the IDF used)."""
+    counts = [_hash_counts(text) for text in texts]
+
+    if idf is None:
+        df = np.zeros(HASH_DIM, dtype=np.float64)
+        for row in counts:
+            for bucket in row:
+                df[bucket] += 1
+        idf = np.log((1.0 + len(texts)) / (1.0 + df)) + 1.0
+
+    matrix = np.zeros((len(texts), HASH_DIM), dtype=np.float32)
+    for i, row in enumerate(counts):
+        for bucket, count in row.items():
+            tf = math.copysign(1.0 + math.log(abs(count)), count) if count else 0.0
+            matrix[i, bucket] = tf * idf[bucket]
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms, idf
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+class SkillVectorIndex:
+    """Unit skill vectors plus the encoder state needed to embed queries."""
+
+    def __init__(self, vectors, projection, idf, skill_paths: Sequence[str],
+                 source_size: int = 0, source_digest: str = ''):
+        self.vectors = vectors
+        self.projection = projection
+        self.idf = idf
+        self.skill_paths = list(skill_paths)
+        self.source_size = source_size
+        self.source_digest = source_digest
+
+    @classmethod
+    def build(cls, skills: Sequence[Dict], latent_dim: int = LATENT_DIM,
+              source_path: Optional[str] = None) -> 'SkillVectorIndex':
+        """Embed every skill: TF-IDF, then a truncated SVD of the catalogue.
+
+        The SVD goes through the n x n Gram matrix, which is far smaller than
+        the hashed feature space for catalogues of a few thousand skills.
+        """
+        tfidf, idf = _tfidf_rows([skill_text(skill) for skill in skills])
+
+        gram = tfidf.astype(np.float64) @ tfidf.T.astype(np.float64)
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        order = np.argsort(eigenvalues)[::-1][:min(latent_dim, len(skills))]
+        eigenvalues = np.clip(eigenvalues[order], 1e-12, None)
+        singular = np.sqrt(eigenvalues)
+        left = eigenvectors[:, order]
+
+        # V_k = X^T U_k S_k^-1 projects hashed TF-IDF vectors into latent space
+        projection = (tfidf.T.astype(np.float64) @ left / singular).astype(np.float32)
+        vectors = _normalize_rows(left * singular)
+
+        source_size, source_digest = 0, ''
+        if source_path and os.path.exists(source_path):
+            source_size = os.path.getsize(source_path)
+            source_digest = hashlib.sha256(Path(source_path).read_bytes()).hexdigest()
+
+        return cls(vectors, projection, idf.astype(np.float32),
+                   [skill.get('path', '') for skill in skills],
+                   source_size, source_digest)
+
+    def save(self, path: str):
+        """Write the vectors and encoder state to an .npz file."""
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            vectors=self.vectors,
+            projection=self.projection,
+            idf=self.idf,
+            skill_paths=np.array(self.skill_paths),
+            source=np.array([str(self.source_size), self.source_digest]),
+            version=np.array([ENCODER_VERSION, HASH_DIM]),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillVectorIndex':
+        """Load vectors written by save(); raises ValueError on a version mismatch."""
+        with np.load(path, allow_pickle=False) as data:
+            version, hash_dim = (int(v) for v in data['version'])
+            if version != ENCODER_VERSION or hash_dim != HASH_DIM:
+                raise ValueError(f"{path} was built by a different encoder version")
+            source_size, source_digest = (str(v) for v in data['source'])
+            return cls(data['vectors'], data['projection'], data['idf'],
+                       [str(p) for p in data['skill_paths']],
+                       int(source_size), source_digest)
+
+    def is_fresh(self, source_path: str) -> bool:
+        """True if built from the JSON index currently at ``source_path``."""
+        try:
+            if os.path.getsize(source_path) != self.source_size:
+                return False
+            return hashlib.sha256(Path(source_path).read_bytes()).hexdigest() == self.source_digest
+        except OSError:
+            return True
+
+    def encode(self, query: str):
+        """Embed a query into the latent space as a unit vector."""
+        tfidf, _ = _tfidf_rows([query], idf=self.idf)
+        return _normalize_rows(tfidf @ self.projection)[0]
+
+    def search_ids(self, query: str, top_k: int = 5,
+                   min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """Return (skill id, cosine similarity) pairs, best first."""
+        query_vector = self.encode(query)
+        if not query_vector.any():
+            return []
+        scores = self.vectors @ query_vector
+        top_k = min(top_k, len(scores))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(int(i), float(scores[i])) for i in ranked if scores[i] > min_score]
+
+
+def open_vector_index(index_path: str, skills: Sequence[Dict]) -> Optional[SkillVectorIndex]:
+    """Load the vectors next to ``index_path``, rebuilding in memory if stale.
+
+    Returns None when numpy is not installed.
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    path = vectors_path(index_path)
+    if os.path.exists(path):
+        try:
+            vector_index = SkillVectorIndex.load(path)
+        except (ValueError, KeyError, OSError):
+            vector_index = None
+        if (
+            vector_index is not None
+            and vector_index.is_fresh(index_path)
+            and len(vector_index.skill_paths) == len(skills)
+        ):
+            return vector_index
+    return SkillVectorIndex.build(skills)
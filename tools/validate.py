@@ -3,17 +3,32 @@
 Universal Skills Validator
 
 Validates that converted skills meet the universal format requirements.
+
+Each skill directory is validated independently (across worker processes
+for large runs) into a per-skill result, which can be reported as text,
+JSON or JUnit XML. ``--changed-since`` limits a run to the skill
+directories touched since a git ref.
 """
 
 import os
+import sys
 import json
 import yaml
 import argparse
+import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+from skill_pool import map_in_processes
+from skill_rewrite import VALIDATOR_WARNING, claude_language
 
 REPO_ROOT = Path(__file__).parent.parent
 UNIVERSAL_DIR = REPO_ROOT / "universal"
+TIER_DIRS = ["tier-1-instruction-only", "tier-2-tool-enhanced", "tier-3-claude-only"]
+
+# Changes to these files can change any skill's result
+VALIDATOR_SOURCES = ["tools/validate.py", "tools/skill_rewrite.py"]
 
 
 class SkillValidator:
@@ -23,6 +38,8 @@ class SkillValidator:
         self.errors = []
         self.warnings = []
         self.passed = []
+        # Per-skill results from validate_many
+        self.results = []
     
     def validate_tier1_skill(self, skill_dir: Path, skip_tier_check: bool = False) -> bool:
         """Validate a Tier 1 skill directory"""
@@ -47,17 +64,13 @@ class SkillValidator:
             with open(skill_dir / "system-prompt.md", 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Check for Claude-specific language
-            claude_patterns = [
-                ("Claude should", "Use 'The assistant should' instead"),
-                ("claude.ai", "Use 'your AI interface' instead"),
-                ("Claude Code", "Use 'your development environment' instead"),
-            ]
-            
-            for pattern, suggestion in claude_patterns:
-                if pattern.lower() in content.lower():
+            # Check for Claude-specific language (one pass with the converter's rules)
+            matches = claude_language.scan(content)
+            for rule in claude_language.rules_tagged(VALIDATOR_WARNING):
+                if matches[rule.name]:
                     self.warnings.append(
-                        f"{skill_name}/system-prompt.md: Contains '{pattern}'. {suggestion}"
+                        f"{skill_name}/system-prompt.md: Contains '{rule.label}'. "
+                        f"Use '{rule.replacement}' instead"
                     )
             
             # Check minimum length
@@ -259,27 +272,44 @@ class SkillValidator:
             self.errors.append(f"{skill_dir}: Unknown tier directory: {parent}")
             return False
     
-    def validate_all(self):
-        """Validate all skills in the universal directory"""
+    def validate_many(self, skill_dirs: List[Path], jobs: Optional[int] = None) -> List[Dict]:
+        """Validate skill directories across ``jobs`` processes (None = all cores)
+        
+        Returns one result per skill, in path order (see validate_skill), and
+        adds every result to the passed/warnings/errors lists.
+        """
+        results = map_in_processes(validate_skill, sorted(skill_dirs), jobs)
+        for result in results:
+            self.results.append(result)
+            self.warnings.extend(result["warnings"])
+            self.errors.extend(result["errors"])
+            if result["valid"]:
+                self.passed.append(f"{result['name']} (Tier {result['tier']})")
+        return results
+    
+    def validate_all(self, jobs: Optional[int] = None, skill_dirs: Optional[List[Path]] = None,
+                     report: str = "text", output: Optional[str] = None):
+        """Validate all skills (or just ``skill_dirs``) and print a report"""
         if not UNIVERSAL_DIR.exists():
             print("Error: universal/ directory does not exist")
             return False
         
-        # Find all skill directories
-        skill_dirs = []
-        for tier_dir in ["tier-1-instruction-only", "tier-2-tool-enhanced", "tier-3-claude-only"]:
-            tier_path = UNIVERSAL_DIR / tier_dir
-            if tier_path.exists():
-                skill_dirs.extend([d for d in tier_path.iterdir() if d.is_dir()])
+        changed_only = skill_dirs is not None
+        if skill_dirs is None:
+            skill_dirs = find_skill_dirs()
+        
+        if report != "text":
+            self.validate_many(skill_dirs, jobs)
+            write_report(self.results, report, output)
+            return len(self.errors) == 0
         
         if not skill_dirs:
-            print("No skills found in universal/ directory")
+            print("No changed skills to validate" if changed_only else "No skills found in universal/ directory")
             return True
         
         print(f"Validating {len(skill_dirs)} skills...\n")
         
-        for skill_dir in sorted(skill_dirs):
-            self.validate_skill_dir(skill_dir)
+        self.validate_many(skill_dirs, jobs)
         
         # Print results
         print("=" * 60)
@@ -308,6 +338,110 @@ class SkillValidator:
         return len(self.errors) == 0
 
 
+def find_skill_dirs(universal_dir: Path = UNIVERSAL_DIR) -> List[Path]:
+    """Every skill directory in the universal tree"""
+    skill_dirs = []
+    for tier_dir in TIER_DIRS:
+        tier_path = universal_dir / tier_dir
+        if tier_path.exists():
+            skill_dirs.extend([d for d in tier_path.iterdir() if d.is_dir()])
+    return sorted(skill_dirs)
+
+
+def changed_skill_dirs(ref: str, repo_root: Path = REPO_ROOT) -> List[Path]:
+    """Skill directories with files changed since ``ref`` (committed or not)
+    
+    Untracked files count as changes; deleted skills are left out. A change
+    to the validator itself means every skill is returned.
+    """
+    def git(*args) -> List[str]:
+        result = subprocess.run(["git", *args], cwd=repo_root, capture_output=True,
+                                text=True, check=True)
+        return [line for line in result.stdout.splitlines() if line]
+    
+    changed = git("diff", "--name-only", ref, "--") + git("ls-files", "--others", "--exclude-standard")
+    universal_dir = repo_root / "universal"
+    if any(path in VALIDATOR_SOURCES for path in changed):
+        return find_skill_dirs(universal_dir)
+    
+    skill_dirs = set()
+    for path in changed:
+        parts = path.split("/")
+        if len(parts) >= 4 and parts[0] == "universal" and parts[1] in TIER_DIRS:
+            skill_dir = universal_dir / parts[1] / parts[2]
+            if skill_dir.is_dir():
+                skill_dirs.add(skill_dir)
+    return sorted(skill_dirs)
+
+
+def validate_skill(skill_dir: Path) -> Dict:
+    """Validate one skill directory with its own validator (process-pool entry point)
+    
+    Returns ``{"skill", "name", "tier", "valid", "errors", "warnings"}``. An
+    unexpected exception is reported as an error of that skill only.
+    """
+    tier = TIER_DIRS.index(skill_dir.parent.name) + 1 if skill_dir.parent.name in TIER_DIRS else None
+    validator = SkillValidator()
+    try:
+        valid = validator.validate_skill_dir(skill_dir)
+    except Exception as e:
+        validator.errors.append(f"{skill_dir.name}: Validation failed: {e}")
+        valid = False
+    return {
+        "skill": f"{skill_dir.parent.name}/{skill_dir.name}",
+        "name": skill_dir.name,
+        "tier": tier,
+        "valid": valid,
+        "errors": validator.errors,
+        "warnings": validator.warnings
+    }
+
+
+def json_report(results: List[Dict]) -> str:
+    return json.dumps({
+        "summary": {
+            "skills": len(results),
+            "passed": sum(1 for r in results if r["valid"]),
+            "failed": sum(1 for r in results if not r["valid"]),
+            "warnings": sum(len(r["warnings"]) for r in results),
+            "errors": sum(len(r["errors"]) for r in results)
+        },
+        "skills": results
+    }, indent=2, ensure_ascii=False)
+
+
+def junit_report(results: List[Dict]) -> str:
+    """One testcase per skill; errors are failures, warnings go to system-out"""
+    suites = ET.Element("testsuites", name="universal-skills")
+    for tier_dir in TIER_DIRS:
+        tier_results = [r for r in results if r["skill"].startswith(tier_dir + "/")]
+        if not tier_results:
+            continue
+        suite = ET.SubElement(suites, "testsuite", name=tier_dir, tests=str(len(tier_results)),
+                              failures=str(sum(1 for r in tier_results if not r["valid"])),
+                              errors="0", skipped="0")
+        for result in tier_results:
+            case = ET.SubElement(suite, "testcase", classname=tier_dir, name=result["name"])
+            if not result["valid"]:
+                failure = ET.SubElement(case, "failure",
+                                        message=f"{len(result['errors'])} error(s)")
+                failure.text = "\n".join(result["errors"])
+            if result["warnings"]:
+                ET.SubElement(case, "system-out").text = "\n".join(result["warnings"])
+    ET.indent(suites)
+    return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(suites, encoding="unicode")
+
+
+def write_report(results: List[Dict], report: str, output: Optional[str] = None):
+    """Write a JSON or JUnit report to ``output`` (stdout if None)"""
+    content = (json_report if report == "json" else junit_report)(results) + "\n"
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(content)
+    else:
+        sys.stdout.write(content)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate universal skills format"
@@ -322,6 +456,27 @@ def main():
         action="store_true",
         help="Validate all skills"
     )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help="Only validate skill directories changed since a git ref (e.g. origin/main)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: all cores, 1 = sequential)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "junit"],
+        default="text",
+        help="Report format for --all / --changed-since (default: text)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Write the JSON or JUnit report to a file instead of stdout"
+    )
     
     args = parser.parse_args()
     
@@ -346,9 +501,17 @@ def main():
         
         return 0 if success else 1
     
-    elif args.all:
-        # Validate all skills
-        success = validator.validate_all()
+    elif args.all or args.changed_since:
+        skill_dirs = None
+        if args.changed_since:
+            try:
+                skill_dirs = changed_skill_dirs(args.changed_since)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"Error: Cannot list changes since {args.changed_since}: "
+                      f"{(getattr(e, 'stderr', '') or str(e)).strip()}", file=sys.stderr)
+                return 1
+        success = validator.validate_all(jobs=args.jobs, skill_dirs=skill_dirs,
+                                         report=args.format, output=args.output)
         return 0 if success else 1
     
     else:
@@ -0,0 +1,82 @@
+import json
+import subprocess
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from validate import SkillValidator, changed_skill_dirs, json_report, junit_report, validate_skill
+
+PROMPT = "Follow these steps to brainstorm names. " * 10
+
+
+def write_tier1(skill_dir, prompt=PROMPT, tier=1):
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "system-prompt.md").write_text(prompt)
+    (skill_dir / "metadata.yaml").write_text(f"name: {skill_dir.name}\ndescription: test\ntier: {tier}\n")
+    (skill_dir / "api-example.json").write_text(json.dumps({
+        "model": "gpt-4", "messages": [{"role": "system"}, {"role": "user"}]}))
+
+
+class TestValidate(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.universal = Path(self.tmp.name) / "universal"
+        self.tier1 = self.universal / "tier-1-instruction-only"
+        write_tier1(self.tier1 / "good")
+        write_tier1(self.tier1 / "chatty", prompt=PROMPT + "Claude should help.")
+        write_tier1(self.tier1 / "wrong-tier", tier=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_per_skill_results(self):
+        """Each skill gets its own result; totals are aggregated"""
+        validator = SkillValidator()
+        results = validator.validate_many(list(self.tier1.iterdir()), jobs=1)
+        self.assertEqual([r["name"] for r in results], ["chatty", "good", "wrong-tier"])
+        self.assertEqual([r["valid"] for r in results], [True, True, False])
+        self.assertEqual(len(results[0]["warnings"]), 1)
+        self.assertIn("Tier should be 1, got 2", results[2]["errors"][0])
+        self.assertEqual(validator.passed, ["chatty (Tier 1)", "good (Tier 1)"])
+        self.assertEqual(len(validator.errors), 1)
+
+    def test_crash_is_isolated(self):
+        """A file that breaks the checks fails only its skill"""
+        (self.tier1 / "good" / "metadata.yaml").write_text("")
+        result = validate_skill(self.tier1 / "good")
+        self.assertFalse(result["valid"])
+        self.assertIn("Validation failed", result["errors"][0])
+
+    def test_reports(self):
+        """JSON and JUnit reports describe every skill"""
+        results = [validate_skill(d) for d in sorted(self.tier1.iterdir())]
+        summary = json.loads(json_report(results))["summary"]
+        self.assertEqual((summary["skills"], summary["failed"], summary["warnings"]), (3, 1, 1))
+
+        suite = ET.fromstring(junit_report(results)).find("testsuite")
+        self.assertEqual((suite.get("tests"), suite.get("failures")), ("3", "1"))
+        failed = [case.get("name") for case in suite.iter("testcase") if case.find("failure") is not None]
+        self.assertEqual(failed, ["wrong-tier"])
+
+    def test_changed_since(self):
+        """Only skill directories touched since the ref are selected"""
+        root = Path(self.tmp.name)
+
+        def git(*args):
+            subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                           cwd=root, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("add", ".")
+        git("commit", "-q", "-m", "base")
+        self.assertEqual(changed_skill_dirs("HEAD", root), [])
+
+        (self.tier1 / "good" / "system-prompt.md").write_text(PROMPT + "Updated.")
+        write_tier1(self.tier1 / "new")
+        self.assertEqual([d.name for d in changed_skill_dirs("HEAD", root)], ["good", "new"])
+
+
+if __name__ == "__main__":
+    unittest.main()